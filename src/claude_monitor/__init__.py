@@ -1,5 +1,12 @@
 """Claude Monitor - Real-time token usage monitoring for Claude AI"""
 
-from claude_monitor._version import __version__
-
 __all__ = ["__version__"]
+
+
+def __getattr__(name: str) -> str:
+    """Resolve ``__version__`` lazily; importlib.metadata is slow to import."""
+    if name == "__version__":
+        from claude_monitor._version import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,13 +4,30 @@
 Allows running the package as a module: python -m claude_monitor
 """
 
+from __future__ import annotations
+
 import sys
-from typing import NoReturn
 
-from .cli.main import main
+# typing is deliberately not imported: this module is on the path of every
+# command, including the latency-sensitive status fast path
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Dispatch to the requested command, importing only what it needs."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv and argv[0] == "status":
+        from .cli.status import main as status_main
+
+        return status_main(argv[1:])
+
+    from .cli.main import main as cli_main
+
+    return cli_main(argv)
 
 
-def _main() -> NoReturn:
+def _main() -> None:
     """Entry point that properly handles exit codes and never returns."""
     exit_code = main()
     sys.exit(exit_code)
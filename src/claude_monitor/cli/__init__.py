@@ -1,5 +1,13 @@
 """Claude Monitor CLI package."""
 
-from .main import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name: str) -> object:
+    """Import the full CLI lazily so light commands such as status stay fast."""
+    if name == "main":
+        from .main import main
+
+        globals()["main"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
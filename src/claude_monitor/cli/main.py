@@ -1,5 +1,7 @@
 """Simplified CLI entry point using pydantic-settings."""
 
+from __future__ import annotations
+
 import argparse
 import contextlib
 import logging
@@ -8,44 +10,22 @@ import sys
 import time
 import traceback
 from pathlib import Path
-from typing import Any, Callable, Dict, List, NoReturn, Optional, Union
-
-from rich.console import Console
-
-from claude_monitor import __version__
-from claude_monitor.cli.bootstrap import (
-    ensure_directories,
-    init_timezone,
-    setup_environment,
-    setup_logging,
-)
-from claude_monitor.core.plans import Plans, PlanType, get_token_limit
-from claude_monitor.core.settings import Settings
-from claude_monitor.data.aggregator import UsageAggregator
-from claude_monitor.data.analysis import analyze_usage
-from claude_monitor.error_handling import report_error
-from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
-from claude_monitor.terminal.manager import (
-    enter_alternate_screen,
-    handle_cleanup_and_exit,
-    handle_error_and_exit,
-    restore_terminal,
-    setup_terminal,
-)
-from claude_monitor.terminal.themes import get_themed_console, print_themed
-from claude_monitor.ui.display_controller import DisplayController
-from claude_monitor.ui.table_views import TableViewsController
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NoReturn, Optional, Union
+
+from claude_monitor.cli.paths import get_standard_claude_paths
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Application modules (Rich, pydantic, pytz, UI) are imported inside the
+# functions that use them, so each command and view only pays for what it
+# needs. tests/test_startup.py guards the import-time budget.
 
 # Type aliases for CLI callbacks
 DataUpdateCallback = Callable[[Dict[str, Any]], None]
 SessionChangeCallback = Callable[[str, str, Optional[Dict[str, Any]]], None]
 
 
-def get_standard_claude_paths() -> List[str]:
-    """Get list of standard Claude data directory paths to check."""
-    return ["~/.claude/projects", "~/.config/claude/projects"]
-
-
 def discover_claude_data_paths(custom_paths: Optional[List[str]] = None) -> List[Path]:
     """Discover all available Claude data directories.
 
@@ -63,7 +43,7 @@ def discover_claude_data_paths(custom_paths: Optional[List[str]] = None) -> List
 
     for path_str in paths_to_check:
         path = Path(path_str).expanduser().resolve()
-        if path.exists() and path.is_dir():
+        if path.exists() and path.is_dir() and path not in discovered_paths:
             discovered_paths.append(path)
 
     return discovered_paths
@@ -75,9 +55,27 @@ def main(argv: Optional[List[str]] = None) -> int:
         argv = sys.argv[1:]
 
     if "--version" in argv or "-v" in argv:
+        from claude_monitor import __version__
+
         print(f"claude-monitor {__version__}")
         return 0
 
+    if argv and argv[0] == "daemon":
+        return _run_daemon(argv[1:])
+
+    if argv and argv[0] == "status":
+        from claude_monitor.cli.status import main as status_main
+
+        return status_main(argv[1:])
+
+    from claude_monitor.cli.bootstrap import (
+        ensure_directories,
+        init_timezone,
+        setup_environment,
+        setup_logging,
+    )
+    from claude_monitor.core.settings import Settings
+
     try:
         settings = Settings.load_with_last_used(argv)
 
@@ -109,6 +107,19 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 def _run_monitoring(args: argparse.Namespace) -> None:
     """Main monitoring implementation without facade."""
+    from claude_monitor.terminal.manager import (
+        enter_alternate_screen,
+        handle_cleanup_and_exit,
+        handle_error_and_exit,
+        restore_terminal,
+        setup_terminal,
+    )
+    from claude_monitor.terminal.themes import (
+        get_themed_console,
+        print_themed,
+        refine_auto_theme,
+    )
+
     view_mode = getattr(args, "view", "realtime")
 
     if hasattr(args, "theme") and args.theme:
@@ -125,16 +136,27 @@ def _run_monitoring(args: argparse.Namespace) -> None:
             print_themed("No Claude data directory found", style="error")
             return
 
-        data_path: Path = data_paths[0]
+        data_roots: List[str] = [str(path) for path in data_paths]
         logger = logging.getLogger(__name__)
-        logger.info(f"Using data path: {data_path}")
+        logger.info(f"Using data paths: {', '.join(data_roots)}")
 
         # Handle different view modes
         if view_mode in ["daily", "monthly"]:
-            _run_table_view(args, data_path, view_mode, console)
+            _run_table_view(args, data_roots, view_mode, console)
             return
 
-        token_limit: int = _get_initial_token_limit(args, str(data_path))
+        from claude_monitor.error_handling import report_error
+        from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
+        from claude_monitor.monitoring.scheduler import create_scheduler
+        from claude_monitor.monitoring.session_monitor import get_session_log_path
+        from claude_monitor.monitoring.status_file import StatusFileWriter
+        from claude_monitor.ui.display_controller import DisplayController
+
+        data_manager: Optional[Any] = _connect_to_daemon(args)
+        # P90 limits are derived by the orchestrator once history is loaded
+        token_limit: int = _get_initial_token_limit(
+            args, data_roots, analyze_history=False
+        )
 
         display_controller = DisplayController()
         display_controller.live_manager._console = console
@@ -163,11 +185,17 @@ def _run_monitoring(args: argparse.Namespace) -> None:
             live_display_active = True
             live_display.update(loading_display)
 
+            update_interval: int = (
+                args.refresh_rate if hasattr(args, "refresh_rate") else 10
+            )
             orchestrator = MonitoringOrchestrator(
-                update_interval=(
-                    args.refresh_rate if hasattr(args, "refresh_rate") else 10
-                ),
-                data_path=str(data_path),
+                update_interval=update_interval,
+                data_path=data_roots,
+                data_manager=data_manager,
+                scheduler=create_scheduler(args, update_interval),
+                # An attached daemon already records session history
+                session_log=get_session_log_path() if data_manager is None else None,
+                evict_closed_entries=getattr(args, "evict_closed_entries", True),
             )
             orchestrator.set_args(args)
 
@@ -203,9 +231,6 @@ def _run_monitoring(args: argparse.Namespace) -> None:
                         context_name="display_update_error",
                     )
 
-            # Register callbacks
-            orchestrator.register_update_callback(on_data_update)
-
             # Optional: Register session change callback
             def on_session_change(
                 event_type: str, session_id: str, session_data: Optional[Dict[str, Any]]
@@ -218,9 +243,23 @@ def _run_monitoring(args: argparse.Namespace) -> None:
 
             orchestrator.register_session_callback(on_session_change)
 
+            if getattr(args, "async_runtime", False) is True:
+                theme_query = refine_auto_theme(console)
+                _run_async_runtime(
+                    orchestrator, data_roots, on_data_update, StatusFileWriter()
+                )
+                return
+
+            # Render and export on their own threads so neither delays fetching
+            orchestrator.subscribe(on_data_update, name="DisplayUpdateThread")
+            orchestrator.subscribe(StatusFileWriter(), name="StatusFileThread")
+
             # Start monitoring
             orchestrator.start()
 
+            # Resolve an undetected background while the first data loads
+            theme_query = refine_auto_theme(console)
+
             # Wait for initial data
             logger.info("Waiting for initial data...")
             if not orchestrator.wait_for_initial_data(timeout=10.0):
@@ -239,6 +278,10 @@ def _run_monitoring(args: argparse.Namespace) -> None:
             if "orchestrator" in locals():
                 orchestrator.stop()
 
+            # The query must not restore its terminal state after we do
+            if "theme_query" in locals() and theme_query is not None:
+                theme_query.join(timeout=1.0)
+
             # Exit live display context if it was activated
             if live_display_active:
                 with contextlib.suppress(Exception):
@@ -260,10 +303,108 @@ def _run_monitoring(args: argparse.Namespace) -> None:
         restore_terminal(old_terminal_settings)
 
 
+def _run_async_runtime(
+    orchestrator: Any,
+    data_roots: List[str],
+    on_data_update: Callable[[Dict[str, Any]], None],
+    status_writer: Callable[[Dict[str, Any]], None],
+) -> None:
+    """Run monitoring on the asyncio runtime until interrupted."""
+    import asyncio
+
+    from claude_monitor.monitoring.async_runtime import AsyncMonitoringRuntime
+
+    runtime = AsyncMonitoringRuntime(orchestrator, watch_paths=data_roots)
+    runtime.add_consumer(on_data_update, name="display")
+    runtime.add_consumer(status_writer, name="status_file")
+    asyncio.run(runtime.run())
+
+
+def _connect_to_daemon(args: argparse.Namespace) -> Optional[Any]:
+    """Get a thin-client data manager if a usage daemon is running."""
+    if not getattr(args, "attach", True):
+        return None
+
+    from claude_monitor.monitoring.daemon import DaemonClient, DaemonDataManager
+
+    client = DaemonClient(timeout=1.0)
+    if not client.is_available():
+        return None
+
+    logging.getLogger(__name__).info(f"Attached to daemon at {client.socket_path}")
+    return DaemonDataManager(client)
+
+
+def _run_daemon(argv: List[str]) -> int:
+    """Run the headless usage daemon until interrupted."""
+    from claude_monitor.cli.bootstrap import (
+        ensure_directories,
+        init_timezone,
+        setup_environment,
+        setup_logging,
+    )
+    from claude_monitor.core.settings import Settings
+    from claude_monitor.monitoring.daemon import UsageDaemon
+
+    try:
+        settings = Settings(_cli_parse_args=argv)
+        if settings.timezone == "auto":
+            settings.timezone = Settings._get_system_timezone()
+        if settings.debug:
+            settings.log_level = "DEBUG"
+
+        setup_environment()
+        ensure_directories()
+        setup_logging(settings.log_level, settings.log_file, disable_console=True)
+        init_timezone(settings.timezone)
+
+        data_paths: List[Path] = discover_claude_data_paths()
+        if not data_paths:
+            print("No Claude data directory found", file=sys.stderr)
+            return 1
+
+        daemon = UsageDaemon(
+            args=settings.to_namespace(),
+            data_path=[str(path) for path in data_paths],
+            update_interval=settings.refresh_rate,
+        )
+
+        def _handle_sigterm(signum: int, frame: Any) -> None:
+            raise KeyboardInterrupt
+
+        signal.signal(signal.SIGTERM, _handle_sigterm)
+        print(f"claude-monitor daemon listening on {daemon.socket_path}")
+        daemon.serve_forever()
+        return 0
+
+    except KeyboardInterrupt:
+        return 0
+    except Exception as e:
+        logger = logging.getLogger(__name__)
+        logger.error(f"Daemon failed: {e}", exc_info=True)
+        print(f"Daemon failed: {e}", file=sys.stderr)
+        return 1
+
+
 def _get_initial_token_limit(
-    args: argparse.Namespace, data_path: Union[str, Path]
+    args: argparse.Namespace,
+    data_path: Union[str, Path, List[str]],
+    analyze_history: bool = True,
 ) -> int:
-    """Get initial token limit for the plan."""
+    """Get initial token limit for the plan.
+
+    Args:
+        args: Parsed command line arguments
+        data_path: Path to Claude data directory, or a list of them
+        analyze_history: Analyze usage history for the P90 limit of custom
+            plans; when False the plan default is returned instead
+
+    Returns:
+        Initial token limit
+    """
+    from claude_monitor.core.plans import Plans, PlanType, get_token_limit
+    from claude_monitor.terminal.themes import print_themed
+
     logger = logging.getLogger(__name__)
     plan: str = getattr(args, "plan", PlanType.PRO.value)
 
@@ -278,16 +419,23 @@ def _get_initial_token_limit(
             )
             return custom_limit
 
+        if not analyze_history:
+            return get_token_limit(plan)
+
         # Otherwise, analyze usage data to calculate P90
         print_themed("Analyzing usage data to determine cost limits...", style="info")
 
         try:
+            from claude_monitor.data.analysis import analyze_usage
+
             # Use quick start mode for faster initial load
             usage_data: Optional[Dict[str, Any]] = analyze_usage(
                 hours_back=96 * 2,
                 quick_start=False,
                 use_cache=False,
-                data_path=str(data_path),
+                data_path=(
+                    data_path if isinstance(data_path, list) else str(data_path)
+                ),
             )
 
             if usage_data and "blocks" in usage_data:
@@ -379,18 +527,20 @@ def validate_cli_environment() -> Optional[str]:
 
 
 def _run_table_view(
-    args: argparse.Namespace, data_path: Path, view_mode: str, console: Console
+    args: argparse.Namespace,
+    data_paths: List[str],
+    view_mode: str,
+    console: Console,
 ) -> None:
     """Run table view mode (daily/monthly)."""
+    from claude_monitor.terminal.themes import print_themed
+    from claude_monitor.ui.table_views import TableViewsController
+
     logger = logging.getLogger(__name__)
 
     try:
         # Create aggregator with appropriate mode
-        aggregator = UsageAggregator(
-            data_path=str(data_path),
-            aggregation_mode=view_mode,
-            timezone=args.timezone,
-        )
+        aggregator = _create_table_aggregator(args, data_paths, view_mode)
 
         # Create table controller
         controller = TableViewsController(console=console)
@@ -403,32 +553,186 @@ def _run_table_view(
             print_themed(f"No usage data found for {view_mode} view", style="warning")
             return
 
-        # Display the table
-        controller.display_aggregated_view(
-            data=aggregated_data,
-            view_mode=view_mode,
-            timezone=args.timezone,
-            plan=args.plan,
-            token_limit=_get_initial_token_limit(args, data_path),
-        )
+        from claude_monitor.terminal.manager import supports_key_input
 
-        # Wait for user to press Ctrl+C
-        print_themed("\nPress Ctrl+C to exit", style="info")
-        try:
-            # Use signal.pause() for more efficient waiting
-            try:
-                signal.pause()
-            except AttributeError:
-                # Fallback for Windows which doesn't support signal.pause()
-                while True:
-                    time.sleep(1)
-        except KeyboardInterrupt:
-            print_themed("\nExiting...", style="info")
+        if getattr(args, "paged_tables", False) is True and supports_key_input():
+            _run_paged_table_view(controller, aggregator, view_mode, args, console)
+            return
+
+        _run_live_table_view(controller, aggregator, view_mode, args, console)
 
     except Exception as e:
         logger.error(f"Error in table view: {e}", exc_info=True)
         print_themed(f"Error displaying {view_mode} view: {e}", style="error")
 
 
+def _create_table_aggregator(
+    args: argparse.Namespace, data_paths: List[str], view_mode: str
+) -> Any:
+    """Get the daily/monthly rows from a running daemon, or read them locally.
+
+    Either source folds only new data into the current day or month on
+    each refresh.
+    """
+    data_manager: Optional[Any] = _connect_to_daemon(args)
+    if data_manager is not None:
+        from claude_monitor.monitoring.daemon import DaemonUsageAggregator
+
+        return DaemonUsageAggregator(
+            data_manager.client, aggregation_mode=view_mode, timezone=args.timezone
+        )
+
+    from claude_monitor.data.aggregator import IncrementalUsageAggregator
+
+    return IncrementalUsageAggregator(
+        data_path=data_paths,
+        aggregation_mode=view_mode,
+        timezone=args.timezone,
+        local_periods=True,
+    )
+
+
+def _run_live_table_view(
+    controller: Any,
+    aggregator: Any,
+    view_mode: str,
+    args: argparse.Namespace,
+    console: Console,
+) -> None:
+    """Show the summary and full daily/monthly table until Ctrl+C.
+
+    New data is folded into the aggregator every refresh_rate seconds and
+    the view is drawn again when a row changed. Terminals redraw it in
+    place; other outputs get the updated view appended.
+    """
+    from rich.console import Group
+    from rich.live import Live
+    from rich.text import Text
+
+    from claude_monitor.error_handling import report_error
+    from claude_monitor.terminal.themes import print_themed
+    from claude_monitor.ui.table_views import VirtualTableView
+
+    logger = logging.getLogger(__name__)
+    refresh_interval: float = float(getattr(args, "refresh_rate", 10))
+    # Only its incrementally kept totals are used here
+    view = VirtualTableView(controller, aggregator.rows(), view_mode, args.timezone)
+
+    def render() -> Any:
+        return Group(
+            controller.create_aggregated_view(
+                view.data, view_mode, args.timezone, totals=view.totals
+            ),
+            Text("\nPress Ctrl+C to exit", style="dim"),
+        )
+
+    live: Optional[Live] = None
+    if console.is_terminal:
+        live = Live(
+            render(),
+            console=console,
+            auto_refresh=False,
+            vertical_overflow="visible",
+        )
+        live.start()
+    else:
+        console.print(render())
+
+    try:
+        while True:
+            time.sleep(refresh_interval)
+            try:
+                changed = aggregator.refresh()
+            except Exception as e:
+                logger.error(f"Table refresh error: {e}", exc_info=True)
+                report_error(
+                    exception=e,
+                    component="cli_main",
+                    context_name="table_refresh_error",
+                )
+                continue
+            if not changed:
+                continue
+
+            view.set_data(aggregator.rows(), changed)
+            if live is not None:
+                live.update(render(), refresh=True)
+            else:
+                console.print(render())
+    except KeyboardInterrupt:
+        if live is not None:
+            live.stop()
+            live = None
+        print_themed("\nExiting...", style="info")
+    finally:
+        if live is not None:
+            live.stop()
+
+
+def _run_paged_table_view(
+    controller: Any,
+    aggregator: Any,
+    view_mode: str,
+    args: argparse.Namespace,
+    console: Console,
+) -> None:
+    """Page through a live daily/monthly table until q or Ctrl+C.
+
+    New transcript data is folded into the aggregator every refresh_rate
+    seconds, so the row of the current day or month updates in place.
+    """
+    from rich.live import Live
+
+    from claude_monitor.error_handling import report_error
+    from claude_monitor.terminal.manager import (
+        read_key,
+        restore_terminal,
+        setup_terminal,
+    )
+    from claude_monitor.ui.table_views import VirtualTableView
+
+    logger = logging.getLogger(__name__)
+    refresh_interval: float = float(getattr(args, "refresh_rate", 10))
+    view = VirtualTableView(controller, aggregator.rows(), view_mode, args.timezone)
+    old_settings = setup_terminal()
+    try:
+        height: int = console.size.height
+        next_refresh: float = time.monotonic() + refresh_interval
+        with Live(
+            view.render(height), console=console, screen=True, auto_refresh=False
+        ) as live:
+            while True:
+                timeout = min(1.0, max(0.0, next_refresh - time.monotonic()))
+                key: Optional[str] = read_key(timeout=timeout)
+                redraw: bool = console.size.height != height
+                if key is not None:
+                    if not view.handle_key(key, height):
+                        break
+                    redraw = True
+
+                if time.monotonic() >= next_refresh:
+                    next_refresh = time.monotonic() + refresh_interval
+                    try:
+                        changed = aggregator.refresh()
+                        if changed:
+                            view.set_data(aggregator.rows(), changed)
+                            redraw = True
+                    except Exception as e:
+                        logger.error(f"Table refresh error: {e}", exc_info=True)
+                        report_error(
+                            exception=e,
+                            component="cli_main",
+                            context_name="table_refresh_error",
+                        )
+
+                if redraw:
+                    height = console.size.height
+                    live.update(view.render(height), refresh=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        restore_terminal(old_settings)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,28 @@
+"""Standard Claude data directories.
+
+Kept free of application imports so the light ``status`` command can share
+it with the full CLI.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List
+
+
+def get_standard_claude_paths() -> List[str]:
+    """Get list of standard Claude data directory paths to check.
+
+    Includes the projects directories of CLAUDE_CONFIG_DIR (comma-separated,
+    as accepted by Claude Code) and any extra roots listed in
+    CLAUDE_MONITOR_DATA_PATHS (separated by os.pathsep).
+    """
+    paths: List[str] = ["~/.claude/projects", "~/.config/claude/projects"]
+    for config_dir in os.environ.get("CLAUDE_CONFIG_DIR", "").split(","):
+        if config_dir.strip():
+            paths.append(str(Path(config_dir.strip()) / "projects"))
+    for extra_path in os.environ.get("CLAUDE_MONITOR_DATA_PATHS", "").split(os.pathsep):
+        if extra_path.strip():
+            paths.append(extra_path.strip())
+    return paths
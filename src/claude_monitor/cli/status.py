@@ -0,0 +1,389 @@
+"""One-shot ``claude-monitor status`` command for shell prompts.
+
+Prints a single formatted line describing the active session block. The
+command reads the status file kept current by a running monitor or daemon;
+without a fresh file it scans only the tails of recently modified transcripts
+and caches the result in the status file.
+
+Startup time is the whole point of this command, so the fast path imports
+nothing beyond ``json``, ``os``, ``sys`` and ``time``; that import cost is a
+few milliseconds, while interpreter startup dominates the wall time of a
+``claude-monitor status`` call. Everything else, including the data paths
+and session block rules shared with the monitor, is imported lazily on the
+scan path.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+
+from claude_monitor.monitoring.status_file import (
+    add_derived_fields,
+    new_status,
+    read_status_file,
+    write_status_file,
+)
+
+DEFAULT_FORMAT = (
+    "{tokens_left:,} tokens left ({percent_used}% used), resets {reset_time}"
+)
+DEFAULT_MAX_AGE = 60.0
+SESSION_SECONDS = 5 * 3600
+# Without a known block start, replay three session windows so the active
+# block is usually preceded by a gap that anchors its start hour
+SCAN_LOOKBACK_SECONDS = 3 * SESSION_SECONDS
+TAIL_CHUNK_SIZE = 64 * 1024
+
+_USAGE = """usage: claude-monitor status [--format FORMAT] [--max-age SECONDS]
+                             [--plan PLAN] [--data-path PATH]
+
+Print a one-line usage summary for shell prompts.
+
+options:
+  -f, --format FORMAT  str.format template, or "json" for the raw status.
+                       Fields: tokens_used, tokens_left, token_limit,
+                       percent_used, cost_usd, burn_rate, messages, plan,
+                       active, reset_time, reset_in, source
+  --max-age SECONDS    Rescan when the status file is older (default: 60)
+  --plan PLAN          Plan used for the token limit when scanning
+  --data-path PATH     Claude data directory to scan (repeatable)
+"""
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the status line and return an exit code."""
+    try:
+        options = _parse_args(sys.argv[1:] if argv is None else argv)
+    except ValueError as e:
+        print(f"claude-monitor status: {e}", file=sys.stderr)
+        return 2
+    if options is None:
+        print(_USAGE, end="")
+        return 0
+
+    now = time.time()
+    status = read_status_file()
+    if not _is_fresh(status, now, options["max_age"]):
+        status = _scan_status(options, status, now)
+
+    try:
+        print(format_status(status, options["format"], now))
+    except (KeyError, ValueError, IndexError) as e:
+        print(f"claude-monitor status: invalid format: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def _parse_args(argv: list[str]) -> dict | None:
+    """Parse arguments without argparse, which is slow to import.
+
+    Returns:
+        Options dictionary, or None when help was requested
+
+    Raises:
+        ValueError: On unknown options or missing values
+    """
+    options: dict = {
+        "format": DEFAULT_FORMAT,
+        "max_age": DEFAULT_MAX_AGE,
+        "plan": None,
+        "data_paths": [],
+    }
+    names = {
+        "-f": "format",
+        "--format": "format",
+        "--max-age": "max_age",
+        "--plan": "plan",
+        "--data-path": "data_paths",
+    }
+
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            return None
+        name, has_value, value = arg.partition("=")
+        if name not in names:
+            raise ValueError(f"unrecognized argument: {arg}")
+        if not has_value:
+            value = next(args, None)
+            if value is None:
+                raise ValueError(f"{name} expects a value")
+
+        key = names[name]
+        if key == "max_age":
+            options[key] = float(value)
+        elif key == "data_paths":
+            options[key].append(value)
+        else:
+            options[key] = value
+
+    return options
+
+
+def _is_fresh(status: dict | None, now: float, max_age: float) -> bool:
+    """Check if a status file can be served as is."""
+    if status is None or now - status.get("generated_at", 0) > max_age:
+        return False
+    reset_at = status.get("reset_at")
+    return reset_at is None or reset_at > now
+
+
+def format_status(status: dict, fmt: str, now: float | None = None) -> str:
+    """Render a status dictionary with a str.format template.
+
+    Args:
+        status: Status dictionary
+        fmt: Format template, or "json" for the raw status
+        now: Current epoch time (defaults to time.time())
+
+    Returns:
+        Rendered status line
+    """
+    if fmt == "json":
+        return json.dumps(status)
+
+    now = time.time() if now is None else now
+    reset_at = status.get("reset_at")
+    fields = dict(status)
+    if reset_at:
+        remaining = max(0, int(reset_at - now)) // 60
+        fields["reset_time"] = time.strftime("%H:%M", time.localtime(reset_at))
+        fields["reset_in"] = f"{remaining // 60}h{remaining % 60:02d}m"
+    else:
+        fields["reset_time"] = "--:--"
+        fields["reset_in"] = "-"
+    return fmt.format_map(fields)
+
+
+def _scan_status(options: dict, previous: dict | None, now: float) -> dict:
+    """Build a status from transcript tails and cache it in the status file."""
+    plan = options["plan"] or (previous or {}).get("plan") or "custom"
+    if previous and previous.get("plan") == plan and previous.get("token_limit"):
+        # Keeps a P90 limit computed by the last monitor run
+        token_limit = previous["token_limit"]
+    else:
+        from claude_monitor.core.plans import get_token_limit
+
+        token_limit = get_token_limit(plan)
+
+    status = new_status(plan, token_limit, "scan", now)
+    if options["data_paths"]:
+        data_paths = options["data_paths"]
+    else:
+        from claude_monitor.cli.paths import get_standard_claude_paths
+
+        data_paths = get_standard_claude_paths()
+    records = _collect_recent_records(data_paths, _scan_cutoff(previous, now))
+    block = _find_active_block(sorted(records.values()), now)
+
+    if block:
+        duration_minutes = max(1.0, (now - block["first"]) / 60)
+        status.update(
+            {
+                "active": True,
+                "tokens_used": block["tokens"],
+                "cost_usd": round(block["cost"], 6),
+                "messages": block["messages"],
+                "burn_rate": round(block["tokens"] / duration_minutes, 2),
+                "session_start": block["start"],
+                "reset_at": block["start"] + SESSION_SECONDS,
+            }
+        )
+        add_derived_fields(status)
+
+    try:
+        write_status_file(status)
+    except OSError:
+        pass
+    return status
+
+
+def _scan_cutoff(previous: dict | None, now: float) -> float:
+    """Pick the oldest entry time a scan has to read.
+
+    The last known block start is an exact anchor for replaying block
+    boundaries, so it is used when it lies within the lookback window.
+    """
+    cutoff = now - SCAN_LOOKBACK_SECONDS
+    session_start = (previous or {}).get("session_start")
+    if isinstance(session_start, (int, float)) and cutoff < session_start <= now:
+        return float(session_start)
+    return cutoff
+
+
+def _collect_recent_records(data_paths: tuple | list, cutoff: float) -> dict:
+    """Collect usage records newer than cutoff, deduplicated by message/request."""
+    records: dict = {}
+    roots: list[str] = []
+    for data_path in data_paths:
+        root = os.path.realpath(os.path.expanduser(data_path))
+        if root not in roots:
+            roots.append(root)
+
+    for root in roots:
+        for file_path in _recent_jsonl_files(root, cutoff):
+            for key, record in _iter_tail_records(file_path, cutoff):
+                # Entries without ids are never deduplicated
+                records.setdefault(key or len(records), record)
+    return records
+
+
+def _recent_jsonl_files(root: str, cutoff: float) -> list[str]:
+    """Find .jsonl files under root modified after cutoff."""
+    found: list[str] = []
+    stack = [root]
+    while stack:
+        try:
+            scanner = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with scanner:
+            for entry in scanner:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (
+                        entry.name.endswith(".jsonl")
+                        and entry.stat().st_mtime >= cutoff
+                    ):
+                        found.append(entry.path)
+                except OSError:
+                    continue
+    return found
+
+
+def _iter_tail_records(path: str, cutoff: float):
+    """Yield (key, record) pairs reading the file backwards until cutoff.
+
+    Transcripts are append-only and chronological, so reading stops at the
+    first chunk containing an entry older than the cutoff.
+    """
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return
+
+    with f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            size = min(TAIL_CHUNK_SIZE, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b"\n")
+            remainder = lines.pop(0) if position > 0 else b""
+
+            reached_cutoff = False
+            for line in reversed(lines):
+                parsed = _parse_usage_line(line)
+                if parsed is None:
+                    continue
+                if parsed[1][0] < cutoff:
+                    reached_cutoff = True
+                    continue
+                yield parsed
+            if reached_cutoff:
+                return
+
+
+def _parse_usage_line(line: bytes) -> tuple | None:
+    """Parse a transcript line into (key, (timestamp, input, output, cost, model))."""
+    if b'"usage"' not in line:
+        return None
+    from claude_monitor.data.decoding import get_decoder
+
+    try:
+        data = get_decoder().loads_entry(line)
+        message = data.get("message") or {}
+        usage = message.get("usage") or data.get("usage") or {}
+        timestamp = _parse_timestamp(data["timestamp"])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    input_tokens = usage.get("input_tokens", 0) or 0
+    output_tokens = usage.get("output_tokens", 0) or 0
+    cache_creation = usage.get("cache_creation_input_tokens", 0) or 0
+    cache_read = usage.get("cache_read_input_tokens", 0) or 0
+    if not (input_tokens or output_tokens or cache_creation or cache_read):
+        return None
+
+    model = message.get("model") or data.get("model") or "unknown"
+    cost = data.get("costUSD")
+    if cost is None:
+        cost = _calculate_cost(
+            model, input_tokens, output_tokens, cache_creation, cache_read
+        )
+
+    message_id = data.get("message_id") or message.get("id")
+    request_id = data.get("requestId") or data.get("request_id")
+    key = f"{message_id}:{request_id}" if message_id and request_id else None
+    return key, (timestamp, input_tokens, output_tokens, float(cost), model)
+
+
+def _parse_timestamp(value: str) -> float:
+    """Parse an ISO 8601 timestamp into epoch seconds."""
+    from datetime import datetime, timezone
+
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+_pricing_calculator = None
+
+
+def _calculate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_creation: int,
+    cache_read: int,
+) -> float:
+    """Calculate entry cost with the shared pricing table."""
+    global _pricing_calculator
+    if _pricing_calculator is None:
+        from claude_monitor.core.pricing import PricingCalculator
+
+        _pricing_calculator = PricingCalculator()
+    return _pricing_calculator.calculate_cost(
+        model, input_tokens, output_tokens, cache_creation, cache_read
+    )
+
+
+def _find_active_block(records: list, now: float) -> dict | None:
+    """Split records into session blocks and return the active block totals.
+
+    Blocks are built by SessionAnalyzer, so the scan follows exactly the
+    rules the monitor uses.
+    """
+    if not records:
+        return None
+    from datetime import datetime, timezone
+
+    from claude_monitor.core.models import UsageEntry
+    from claude_monitor.data.analyzer import SessionAnalyzer
+
+    entries = [
+        UsageEntry(
+            timestamp=datetime.fromtimestamp(timestamp, timezone.utc),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=cost,
+            model=model,
+        )
+        for timestamp, input_tokens, output_tokens, cost, model in records
+    ]
+    block = SessionAnalyzer(SESSION_SECONDS // 3600).transform_to_blocks(entries)[-1]
+    if block.end_time.timestamp() <= now:
+        return None
+    return {
+        "start": block.start_time.timestamp(),
+        "first": block.entries[0].timestamp.timestamp(),
+        "tokens": block.token_counts.input_tokens + block.token_counts.output_tokens,
+        "cost": block.cost_usd,
+        "messages": block.sent_messages_count,
+    }
@@ -11,8 +11,6 @@ import pytz
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from claude_monitor import __version__
-
 logger = logging.getLogger(__name__)
 
 
@@ -152,6 +150,40 @@ class Settings(BaseSettings):
         default=10, ge=1, le=60, description="Refresh rate in seconds"
     )
 
+    adaptive_refresh: bool = Field(
+        default=True,
+        description="Refresh faster while tokens are being used and back off while idle",
+    )
+
+    min_refresh_rate: int = Field(
+        default=2,
+        ge=1,
+        le=60,
+        description="Shortest adaptive refresh interval in seconds (1-60)",
+    )
+
+    max_refresh_rate: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description="Longest adaptive refresh interval in seconds while idle (1-3600)",
+    )
+
+    evict_closed_entries: bool = Field(
+        default=True,
+        description="Keep only aggregates for closed session blocks to bound memory on long histories",
+    )
+
+    async_runtime: bool = Field(
+        default=False,
+        description="Run refresh, file watching and rendering as asyncio tasks on one event loop",
+    )
+
+    paged_tables: bool = Field(
+        default=True,
+        description="Page daily/monthly tables with the keyboard in interactive terminals",
+    )
+
     refresh_per_second: float = Field(
         default=0.75,
         ge=0.1,
@@ -176,6 +208,11 @@ class Settings(BaseSettings):
 
     clear: bool = Field(default=False, description="Clear saved configuration")
 
+    attach: bool = Field(
+        default=True,
+        description="Attach to a running claude-monitor daemon instead of parsing data locally",
+    )
+
     @field_validator("plan", mode="before")
     @classmethod
     def validate_plan(cls, v: Any) -> str:
@@ -282,6 +319,8 @@ class Settings(BaseSettings):
     def load_with_last_used(cls, argv: Optional[List[str]] = None) -> "Settings":
         """Load settings with last used params support (default behavior)."""
         if argv and "--version" in argv:
+            from claude_monitor import __version__
+
             print(f"claude-monitor {__version__}")
             import sys
 
@@ -346,14 +385,16 @@ class Settings(BaseSettings):
                 BackgroundType,
             )
 
+            # Never block startup on the OSC 11 query; an unresolved "auto"
+            # theme is refined asynchronously once the display is running
             detector = BackgroundDetector()
-            detected_bg = detector.detect_background()
+            detected_bg = detector.detect_background(allow_query=False)
 
             if detected_bg == BackgroundType.LIGHT:
                 settings.theme = "light"
             elif detected_bg == BackgroundType.DARK:
                 settings.theme = "dark"
-            else:
+            elif settings.theme not in ("light", "dark", "classic"):
                 settings.theme = "auto"
 
         # Apply locale setting to i18n system
@@ -385,6 +426,12 @@ class Settings(BaseSettings):
         args.timezone = self.timezone
         args.theme = self.theme
         args.refresh_rate = self.refresh_rate
+        args.adaptive_refresh = self.adaptive_refresh
+        args.min_refresh_rate = self.min_refresh_rate
+        args.max_refresh_rate = self.max_refresh_rate
+        args.async_runtime = self.async_runtime
+        args.evict_closed_entries = self.evict_closed_entries
+        args.paged_tables = self.paged_tables
         args.refresh_per_second = self.refresh_per_second
         args.reset_hour = self.reset_hour
         args.custom_limit_tokens = self.custom_limit_tokens
@@ -393,5 +440,6 @@ class Settings(BaseSettings):
         args.log_level = self.log_level
         args.log_file = str(self.log_file) if self.log_file else None
         args.version = self.version
+        args.attach = self.attach
 
         return args
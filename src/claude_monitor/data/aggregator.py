@@ -4,11 +4,12 @@ This module provides functionality to aggregate Claude usage data
 by day and month, similar to ccusage's functionality.
 """
 
+import bisect
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from claude_monitor.core.models import SessionBlock, UsageEntry, normalize_model_name
 from claude_monitor.utils.time_utils import TimezoneHandler
@@ -16,6 +17,23 @@ from claude_monitor.utils.time_utils import TimezoneHandler
 logger = logging.getLogger(__name__)
 
 
+def _day_key(timestamp: datetime) -> str:
+    """Period key of a daily aggregate."""
+    return timestamp.strftime("%Y-%m-%d")
+
+
+def _month_key(timestamp: datetime) -> str:
+    """Period key of a monthly aggregate."""
+    return timestamp.strftime("%Y-%m")
+
+
+# Period type and key function per aggregation mode
+_PERIODS: Dict[str, Tuple[str, Callable[[datetime], str]]] = {
+    "daily": ("date", _day_key),
+    "monthly": ("month", _month_key),
+}
+
+
 @dataclass
 class AggregatedStats:
     """Statistics for aggregated usage data."""
@@ -93,12 +111,15 @@ class UsageAggregator:
     """Aggregates usage data for daily and monthly reports."""
 
     def __init__(
-        self, data_path: str, aggregation_mode: str = "daily", timezone: str = "UTC"
+        self,
+        data_path: Union[str, Sequence[str]],
+        aggregation_mode: str = "daily",
+        timezone: str = "UTC",
     ):
         """Initialize the aggregator.
 
         Args:
-            data_path: Path to the data directory
+            data_path: Path to the data directory, or a list of directories
             aggregation_mode: Mode of aggregation ('daily' or 'monthly')
             timezone: Timezone string for date formatting
         """
@@ -171,11 +192,7 @@ class UsageAggregator:
             List of daily aggregated data
         """
         return self._aggregate_by_period(
-            entries,
-            lambda timestamp: timestamp.strftime("%Y-%m-%d"),
-            "date",
-            start_date,
-            end_date,
+            entries, _day_key, "date", start_date, end_date
         )
 
     def aggregate_monthly(
@@ -195,11 +212,7 @@ class UsageAggregator:
             List of monthly aggregated data
         """
         return self._aggregate_by_period(
-            entries,
-            lambda timestamp: timestamp.strftime("%Y-%m"),
-            "month",
-            start_date,
-            end_date,
+            entries, _month_key, "month", start_date, end_date
         )
 
     def aggregate_from_blocks(
@@ -295,3 +308,113 @@ class UsageAggregator:
             return self.aggregate_monthly(entries)
         else:
             raise ValueError(f"Invalid aggregation mode: {self.aggregation_mode}")
+
+
+class IncrementalUsageAggregator(UsageAggregator):
+    """Keeps daily or monthly aggregates current as new entries arrive.
+
+    Entries come from the incremental reader used by the realtime view, so a
+    refresh parses only data appended to the transcripts and folds it into
+    the periods it belongs to, normally just the current day or month. Rows
+    of other periods are kept as they are. Folded entries are released from
+    the reader, so memory does not grow with the history. History is
+    aggregated again only when the reader reloads from scratch, e.g. after a
+    transcript was replaced.
+    """
+
+    def __init__(
+        self,
+        data_path: Union[str, Sequence[str]],
+        aggregation_mode: str = "daily",
+        timezone: str = "UTC",
+        local_periods: bool = False,
+    ):
+        """Initialize the aggregator.
+
+        Args:
+            data_path: Path to the data directory, or a list of directories
+            aggregation_mode: Mode of aggregation ('daily' or 'monthly')
+            timezone: Timezone string for date formatting
+            local_periods: Assign entries to the day or month they fall into
+                in ``timezone`` rather than in their own (UTC) time
+
+        Raises:
+            ValueError: If aggregation_mode is not 'daily' or 'monthly'
+        """
+        from claude_monitor.data.reader import create_usage_reader
+
+        super().__init__(data_path, aggregation_mode, timezone)
+        if aggregation_mode not in _PERIODS:
+            raise ValueError(f"Invalid aggregation mode: {aggregation_mode}")
+        self.period_type, self._period_key = _PERIODS[aggregation_mode]
+        self._reader = create_usage_reader(data_path)
+        self.local_periods: bool = local_periods
+        self._generation: Optional[int] = None
+        self._periods: Dict[str, AggregatedPeriod] = {}
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._keys: List[str] = []
+
+    def refresh(self) -> List[str]:
+        """Read new entries and update the periods they fall into.
+
+        Returns:
+            Sorted keys of the periods whose rows changed or were removed
+        """
+        entries, _ = self._reader.load()
+        # Periods dropped by a reload count as changed as well
+        removed: List[str] = []
+        if self._reader.generation != self._generation:
+            self._generation = self._reader.generation
+            removed = self._keys
+            self._periods = {}
+            self._rows = {}
+            self._keys = []
+            new_entries = entries
+        else:
+            new_entries = self._reader.last_new_entries
+
+        changed: Dict[str, AggregatedPeriod] = {}
+        for entry in new_entries:
+            if entry.timestamp.tzinfo is None:
+                entry.timestamp = self.timezone_handler.ensure_timezone(entry.timestamp)
+            timestamp = entry.timestamp
+            if self.local_periods:
+                timestamp = self.timezone_handler.convert_to_timezone(
+                    timestamp, self.timezone
+                )
+            period_key = self._period_key(timestamp)
+            period = self._periods.get(period_key)
+            if period is None:
+                period = AggregatedPeriod(period_key)
+                self._periods[period_key] = period
+                bisect.insort(self._keys, period_key)
+            period.add_entry(entry)
+            changed[period_key] = period
+
+        for period_key, period in changed.items():
+            self._rows[period_key] = period.to_dict(self.period_type)
+        if entries:
+            self._reader.drop_before(entries[-1].timestamp + timedelta(microseconds=1))
+
+        if changed:
+            logger.debug(
+                f"Updated {len(changed)} {self.aggregation_mode} rows "
+                f"from {len(new_entries)} new entries"
+            )
+        return sorted(set(changed).union(removed))
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Get the aggregated rows, oldest period first.
+
+        Rows of unchanged periods are the same objects across refreshes.
+        """
+        return [self._rows[period_key] for period_key in self._keys]
+
+    def aggregate(self) -> List[Dict[str, Any]]:
+        """Refresh and return the aggregated rows.
+
+        Returns:
+            List of aggregated data based on aggregation_mode
+        """
+        self.refresh()
+        return self.rows()
@@ -4,22 +4,81 @@ Contains the main analyze_usage function and related analysis components.
 """
 
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from claude_monitor.core.calculations import BurnRateCalculator
 from claude_monitor.core.models import CostMode, SessionBlock, UsageEntry
 from claude_monitor.data.analyzer import SessionAnalyzer
-from claude_monitor.data.reader import load_usage_entries
+from claude_monitor.data.reader import UsageReader, load_usage_entries
 
 logger = logging.getLogger(__name__)
 
 
+class ClosedBlocks:
+    """Closed session blocks kept as aggregates after their entries are evicted.
+
+    A block whose five hours have passed can no longer change, so its
+    dictionary is built once and the reader releases the entries it was built
+    from; later analyses rebuild only the blocks from the oldest open one on.
+    The state is discarded, and the full history reloaded, when the reader
+    resets or an entry arrives that is older than the evicted range.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty state."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget all closed blocks."""
+        self.blocks: List[Dict[str, Any]] = []
+        self.entries_count: int = 0
+        self.total_tokens: int = 0
+        self.total_cost: float = 0.0
+        # Entries older than this were released from the reader
+        self.evicted_before: Optional[datetime] = None
+        self.last_end_time: Optional[datetime] = None
+        self.reader_generation: Optional[int] = None
+
+    def add(self, block: SessionBlock) -> None:
+        """Store a closed block without its entries."""
+        block_dict = _create_base_block_dict(block, evict_entries=True)
+        _add_optional_block_data(block, block_dict)
+        self.blocks.append(block_dict)
+        self.entries_count += len(block.entries)
+        self.total_tokens += block.total_tokens
+        self.total_cost += block.cost_usd
+        if not block.is_gap:
+            self.last_end_time = block.actual_end_time
+
+    def prune(self, cutoff_time: datetime) -> None:
+        """Drop blocks whose last entry is older than cutoff_time."""
+        expired = 0
+        for block_dict in self.blocks:
+            end_time = block_dict["actualEndTime"]
+            if end_time and datetime.fromisoformat(end_time) >= cutoff_time:
+                break
+            expired += 1
+
+        for block_dict in self.blocks[:expired]:
+            self.entries_count -= block_dict["entries_count"]
+            self.total_tokens -= sum(block_dict["tokenCounts"].values())
+            self.total_cost -= block_dict["costUSD"]
+        del self.blocks[:expired]
+        if not self.blocks:
+            self.last_end_time = None
+
+
 def analyze_usage(
     hours_back: Optional[int] = 96,
     use_cache: bool = True,
     quick_start: bool = False,
-    data_path: Optional[str] = None,
+    data_path: Optional[Union[str, Sequence[str]]] = None,
+    reader: Optional[UsageReader] = None,
+    recent_hours: Optional[float] = None,
+    evict_closed_entries: bool = False,
+    closed_blocks: Optional[ClosedBlocks] = None,
 ) -> Dict[str, Any]:
     """
     Main entry point to generate response_final.json.
@@ -34,7 +93,16 @@ def analyze_usage(
         hours_back: Only analyze data from last N hours (None = all data)
         use_cache: Use cached data when available
         quick_start: Use minimal data for quick startup (last 24h only)
-        data_path: Optional path to Claude data directory
+        data_path: Optional path to Claude data directory, or a list of them
+        reader: Optional incremental reader reused across calls; when given,
+            only data appended since its previous load is parsed
+        recent_hours: With a reader, only read files modified within the
+            last N hours; the result is marked partial in its metadata
+        evict_closed_entries: Leave out the per-entry payloads of closed
+            blocks, which keep only their aggregates; see select_block_entries
+        closed_blocks: With a reader and evict_closed_entries, state reused
+            across calls so closed blocks are built once and their entries
+            are released from the reader
 
     Returns:
         Dictionary with analyzed blocks
@@ -51,18 +119,42 @@ def analyze_usage(
         logger.info(f"Quick start mode: loading last {hours_back} hours")
 
     start_time = datetime.now()
-    entries, raw_entries = load_usage_entries(
-        data_path=data_path,
-        hours_back=hours_back,
-        mode=CostMode.AUTO,
-        include_raw=True,
-    )
+    if reader is not None:
+        entries, raw_entries = reader.load(
+            hours_back=hours_back, include_raw=True, recent_hours=recent_hours
+        )
+    else:
+        entries, raw_entries = load_usage_entries(
+            data_path=data_path,
+            hours_back=hours_back,
+            mode=CostMode.AUTO,
+            include_raw=True,
+        )
+    closed = closed_blocks if reader is not None and evict_closed_entries else None
+    if closed is not None and closed.reader_generation is not None:
+        if reader.generation == closed.reader_generation and any(
+            entry.timestamp < closed.evicted_before for entry in reader.last_new_entries
+        ):
+            logger.info("Entries older than evicted blocks found, reloading history")
+            reader.reset()
+            entries, raw_entries = reader.load(
+                hours_back=hours_back, include_raw=True, recent_hours=recent_hours
+            )
+        if reader.generation != closed.reader_generation:
+            closed.clear()
+    if closed is not None and hours_back:
+        closed.prune(datetime.now(timezone.utc) - timedelta(hours=hours_back))
     load_time = (datetime.now() - start_time).total_seconds()
     logger.info(f"Data loaded in {load_time:.3f}s")
 
     start_time = datetime.now()
     analyzer = SessionAnalyzer(session_duration_hours=5)
-    blocks = analyzer.transform_to_blocks(entries)
+    if closed is not None:
+        blocks = analyzer.transform_to_blocks(
+            entries, previous_end_time=closed.last_end_time
+        )
+    else:
+        blocks = analyzer.transform_to_blocks(entries)
     transform_time = (datetime.now() - start_time).total_seconds()
     logger.info(f"Created {len(blocks)} blocks in {transform_time:.3f}s")
 
@@ -83,19 +175,27 @@ def analyze_usage(
             if block_limits:
                 block.limit_messages = block_limits
 
+    # Partial loads may miss entries of closed blocks, so they never evict
+    if closed is not None and recent_hours is None:
+        blocks = _evict_closed_blocks(closed, blocks, reader)
+        if closed.evicted_before is not None:
+            entries = [e for e in entries if e.timestamp >= closed.evicted_before]
+
+    entries_count = len(entries) + (closed.entries_count if closed else 0)
     metadata: Dict[str, Any] = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "hours_analyzed": hours_back or "all",
-        "entries_processed": len(entries),
+        "entries_processed": entries_count,
         "blocks_created": len(blocks),
         "limits_detected": limits_detected,
         "load_time_seconds": load_time,
         "transform_time_seconds": transform_time,
         "cache_used": use_cache,
         "quick_start": quick_start,
+        "partial": reader is not None and recent_hours is not None,
     }
 
-    result = _create_result(blocks, entries, metadata)
+    result = _create_result(blocks, entries, metadata, evict_closed_entries, closed)
     logger.info(f"analyze_usage returning {len(result['blocks'])} blocks")
     return result
 
@@ -118,19 +218,59 @@ def _process_burn_rates(
                     }
 
 
+def _evict_closed_blocks(
+    closed: ClosedBlocks, blocks: List[SessionBlock], reader: UsageReader
+) -> List[SessionBlock]:
+    """Move closed blocks into closed and release their entries from reader.
+
+    Returns:
+        The blocks still open, preceded by the gap before them if any; the
+        gap is rebuilt from closed.last_end_time on every call
+    """
+    active_index = next(
+        (i for i, block in enumerate(blocks) if block.is_active), len(blocks)
+    )
+    open_index = active_index
+    while open_index > 0 and blocks[open_index - 1].is_gap:
+        open_index -= 1
+    if open_index == 0:
+        return blocks
+
+    for block in blocks[:open_index]:
+        closed.add(block)
+    closed.evicted_before = (
+        blocks[active_index].start_time
+        if active_index < len(blocks)
+        else blocks[-1].end_time
+    )
+    reader.drop_before(closed.evicted_before)
+    closed.reader_generation = reader.generation
+    return blocks[open_index:]
+
+
 def _create_result(
-    blocks: List[SessionBlock], entries: List[UsageEntry], metadata: Dict[str, Any]
+    blocks: List[SessionBlock],
+    entries: List[UsageEntry],
+    metadata: Dict[str, Any],
+    evict_closed_entries: bool = False,
+    closed: Optional[ClosedBlocks] = None,
 ) -> Dict[str, Any]:
     """Create the final result dictionary."""
-    blocks_data = _convert_blocks_to_dict_format(blocks)
+    blocks_data = _convert_blocks_to_dict_format(blocks, evict_closed_entries)
 
     total_tokens = sum(b.total_tokens for b in blocks)
     total_cost = sum(b.cost_usd for b in blocks)
+    entries_count = len(entries)
+    if closed is not None:
+        blocks_data = closed.blocks + blocks_data
+        total_tokens += closed.total_tokens
+        total_cost += closed.total_cost
+        entries_count += closed.entries_count
 
     return {
         "blocks": blocks_data,
         "metadata": metadata,
-        "entries_count": len(entries),
+        "entries_count": entries_count,
         "total_tokens": total_tokens,
         "total_cost": total_cost,
     }
@@ -162,21 +302,30 @@ def _format_limit_info(limit_info: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _convert_blocks_to_dict_format(blocks: List[SessionBlock]) -> List[Dict[str, Any]]:
+def _convert_blocks_to_dict_format(
+    blocks: List[SessionBlock], evict_closed_entries: bool = False
+) -> List[Dict[str, Any]]:
     """Convert blocks to dictionary format for JSON output."""
     blocks_data: List[Dict[str, Any]] = []
 
     for block in blocks:
-        block_dict = _create_base_block_dict(block)
+        block_dict = _create_base_block_dict(
+            block, evict_entries=evict_closed_entries and not block.is_active
+        )
         _add_optional_block_data(block, block_dict)
         blocks_data.append(block_dict)
 
     return blocks_data
 
 
-def _create_base_block_dict(block: SessionBlock) -> Dict[str, Any]:
-    """Create base block dictionary with required fields."""
-    return {
+def _create_base_block_dict(
+    block: SessionBlock, evict_entries: bool = False
+) -> Dict[str, Any]:
+    """Create base block dictionary with required fields.
+
+    Evicted blocks get an empty entries list and an "entriesEvicted" flag.
+    """
+    block_dict: Dict[str, Any] = {
         "id": block.id,
         "isActive": block.is_active,
         "isGap": block.is_gap,
@@ -198,9 +347,12 @@ def _create_base_block_dict(block: SessionBlock) -> Dict[str, Any]:
         "perModelStats": block.per_model_stats,
         "sentMessagesCount": block.sent_messages_count,
         "durationMinutes": block.duration_minutes,
-        "entries": _format_block_entries(block.entries),
+        "entries": [] if evict_entries else _format_block_entries(block.entries),
         "entries_count": len(block.entries),
     }
+    if evict_entries:
+        block_dict["entriesEvicted"] = True
+    return block_dict
 
 
 def _format_block_entries(entries: List[UsageEntry]) -> List[Dict[str, Any]]:
@@ -221,6 +373,44 @@ def _format_block_entries(entries: List[UsageEntry]) -> List[Dict[str, Any]]:
     ]
 
 
+def select_block_entries(
+    entries: List[UsageEntry], block: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Format the entries that fall within a block's time range.
+
+    Used to reload the entries of a block whose payload was evicted.
+
+    Args:
+        entries: Usage entries the block was built from, sorted by time
+        block: Block dictionary from analyze_usage
+
+    Returns:
+        Entry dictionaries in the same format as the block's "entries"
+    """
+    return select_blocks_entries(entries, [block])[0]
+
+
+def select_blocks_entries(
+    entries: List[UsageEntry], blocks: List[Dict[str, Any]]
+) -> List[List[Dict[str, Any]]]:
+    """Format the entries of several blocks from one pass over the entries.
+
+    Args:
+        entries: Usage entries the blocks were built from, sorted by time
+        blocks: Block dictionaries from analyze_usage
+
+    Returns:
+        Entry dictionaries per block, in the order of ``blocks``
+    """
+    timestamps = [entry.timestamp for entry in entries]
+    result: List[List[Dict[str, Any]]] = []
+    for block in blocks:
+        start = bisect_left(timestamps, datetime.fromisoformat(block["startTime"]))
+        end = bisect_left(timestamps, datetime.fromisoformat(block["endTime"]), start)
+        result.append(_format_block_entries(entries[start:end]))
+    return result
+
+
 def _add_optional_block_data(block: SessionBlock, block_dict: Dict[str, Any]) -> None:
     """Add optional burn rate, projection, and limit data to block dict."""
     if hasattr(block, "burn_rate_snapshot") and block.burn_rate_snapshot:
@@ -32,11 +32,18 @@ class SessionAnalyzer:
         self.session_duration = timedelta(hours=session_duration_hours)
         self.timezone_handler = TimezoneHandler()
 
-    def transform_to_blocks(self, entries: List[UsageEntry]) -> List[SessionBlock]:
+    def transform_to_blocks(
+        self,
+        entries: List[UsageEntry],
+        previous_end_time: Optional[datetime] = None,
+    ) -> List[SessionBlock]:
         """Process entries and create session blocks.
 
         Args:
             entries: List of usage entries to transform
+            previous_end_time: Last entry time of a block preceding entries
+                that is not rebuilt here; a gap block is inserted before the
+                first new block when it follows after a full session
 
         Returns:
             List of session blocks
@@ -47,6 +54,11 @@ class SessionAnalyzer:
         blocks = []
         current_block = None
 
+        if previous_end_time is not None:
+            gap = self._gap_after(previous_end_time, entries[0])
+            if gap:
+                blocks.append(gap)
+
         for entry in entries:
             # Check if we need a new block
             if current_block is None or self._should_create_new_block(
@@ -185,16 +197,21 @@ class SessionAnalyzer:
         """Check for inactivity gap between blocks."""
         if not last_block.actual_end_time:
             return None
+        return self._gap_after(last_block.actual_end_time, next_entry)
 
-        gap_duration = next_entry.timestamp - last_block.actual_end_time
+    def _gap_after(
+        self, end_time: datetime, next_entry: UsageEntry
+    ) -> Optional[SessionBlock]:
+        """Create a gap block if next_entry follows end_time after a session."""
+        gap_duration = next_entry.timestamp - end_time
 
         if gap_duration >= self.session_duration:
-            gap_time_str = last_block.actual_end_time.isoformat()
+            gap_time_str = end_time.isoformat()
             gap_id = f"gap-{gap_time_str}"
 
             return SessionBlock(
                 id=gap_id,
-                start_time=last_block.actual_end_time,
+                start_time=end_time,
                 end_time=next_entry.timestamp,
                 actual_end_time=None,
                 is_gap=True,
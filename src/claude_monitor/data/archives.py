@@ -0,0 +1,176 @@
+"""Reading of compressed, archived transcripts.
+
+Old transcripts may be archived as ``.jsonl.gz``, ``.jsonl.xz`` or
+``.jsonl.zst``. gzip and xz are handled by the standard library; zstd needs
+the optional ``zstandard`` package (or ``compression.zstd`` on Python 3.14+).
+Archives do not change once written, so the lines read from an archive are
+cached by its fingerprint (path, inode, size and mtime) and later one-shot
+loads skip decompression entirely. The incremental reader parses an archive
+only once, so it takes the lines out of the cache instead of retaining them.
+"""
+
+import gzip
+import io
+import logging
+import lzma
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+GZIP_SUFFIX = ".jsonl.gz"
+XZ_SUFFIX = ".jsonl.xz"
+ZSTD_SUFFIX = ".jsonl.zst"
+ARCHIVE_SUFFIXES: Tuple[str, ...] = (GZIP_SUFFIX, XZ_SUFFIX, ZSTD_SUFFIX)
+
+MAX_DECOMPRESS_WORKERS = 4
+
+ArchiveKey = Tuple[Any, ...]
+
+
+def is_archive(path: Path) -> bool:
+    """Check if a transcript path names a compressed archive."""
+    return path.name.endswith(ARCHIVE_SUFFIXES)
+
+
+def open_archive(path: Path) -> IO[bytes]:
+    """Open a compressed transcript as a binary stream of decompressed data.
+
+    Raises:
+        ImportError: If the archive is zstd-compressed and no zstd module is installed
+    """
+    name = path.name
+    if name.endswith(GZIP_SUFFIX):
+        return gzip.open(path, "rb")
+    if name.endswith(XZ_SUFFIX):
+        return lzma.open(path, "rb")
+    if name.endswith(ZSTD_SUFFIX):
+        return _open_zstd(path)
+    raise ValueError(f"Not a compressed transcript: {path}")
+
+
+def _open_zstd(path: Path) -> IO[bytes]:
+    """Open a zstd archive with whichever zstd module is available."""
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd.open(path, "rb")  # type: ignore[no-any-return]
+    except ImportError:
+        pass
+
+    import zstandard
+
+    raw = open(path, "rb")
+    try:
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            raw, read_across_frames=True, closefd=True
+        )
+    except Exception:
+        raw.close()
+        raise
+    return io.BufferedReader(reader)  # type: ignore[arg-type]
+
+
+def archive_fingerprint(path: Path, stat: os.stat_result) -> ArchiveKey:
+    """Identity of an archive's contents for caching."""
+    return (str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class ArchiveLineCache:
+    """LRU cache of lines read from archives, keyed by fingerprint.
+
+    The cache is bounded by the total size of the cached lines, so a few
+    large archives cannot pin an unbounded amount of memory.
+    """
+
+    MAX_BYTES: int = 64 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = MAX_BYTES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum total length of the cached lines
+        """
+        self.max_bytes: int = max_bytes
+        self._lines: "OrderedDict[ArchiveKey, Tuple[List[bytes], int]]" = OrderedDict()
+        self._size: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Get the total length of the cached lines in bytes."""
+        return self._size
+
+    def get(self, key: ArchiveKey) -> Optional[List[bytes]]:
+        """Get cached lines for a key, marking it recently used."""
+        with self._lock:
+            cached = self._lines.get(key)
+            if cached is None:
+                return None
+            self._lines.move_to_end(key)
+            return cached[0]
+
+    def pop(self, key: ArchiveKey) -> Optional[List[bytes]]:
+        """Remove and return cached lines for a key."""
+        with self._lock:
+            cached = self._lines.pop(key, None)
+            if cached is None:
+                return None
+            self._size -= cached[1]
+            return cached[0]
+
+    def put(self, key: ArchiveKey, lines: List[bytes]) -> None:
+        """Store lines for a key, evicting the least recently used archives.
+
+        Lines larger than the whole cache are not stored.
+        """
+        size = sum(len(line) for line in lines)
+        with self._lock:
+            previous = self._lines.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            if size > self.max_bytes:
+                return
+            self._lines[key] = (lines, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._lines.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self) -> None:
+        """Drop all cached archives."""
+        with self._lock:
+            self._lines.clear()
+            self._size = 0
+
+
+archive_cache = ArchiveLineCache()
+
+
+def prefetch_archives(jobs: Dict[ArchiveKey, Callable[[], List[bytes]]]) -> None:
+    """Decompress uncached archives concurrently and store them in the cache.
+
+    zlib and lzma release the GIL while decompressing, so several archives
+    are read in parallel threads.
+
+    Args:
+        jobs: Functions reading the lines of each archive, keyed by cache key
+    """
+    missing = [key for key in jobs if archive_cache.get(key) is None]
+    if len(missing) < 2:
+        return
+
+    def _read(key: ArchiveKey) -> None:
+        try:
+            archive_cache.put(key, jobs[key]())
+        except Exception as e:
+            # Reported again by the sequential read that follows
+            logger.debug(f"Prefetch of archive {key[0]} failed: {e}")
+
+    workers = min(MAX_DECOMPRESS_WORKERS, len(missing))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_read, missing))
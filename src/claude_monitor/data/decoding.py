@@ -0,0 +1,233 @@
+"""Pluggable JSON decoding backends for transcript lines.
+
+Transcript lines carry full message content, often large ``tool_result``
+arrays, while usage tracking only needs a handful of fields. The stdlib
+decoder is always available; ``orjson`` and ``msgspec`` are used when
+installed. The msgspec backend decodes usage lines into a typed struct, so
+unused fields are skipped without being materialized as Python objects.
+Other backends hand oversized lines to the streaming field extractor.
+
+Every backend raises ``ValueError`` for malformed input.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from claude_monitor.data.streaming import FieldSchema, extract_fields
+
+logger = logging.getLogger(__name__)
+
+DECODER_ENV_VAR = "CLAUDE_MONITOR_JSON_DECODER"
+
+# Preference order used when no backend is requested explicitly
+AUTO_BACKENDS: Tuple[str, ...] = ("msgspec", "orjson", "stdlib")
+
+JsonInput = Union[str, bytes]
+
+_TOKEN_FIELDS: Tuple[str, ...] = (
+    "input_tokens",
+    "output_tokens",
+    "inputTokens",
+    "outputTokens",
+    "prompt_tokens",
+    "completion_tokens",
+    "cache_creation_tokens",
+    "cache_creation_input_tokens",
+    "cacheCreationInputTokens",
+    "cache_read_tokens",
+    "cache_read_input_tokens",
+    "cacheReadInputTokens",
+)
+
+# Fields read by the usage mappers; None decodes the value, a nested schema
+# selects fields of an object value
+ENTRY_FIELDS: FieldSchema = {
+    "type": None,
+    "timestamp": None,
+    "message": {"id": None, "model": None, "usage": None},
+    "message_id": None,
+    "requestId": None,
+    "request_id": None,
+    "costUSD": None,
+    "cost": None,
+    "cost_usd": None,
+    "model": None,
+    "Model": None,
+    "usage": None,
+    "request": {"model": None},
+    **{field: None for field in _TOKEN_FIELDS},
+}
+
+# Lines at least this long are decoded with the streaming field extractor
+STREAMING_THRESHOLD = 256 * 1024
+
+
+class JsonDecoder:
+    """Standard library decoder and base class for faster backends."""
+
+    name: str = "stdlib"
+    streaming_threshold: Optional[int] = STREAMING_THRESHOLD
+
+    def loads(self, data: JsonInput) -> Any:
+        """Decode a complete JSON document.
+
+        Args:
+            data: JSON text or UTF-8 bytes
+
+        Returns:
+            Decoded Python object
+        """
+        return json.loads(data)
+
+    def loads_entry(self, data: JsonInput) -> Any:
+        """Decode a transcript line, possibly omitting fields unused for usage.
+
+        The result contains at least the fields listed in ``ENTRY_FIELDS``.
+        Lines needed verbatim (for example limit messages) must use
+        :meth:`loads`. Objects longer than ``streaming_threshold`` are scanned
+        for those fields instead of being decoded in full.
+
+        Args:
+            data: JSON text or UTF-8 bytes
+
+        Returns:
+            Decoded Python object
+        """
+        if (
+            self.streaming_threshold is not None
+            and len(data) >= self.streaming_threshold
+            and data.lstrip()[:1] in ("{", b"{")
+        ):
+            return extract_fields(data, ENTRY_FIELDS)
+        return self.loads(data)
+
+
+class OrjsonDecoder(JsonDecoder):
+    """Decoder backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Import orjson, raising ImportError if it is not installed."""
+        import orjson
+
+        self._loads: Callable[[JsonInput], Any] = orjson.loads
+
+    def loads(self, data: JsonInput) -> Any:
+        """Decode a complete JSON document with orjson."""
+        return self._loads(data)
+
+
+class MsgspecDecoder(JsonDecoder):
+    """Decoder backed by msgspec with a field-selective entry schema."""
+
+    name = "msgspec"
+    # msgspec already skips unused values without allocating them
+    streaming_threshold = None
+
+    def __init__(self) -> None:
+        """Import msgspec, raising ImportError if it is not installed."""
+        import msgspec
+
+        self._msgspec = msgspec
+        self._unset = msgspec.UNSET
+        self._decoder = msgspec.json.Decoder()
+        self._entry_decoder = msgspec.json.Decoder(
+            _struct_type(msgspec, "TranscriptEntry", ENTRY_FIELDS)
+        )
+
+    def loads(self, data: JsonInput) -> Any:
+        """Decode a complete JSON document with msgspec."""
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def loads_entry(self, data: JsonInput) -> Any:
+        """Decode only usage-related fields of a transcript line.
+
+        Lines that do not match the entry schema (for example a ``message``
+        that is a plain string) are decoded in full instead.
+        """
+        try:
+            entry = self._entry_decoder.decode(data)
+        except self._msgspec.ValidationError:
+            return self.loads(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+        return self._to_dict(entry)
+
+    def _to_dict(self, struct: Any) -> Dict[str, Any]:
+        """Convert a decoded struct to a dict, dropping absent fields."""
+        result: Dict[str, Any] = {}
+        for field in struct.__struct_fields__:
+            value = getattr(struct, field)
+            if value is self._unset:
+                continue
+            if isinstance(value, self._msgspec.Struct):
+                value = self._to_dict(value)
+            result[field] = value
+        return result
+
+
+def _struct_type(msgspec: Any, name: str, schema: FieldSchema) -> Type[Any]:
+    """Build a msgspec struct type with the fields of a schema.
+
+    Built lazily so that msgspec is only imported when it is selected. Every
+    field is optional and nested schemas become nested structs.
+    """
+    fields: List[Tuple[str, Any, Any]] = []
+    for field, nested in schema.items():
+        value_type = (
+            Any if nested is None else _struct_type(msgspec, f"{name}_{field}", nested)
+        )
+        fields.append((field, Union[value_type, msgspec.UnsetType], msgspec.UNSET))
+    return msgspec.defstruct(name, fields)
+
+
+DECODER_BACKENDS: Dict[str, Type[JsonDecoder]] = {
+    "stdlib": JsonDecoder,
+    "orjson": OrjsonDecoder,
+    "msgspec": MsgspecDecoder,
+}
+
+_decoders: Dict[str, JsonDecoder] = {}
+
+
+def get_decoder(name: Optional[str] = None) -> JsonDecoder:
+    """Get a JSON decoder backend.
+
+    Args:
+        name: Backend name ("stdlib", "orjson", "msgspec" or "auto"). Defaults
+            to the CLAUDE_MONITOR_JSON_DECODER environment variable, then "auto",
+            which picks the fastest installed backend.
+
+    Returns:
+        Shared decoder instance
+    """
+    name = (name or os.environ.get(DECODER_ENV_VAR) or "auto").strip().lower()
+    decoder = _decoders.get(name)
+    if decoder is not None:
+        return decoder
+
+    if name in DECODER_BACKENDS:
+        candidates: Tuple[str, ...] = (name, "stdlib")
+    else:
+        if name != "auto":
+            logger.warning("Unknown JSON decoder %r, selecting automatically", name)
+        candidates = AUTO_BACKENDS
+
+    decoder = JsonDecoder()
+    for candidate in candidates:
+        try:
+            decoder = DECODER_BACKENDS[candidate]()
+            break
+        except ImportError:
+            if candidate == name:
+                logger.warning("JSON decoder %r is not installed, using stdlib", name)
+
+    logger.debug("Using %s JSON decoder", decoder.name)
+    _decoders[name] = decoder
+    return decoder
@@ -0,0 +1,125 @@
+"""Compact deduplication index for usage entries.
+
+Claude transcripts repeat the same assistant message across resumed and
+forked sessions, so every loaded entry is checked against the message and
+request ids seen so far. Storing those ids as ``"message_id:request_id"``
+strings costs well over 100 bytes per entry; this index stores fixed-width
+64-bit digests in a sorted array instead.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterator, Optional, Set, Union
+
+DedupKey = Union[str, int]
+
+_DIGEST_MASK = (1 << 64) - 1
+
+
+class DedupIndex:
+    """Set of 64-bit entry digests kept in a sorted array.
+
+    New digests go to a small pending set that is merged into the sorted
+    array once it grows past a fraction of the array, so inserts stay
+    amortized O(1) and lookups are a set probe plus a binary search. An
+    optional Bloom filter answers most lookups of unseen entries without
+    touching either structure.
+    """
+
+    MIN_PENDING: int = 4096
+    BLOOM_HASHES: int = 3
+
+    def __init__(self, bloom_bits: int = 0) -> None:
+        """Initialize an empty index.
+
+        Args:
+            bloom_bits: Size of the optional Bloom prefilter in bits (0 disables it)
+        """
+        self._sorted: array = array("Q")
+        self._pending: Set[int] = set()
+        self._bloom_bits: int = bloom_bits
+        self._bloom: Optional[bytearray] = (
+            bytearray((bloom_bits + 7) // 8) if bloom_bits > 0 else None
+        )
+
+    @staticmethod
+    def digest(key: str) -> int:
+        """Compute the 64-bit digest of a deduplication key.
+
+        Uses the interpreter's string hash, which is randomized per process,
+        so digests must not be stored outside the process that computed them.
+        """
+        return hash(key) & _DIGEST_MASK
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a key (string or precomputed digest) was added."""
+        if isinstance(key, str):
+            key = self.digest(key)
+        elif not isinstance(key, int):
+            return False
+        return self._contains_digest(key)
+
+    def __len__(self) -> int:
+        """Number of distinct digests in the index."""
+        return len(self._sorted) + len(self._pending)
+
+    def add(self, key: DedupKey) -> None:
+        """Add a key (string or precomputed digest) to the index."""
+        value = self.digest(key) if isinstance(key, str) else key
+        if self._contains_digest(value):
+            return
+        self._pending.add(value)
+        if self._bloom is not None:
+            self._bloom_add(value)
+        if len(self._pending) >= max(self.MIN_PENDING, len(self._sorted) // 4):
+            self._compact()
+
+    def clear(self) -> None:
+        """Remove all digests."""
+        self._sorted = array("Q")
+        self._pending = set()
+        if self._bloom is not None:
+            self._bloom = bytearray(len(self._bloom))
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the sorted array and Bloom filter."""
+        bloom_size = len(self._bloom) if self._bloom is not None else 0
+        return self._sorted.itemsize * len(self._sorted) + bloom_size
+
+    def _contains_digest(self, value: int) -> bool:
+        """Check if a digest is in the pending set or the sorted array."""
+        if value in self._pending:
+            return True
+        if self._bloom is not None and not self._bloom_contains(value):
+            return False
+        index = bisect_left(self._sorted, value)
+        return index < len(self._sorted) and self._sorted[index] == value
+
+    def _compact(self) -> None:
+        """Merge pending digests into the sorted array."""
+        merged = self._sorted.tolist()
+        merged.extend(self._pending)
+        # Timsort merges the two presorted runs in linear time
+        merged.sort()
+        self._sorted = array("Q", merged)
+        self._pending = set()
+
+    def _bloom_positions(self, value: int) -> Iterator[int]:
+        """Yield Bloom filter bit positions using double hashing."""
+        low = value & 0xFFFFFFFF
+        high = (value >> 32) | 1
+        for i in range(self.BLOOM_HASHES):
+            yield (low + i * high) % self._bloom_bits
+
+    def _bloom_add(self, value: int) -> None:
+        """Set the Bloom filter bits of a digest."""
+        for position in self._bloom_positions(value):
+            self._bloom[position >> 3] |= 1 << (position & 7)  # type: ignore[index]
+
+    def _bloom_contains(self, value: int) -> bool:
+        """Check if all Bloom filter bits of a digest are set."""
+        return all(
+            self._bloom[position >> 3] & (1 << (position & 7))  # type: ignore[index]
+            for position in self._bloom_positions(value)
+        )
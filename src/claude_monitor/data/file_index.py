@@ -0,0 +1,127 @@
+"""Cached discovery of transcript files under a Claude data directory.
+
+Walking every project directory with ``rglob`` on each refresh costs one
+directory listing per folder, which adds up on network home directories.
+:class:`TranscriptFileIndex` remembers each directory's listing together with
+its mtime and only lists a directory again once its mtime changes. Adding or
+removing an entry changes the mtime of the containing directory, so a
+refresh of an unchanged tree costs one ``stat`` per directory and per
+transcript file.
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from claude_monitor.data.archives import ARCHIVE_SUFFIXES
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_SUFFIXES: Tuple[str, ...] = (".jsonl",) + ARCHIVE_SUFFIXES
+
+# Listings taken within this window of a directory's mtime are not trusted,
+# because a later change in the same timestamp tick would go unnoticed
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class _DirectoryListing:
+    """Cached contents of one directory."""
+
+    mtime_ns: int
+    subdirs: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+    racy: bool = False
+
+
+class TranscriptFileIndex:
+    """Directory tree cache of transcript files with their stat results."""
+
+    def __init__(
+        self, root: Path, suffixes: Tuple[str, ...] = TRANSCRIPT_SUFFIXES
+    ) -> None:
+        """Initialize an index for a directory tree.
+
+        Args:
+            root: Directory to search recursively
+            suffixes: File name suffixes of transcript files
+        """
+        self.root: Path = root
+        self.suffixes: Tuple[str, ...] = suffixes
+        self._listings: Dict[str, _DirectoryListing] = {}
+        self.directories_listed: int = 0
+
+    def scan(self) -> Dict[Path, os.stat_result]:
+        """Find transcript files, re-listing only directories that changed.
+
+        Returns:
+            Mapping of transcript file path to its current stat result
+        """
+        now_ns = time.time_ns()
+        listings: Dict[str, _DirectoryListing] = {}
+        files: Dict[Path, os.stat_result] = {}
+        self.directories_listed = 0
+
+        stack = [str(self.root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+
+            listing = self._listings.get(directory)
+            if listing is None or listing.racy or listing.mtime_ns != mtime_ns:
+                listing = self._list_directory(directory, mtime_ns, now_ns, files)
+                if listing is None:
+                    continue
+            else:
+                for name in listing.files:
+                    path = os.path.join(directory, name)
+                    try:
+                        files[Path(path)] = os.stat(path)
+                    except OSError:
+                        continue
+
+            listings[directory] = listing
+            stack.extend(os.path.join(directory, name) for name in listing.subdirs)
+
+        self._listings = listings
+        return files
+
+    def clear(self) -> None:
+        """Forget all cached listings."""
+        self._listings = {}
+
+    def _list_directory(
+        self,
+        directory: str,
+        mtime_ns: int,
+        now_ns: int,
+        files: Dict[Path, os.stat_result],
+    ) -> Optional[_DirectoryListing]:
+        """List a directory, adding its transcript files to files."""
+        listing = _DirectoryListing(
+            mtime_ns=mtime_ns, racy=now_ns - mtime_ns < _RACY_WINDOW_NS
+        )
+        try:
+            scanner = os.scandir(directory)
+        except OSError as e:
+            logger.debug(f"Cannot list {directory}: {e}")
+            return None
+
+        self.directories_listed += 1
+        with scanner:
+            for entry in scanner:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        listing.subdirs.append(entry.name)
+                    elif entry.name.endswith(self.suffixes) and entry.is_file():
+                        files[Path(entry.path)] = entry.stat()
+                        listing.files.append(entry.name)
+                except OSError:
+                    continue
+        return listing
@@ -4,12 +4,33 @@ Combines functionality from file_reader, filter, mapper, and processor
 into a single cohesive module.
 """
 
-import json
+import functools
+import heapq
 import logging
+import mmap
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from datetime import timezone as tz
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from claude_monitor.core.data_processors import (
     DataConverter,
@@ -18,6 +39,17 @@ from claude_monitor.core.data_processors import (
 )
 from claude_monitor.core.models import CostMode, UsageEntry
 from claude_monitor.core.pricing import PricingCalculator
+from claude_monitor.data.archives import (
+    ArchiveKey,
+    archive_cache,
+    archive_fingerprint,
+    is_archive,
+    open_archive,
+    prefetch_archives,
+)
+from claude_monitor.data.decoding import get_decoder
+from claude_monitor.data.dedup import DedupIndex, DedupKey
+from claude_monitor.data.file_index import TranscriptFileIndex
 from claude_monitor.error_handling import report_file_error
 from claude_monitor.utils.time_utils import TimezoneHandler
 
@@ -26,11 +58,21 @@ FIELD_MODEL = "model"
 TOKEN_INPUT = "input_tokens"
 TOKEN_OUTPUT = "output_tokens"
 
+_LIMIT_REACHED_PATTERN = re.compile(rb"(?i)limit reached")
+# Lines that may map to a usage entry (token fields) or feed limit detection;
+# anything else is skipped without being copied out of the file buffer
+_CANDIDATE_LINE_PATTERN = re.compile(rb'(?i)tokens"|"system"|limit reached')
+
+# Transcript lines longer than this are skipped without being read whole
+MAX_LINE_BYTES_ENV_VAR = "CLAUDE_MONITOR_MAX_LINE_BYTES"
+DEFAULT_MAX_LINE_BYTES = 64 * 1024 * 1024
+_DISCARD_CHUNK_SIZE = 1024 * 1024
+
 logger = logging.getLogger(__name__)
 
 
 def load_usage_entries(
-    data_path: Optional[str] = None,
+    data_path: Optional[Union[str, Sequence[str]]] = None,
     hours_back: Optional[int] = None,
     mode: CostMode = CostMode.AUTO,
     include_raw: bool = False,
@@ -38,7 +80,8 @@ def load_usage_entries(
     """Load and convert JSONL files to UsageEntry objects.
 
     Args:
-        data_path: Path to Claude data directory (defaults to ~/.claude/projects)
+        data_path: Path to Claude data directory (defaults to ~/.claude/projects),
+            or a list of directories that are read concurrently and deduplicated
         hours_back: Only include entries from last N hours
         mode: Cost calculation mode
         include_raw: Whether to return raw JSON data alongside entries
@@ -46,6 +89,11 @@ def load_usage_entries(
     Returns:
         Tuple of (usage_entries, raw_data) where raw_data is None unless include_raw=True
     """
+    if data_path is not None and not isinstance(data_path, str):
+        return MultiRootUsageReader(data_path, mode).load(
+            hours_back=hours_back, include_raw=include_raw
+        )
+
     data_path = Path(data_path if data_path else "~/.claude/projects").expanduser()
     timezone_handler = TimezoneHandler()
     pricing_calculator = PricingCalculator()
@@ -59,9 +107,15 @@ def load_usage_entries(
         logger.warning("No JSONL files found in %s", data_path)
         return [], None
 
+    _prefetch_archives(
+        {path: path.stat() for path in jsonl_files if is_archive(path)},
+        max_line_bytes(),
+        candidates_only=not include_raw,
+    )
+
     all_entries: List[UsageEntry] = []
     raw_entries: Optional[List[Dict[str, Any]]] = [] if include_raw else None
-    processed_hashes: Set[str] = set()
+    processed_hashes = DedupIndex()
 
     for file_path in jsonl_files:
         entries, raw_data = _process_single_file(
@@ -96,17 +150,23 @@ def load_all_raw_entries(data_path: Optional[str] = None) -> List[Dict[str, Any]
     data_path = Path(data_path if data_path else "~/.claude/projects").expanduser()
     jsonl_files = _find_jsonl_files(data_path)
 
+    decoder = get_decoder()
     all_raw_entries: List[Dict[str, Any]] = []
     for file_path in jsonl_files:
         try:
-            with open(file_path, encoding="utf-8") as f:
-                for line in f:
+            f: IO[Any] = (
+                open_archive(file_path)
+                if is_archive(file_path)
+                else open(file_path, encoding="utf-8")
+            )
+            with f:
+                for line in _iter_lines(f, max_line_bytes()):
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        all_raw_entries.append(json.loads(line))
-                    except json.JSONDecodeError:
+                        all_raw_entries.append(decoder.loads(line))
+                    except ValueError:
                         continue
         except Exception as e:
             logger.exception(f"Error loading raw entries from {file_path}: {e}")
@@ -114,19 +174,196 @@ def load_all_raw_entries(data_path: Optional[str] = None) -> List[Dict[str, Any]
     return all_raw_entries
 
 
+def max_line_bytes() -> int:
+    """Get the transcript line size limit from the environment."""
+    value = os.environ.get(MAX_LINE_BYTES_ENV_VAR)
+    if value:
+        try:
+            return max(int(value), 1)
+        except ValueError:
+            logger.warning(
+                "Invalid %s=%r, using default", MAX_LINE_BYTES_ENV_VAR, value
+            )
+    return DEFAULT_MAX_LINE_BYTES
+
+
+def _iter_lines(f: IO[Any], max_length: int) -> Iterator[Any]:
+    """Yield lines of a text or binary file, skipping oversized lines.
+
+    Lines longer than max_length (characters in text mode, bytes in binary
+    mode) are consumed in bounded chunks and never held in memory whole.
+    Yielded lines keep their trailing newline; only the last line of the
+    file may lack one.
+    """
+    while True:
+        line = f.readline(max_length + 1)
+        if not line:
+            return
+        newline = b"\n" if isinstance(line, bytes) else "\n"
+        if len(line) <= max_length or line.endswith(newline):
+            yield line
+            continue
+
+        skipped = len(line)
+        while line and not line.endswith(newline):
+            line = f.readline(_DISCARD_CHUNK_SIZE)
+            skipped += len(line)
+        logger.debug(f"Skipped oversized transcript line of {skipped} bytes")
+
+
+def _scan_lines(
+    f: BinaryIO,
+    offset: int,
+    max_length: int,
+    pattern: Optional[Pattern[bytes]] = None,
+) -> Tuple[List[bytes], Optional[bytes], int]:
+    """Slice lines from a binary file through a memory map.
+
+    Newlines are located directly in the mapped buffer, so only lines that
+    match pattern are copied out; other lines and lines longer than
+    max_length are skipped without allocation.
+
+    Args:
+        f: File opened in binary mode
+        offset: Byte position to start scanning from
+        max_length: Longest line to return, in bytes
+        pattern: Only return lines matching this pattern (all lines if None)
+
+    Returns:
+        Tuple of (lines, tail, end): the selected complete lines without their
+        newline, the trailing bytes after the last newline (None when empty
+        or oversized) and the position just past the last complete line, or
+        the end of file when an oversized tail was skipped
+    """
+    size = os.fstat(f.fileno()).st_size
+    if size <= offset:
+        return [], None, offset
+
+    try:
+        buffer: Any = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Filesystems without mmap support fall back to a plain read
+        f.seek(0)
+        buffer = f.read()
+
+    try:
+        size = len(buffer)
+        lines: List[bytes] = []
+        position = offset
+        while True:
+            end = buffer.find(b"\n", position)
+            if end < 0:
+                break
+            if end - position > max_length:
+                logger.debug(
+                    f"Skipped oversized transcript line of {end - position} bytes"
+                )
+            elif pattern is None or pattern.search(buffer, position, end):
+                lines.append(buffer[position:end])
+            position = end + 1
+
+        if position == size:
+            return lines, None, position
+        if size - position > max_length:
+            logger.debug("Skipped oversized trailing transcript line")
+            return lines, None, size
+        return lines, buffer[position:size], position
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+def _archive_key(
+    file_path: Path, stat: os.stat_result, max_length: int, candidates_only: bool
+) -> ArchiveKey:
+    """Cache key of the lines read from an archive with given settings."""
+    return archive_fingerprint(file_path, stat) + (max_length, candidates_only)
+
+
+def _decompress_lines(
+    file_path: Path, max_length: int, candidates_only: bool
+) -> List[bytes]:
+    """Read the lines of a compressed transcript, without their newlines."""
+    lines: List[bytes] = []
+    with open_archive(file_path) as stream:
+        for line in _iter_lines(stream, max_length):
+            line = line.rstrip(b"\r\n")
+            if not candidates_only or _CANDIDATE_LINE_PATTERN.search(line):
+                lines.append(line)
+    return lines
+
+
+def _read_archive_lines(
+    file_path: Path,
+    stat: os.stat_result,
+    max_length: int,
+    candidates_only: bool,
+    retain: bool = True,
+) -> List[bytes]:
+    """Read the lines of a compressed transcript through the archive cache.
+
+    Args:
+        file_path: Archive path
+        stat: Stat result of the archive
+        max_length: Longest line to keep, in bytes
+        candidates_only: Keep only lines that may hold usage data
+        retain: Keep the lines cached for later loads; readers that parse an
+            archive only once take prefetched lines out of the cache instead
+
+    Returns:
+        Lines of the archive without line endings
+    """
+    key = _archive_key(file_path, stat, max_length, candidates_only)
+    lines = archive_cache.get(key) if retain else archive_cache.pop(key)
+    if lines is None:
+        lines = _decompress_lines(file_path, max_length, candidates_only)
+        if retain:
+            archive_cache.put(key, lines)
+    return lines
+
+
+def _prefetch_archives(
+    file_stats: Dict[Path, os.stat_result], max_length: int, candidates_only: bool
+) -> None:
+    """Decompress the archives among file_stats in parallel."""
+    prefetch_archives(
+        {
+            _archive_key(path, stat, max_length, candidates_only): functools.partial(
+                _decompress_lines, path, max_length, candidates_only
+            )
+            for path, stat in file_stats.items()
+            if is_archive(path)
+        }
+    )
+
+
 def _find_jsonl_files(data_path: Path) -> List[Path]:
-    """Find all .jsonl files in the data directory."""
+    """Find all transcript files, including archives, in the data directory."""
     if not data_path.exists():
         logger.warning("Data path does not exist: %s", data_path)
         return []
-    return list(data_path.rglob("*.jsonl"))
+    return list(TranscriptFileIndex(data_path).scan())
+
+
+def _recently_modified(
+    file_stats: Dict[Path, os.stat_result], hours: float
+) -> List[Path]:
+    """Filter files to those modified within the last N hours, newest first."""
+    cutoff = time.time() - hours * 3600
+    recent = [
+        (stat.st_mtime, file_path)
+        for file_path, stat in file_stats.items()
+        if stat.st_mtime >= cutoff
+    ]
+    recent.sort(key=lambda item: item[0], reverse=True)
+    return [file_path for _, file_path in recent]
 
 
 def _process_single_file(
     file_path: Path,
     mode: CostMode,
     cutoff_time: Optional[datetime],
-    processed_hashes: Set[str],
+    processed_hashes: Union[Set[str], DedupIndex],
     include_raw: bool,
     timezone_handler: TimezoneHandler,
     pricing_calculator: PricingCalculator,
@@ -134,42 +371,72 @@ def _process_single_file(
     """Process a single JSONL file."""
     entries: List[UsageEntry] = []
     raw_data: Optional[List[Dict[str, Any]]] = [] if include_raw else None
+    decoder = get_decoder()
+    # Raw output keeps whole entries; otherwise unused fields may be skipped
+    decode = decoder.loads if include_raw else decoder.loads_entry
 
     try:
         entries_read = 0
         entries_filtered = 0
         entries_mapped = 0
 
-        with open(file_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        # Raw output needs every line; usage entries only candidate lines
+        if is_archive(file_path):
+            lines = _read_archive_lines(
+                file_path,
+                file_path.stat(),
+                max_line_bytes(),
+                candidates_only=not include_raw,
+            )
+        else:
+            with open(file_path, "rb") as f:
+                lines, tail, _ = _scan_lines(
+                    f,
+                    0,
+                    max_line_bytes(),
+                    None if include_raw else _CANDIDATE_LINE_PATTERN,
+                )
+            if tail is not None and (
+                include_raw or _CANDIDATE_LINE_PATTERN.search(tail)
+            ):
+                lines.append(tail)
 
-                try:
-                    data = json.loads(line)
-                    entries_read += 1
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
 
-                    if not _should_process_entry(
-                        data, cutoff_time, processed_hashes, timezone_handler
-                    ):
-                        entries_filtered += 1
-                        continue
+            try:
+                data = decode(line)
+                entries_read += 1
+
+                dedup_key = _create_dedup_key(data, processed_hashes)
+                if not _should_process_entry(
+                    data,
+                    cutoff_time,
+                    processed_hashes,
+                    timezone_handler,
+                    unique_hash=dedup_key,
+                ):
+                    entries_filtered += 1
+                    continue
 
-                    entry = _map_to_usage_entry(
-                        data, mode, timezone_handler, pricing_calculator
+                entry = _map_to_usage_entry(
+                    data, mode, timezone_handler, pricing_calculator
+                )
+                if entry:
+                    entries_mapped += 1
+                    entries.append(entry)
+                    _update_processed_hashes(
+                        data, processed_hashes, unique_hash=dedup_key
                     )
-                    if entry:
-                        entries_mapped += 1
-                        entries.append(entry)
-                        _update_processed_hashes(data, processed_hashes)
 
-                    if include_raw:
-                        raw_data.append(data)
+                if include_raw:
+                    raw_data.append(data)
 
-                except json.JSONDecodeError as e:
-                    logger.debug(f"Failed to parse JSON line in {file_path}: {e}")
-                    continue
+            except ValueError as e:
+                logger.debug(f"Failed to parse JSON line in {file_path}: {e}")
+                continue
 
         logger.debug(
             f"File {file_path.name}: {entries_read} read, "
@@ -192,10 +459,19 @@ def _process_single_file(
 def _should_process_entry(
     data: Dict[str, Any],
     cutoff_time: Optional[datetime],
-    processed_hashes: Set[str],
+    processed_hashes: Union[Set[str], DedupIndex],
     timezone_handler: TimezoneHandler,
+    unique_hash: Optional[DedupKey] = None,
 ) -> bool:
-    """Check if entry should be processed based on time and uniqueness."""
+    """Check if entry should be processed based on time and uniqueness.
+
+    Args:
+        data: Raw transcript entry
+        cutoff_time: Skip entries older than this
+        processed_hashes: Keys or digests of entries already processed
+        timezone_handler: Handler used to parse the timestamp
+        unique_hash: Precomputed key or digest; derived from data if omitted
+    """
     if cutoff_time:
         timestamp_str = data.get("timestamp")
         if timestamp_str:
@@ -204,7 +480,8 @@ def _should_process_entry(
             if timestamp and timestamp < cutoff_time:
                 return False
 
-    unique_hash = _create_unique_hash(data)
+    if unique_hash is None:
+        unique_hash = _create_unique_hash(data)
     return not (unique_hash and unique_hash in processed_hashes)
 
 
@@ -217,12 +494,34 @@ def _create_unique_hash(data: Dict[str, Any]) -> Optional[str]:
     )
     request_id = data.get("requestId") or data.get("request_id")
 
+    return _format_unique_hash(message_id, request_id)
+
+
+def _format_unique_hash(
+    message_id: Optional[str], request_id: Optional[str]
+) -> Optional[str]:
+    """Format the deduplication key shared by raw entries and UsageEntry objects."""
     return f"{message_id}:{request_id}" if message_id and request_id else None
 
 
-def _update_processed_hashes(data: Dict[str, Any], processed_hashes: Set[str]) -> None:
-    """Update the processed hashes set with current entry's hash."""
+def _create_dedup_key(
+    data: Dict[str, Any], processed_hashes: Union[Set[str], DedupIndex]
+) -> Optional[DedupKey]:
+    """Compute an entry's deduplication key once, as a digest for DedupIndex."""
     unique_hash = _create_unique_hash(data)
+    if unique_hash and isinstance(processed_hashes, DedupIndex):
+        return DedupIndex.digest(unique_hash)
+    return unique_hash
+
+
+def _update_processed_hashes(
+    data: Dict[str, Any],
+    processed_hashes: Union[Set[str], DedupIndex],
+    unique_hash: Optional[DedupKey] = None,
+) -> None:
+    """Update the processed hashes set with current entry's hash."""
+    if unique_hash is None:
+        unique_hash = _create_unique_hash(data)
     if unique_hash:
         processed_hashes.add(unique_hash)
 
@@ -277,6 +576,303 @@ def _map_to_usage_entry(
         return None
 
 
+def _is_limit_candidate(data: Dict[str, Any], line: bytes) -> bool:
+    """Check if a raw entry may carry a limit message for limit detection."""
+    entry_type = data.get("type")
+    if entry_type == "system":
+        return True
+    return entry_type == "user" and bool(_LIMIT_REACHED_PATTERN.search(line))
+
+
+@dataclass
+class _FileState:
+    """Read position and identity of a tracked JSONL file."""
+
+    offset: int = 0
+    inode: int = 0
+
+
+class IncrementalUsageReader:
+    """Stateful reader that only parses bytes appended since the previous load.
+
+    Claude transcripts are append-only, so the reader remembers a byte offset
+    per file together with the deduplication hashes and already mapped
+    entries. Repeated loads therefore cost O(new data) instead of re-parsing
+    the whole history. A truncated, replaced or deleted file resets the state
+    and triggers a full reload on the next call.
+    """
+
+    def __init__(
+        self, data_path: Optional[str] = None, mode: CostMode = CostMode.AUTO
+    ) -> None:
+        """Initialize reader for a Claude data directory.
+
+        Args:
+            data_path: Path to Claude data directory (defaults to ~/.claude/projects)
+            mode: Cost calculation mode
+        """
+        self.data_path: Path = Path(
+            data_path if data_path else "~/.claude/projects"
+        ).expanduser()
+        self.mode: CostMode = mode
+        self._timezone_handler = TimezoneHandler()
+        self._pricing_calculator = PricingCalculator()
+        self.max_line_bytes: int = max_line_bytes()
+        self._file_index = TranscriptFileIndex(self.data_path)
+        self._decoder = get_decoder()
+        self._lock = threading.Lock()
+        self._hours_back: Optional[int] = None
+        # Incremented by reset(); a change means entries were reloaded
+        self.generation: int = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all incremental state so the next load starts from scratch."""
+        self._files: Dict[Path, _FileState] = {}
+        self._entries: List[UsageEntry] = []
+        self._raw_entries: List[Tuple[Optional[datetime], Dict[str, Any]]] = []
+        self._processed_hashes: DedupIndex = DedupIndex()
+        self.last_bytes_read: int = 0
+        self.last_new_entries: List[UsageEntry] = []
+        self.generation += 1
+
+    def load(
+        self,
+        hours_back: Optional[int] = None,
+        include_raw: bool = False,
+        recent_hours: Optional[float] = None,
+    ) -> Tuple[List[UsageEntry], Optional[List[Dict[str, Any]]]]:
+        """Load usage entries, parsing only data appended since the last call.
+
+        Args:
+            hours_back: Only include entries from last N hours
+            include_raw: Whether to return raw entries relevant for limit detection
+            recent_hours: Only read files modified within the last N hours.
+                Skipped files are picked up from the start by the next load
+                without this limit, so a quick partial load followed by a
+                full one parses every file once.
+
+        Returns:
+            Tuple of (usage_entries, raw_data) where raw_data is None unless include_raw=True
+        """
+        with self._lock:
+            if hours_back != self._hours_back:
+                self.reset()
+                self._hours_back = hours_back
+
+            cutoff_time = None
+            if hours_back:
+                cutoff_time = datetime.now(tz.utc) - timedelta(hours=hours_back)
+
+            file_stats = self._scan_files()
+            if self._has_rotated_files(file_stats):
+                logger.info("Transcript files were replaced, reloading usage data")
+                self.reset()
+
+            files_to_read = list(file_stats)
+            if recent_hours is not None:
+                files_to_read = _recently_modified(file_stats, recent_hours)
+
+            _prefetch_archives(
+                {
+                    path: file_stats[path]
+                    for path in files_to_read
+                    if is_archive(path) and path not in self._files
+                },
+                self.max_line_bytes,
+                candidates_only=True,
+            )
+
+            self.last_bytes_read = 0
+            new_entries: List[UsageEntry] = []
+            for file_path in files_to_read:
+                new_entries.extend(
+                    self._read_appended(file_path, cutoff_time, file_stats[file_path])
+                )
+
+            self.last_new_entries = new_entries
+            if new_entries:
+                self._entries.extend(new_entries)
+                self._entries.sort(key=lambda e: e.timestamp)
+
+            if cutoff_time:
+                self._prune(cutoff_time)
+
+            logger.debug(
+                f"Incremental load: {len(new_entries)} new entries, "
+                f"{self.last_bytes_read} bytes read from {len(files_to_read)} files"
+            )
+
+            raw_entries = (
+                [data for _, data in self._raw_entries] if include_raw else None
+            )
+            return list(self._entries), raw_entries
+
+    def _scan_files(self) -> Dict[Path, os.stat_result]:
+        """Find transcript files and their stat results via the cached index."""
+        if not self.data_path.exists():
+            logger.warning("Data path does not exist: %s", self.data_path)
+            return {}
+        return self._file_index.scan()
+
+    def _has_rotated_files(self, file_stats: Dict[Path, os.stat_result]) -> bool:
+        """Check if any tracked file disappeared, shrank or was replaced."""
+        for file_path, state in self._files.items():
+            stat = file_stats.get(file_path)
+            if stat is None:
+                return True
+            if stat.st_ino != state.inode or stat.st_size < state.offset:
+                return True
+            # Archives are read whole, so any rewrite means a reload
+            if is_archive(file_path) and state.offset and stat.st_size != state.offset:
+                return True
+        return False
+
+    def _read_appended(
+        self,
+        file_path: Path,
+        cutoff_time: Optional[datetime],
+        stat: Optional[os.stat_result] = None,
+    ) -> List[UsageEntry]:
+        """Parse complete lines appended to a file since its recorded offset."""
+        state = self._files.get(file_path)
+        if state is None:
+            state = _FileState()
+            self._files[file_path] = state
+        elif (
+            stat is not None
+            and stat.st_size == state.offset
+            and stat.st_ino == state.inode
+        ):
+            return []
+
+        try:
+            if is_archive(file_path):
+                stat = stat or file_path.stat()
+                state.inode = stat.st_ino
+                # Parsed entries are kept, so the archive is not read again
+                lines = _read_archive_lines(
+                    file_path,
+                    stat,
+                    self.max_line_bytes,
+                    candidates_only=True,
+                    retain=False,
+                )
+                tail, end = None, stat.st_size
+            else:
+                with open(file_path, "rb") as f:
+                    state.inode = os.fstat(f.fileno()).st_ino
+                    lines, tail, end = _scan_lines(
+                        f, state.offset, self.max_line_bytes, _CANDIDATE_LINE_PATTERN
+                    )
+        except ImportError as e:
+            # No zstd module installed; skip the archive until it changes
+            logger.warning("Cannot read %s: %s", file_path, e)
+            if stat is not None:
+                state.offset = stat.st_size
+            return []
+        except Exception as e:
+            logger.warning("Failed to read file %s: %s", file_path, e)
+            report_file_error(
+                exception=e,
+                file_path=str(file_path),
+                operation="read",
+                additional_context={"file_exists": file_path.exists()},
+            )
+            return []
+
+        # A trailing line without newline may still be being written; only a
+        # possible usage line is decoded to check, anything else waits for
+        # its newline
+        if (
+            tail is not None
+            and _CANDIDATE_LINE_PATTERN.search(tail)
+            and self._is_complete_line(tail)
+        ):
+            end += len(tail)
+            lines.append(tail)
+        consumed = end - state.offset
+
+        state.offset += consumed
+        self.last_bytes_read += consumed
+
+        entries: List[UsageEntry] = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = self._decoder.loads_entry(line)
+            except ValueError as e:
+                logger.debug(f"Failed to parse JSON line in {file_path}: {e}")
+                continue
+            if not isinstance(data, dict):
+                continue
+
+            dedup_key = _create_dedup_key(data, self._processed_hashes)
+            if not _should_process_entry(
+                data,
+                cutoff_time,
+                self._processed_hashes,
+                self._timezone_handler,
+                unique_hash=dedup_key,
+            ):
+                continue
+
+            entry = _map_to_usage_entry(
+                data, self.mode, self._timezone_handler, self._pricing_calculator
+            )
+            if entry:
+                entries.append(entry)
+                _update_processed_hashes(
+                    data, self._processed_hashes, unique_hash=dedup_key
+                )
+
+            if _is_limit_candidate(data, line):
+                processor = TimestampProcessor(self._timezone_handler)
+                timestamp = processor.parse_timestamp(data.get("timestamp"))
+                # Limit detection reads message content, so keep the full entry
+                self._raw_entries.append((timestamp, self._decoder.loads(line)))
+
+        return entries
+
+    def _is_complete_line(self, fragment: bytes) -> bool:
+        """Check if a trailing fragment without newline is a complete JSON line."""
+        try:
+            self._decoder.loads(fragment)
+            return True
+        except ValueError:
+            return False
+
+    def drop_before(self, cutoff_time: datetime) -> None:
+        """Release retained entries older than cutoff_time.
+
+        Read offsets and deduplication hashes are kept, so the dropped entries
+        are not parsed again by later loads; only reset() brings them back.
+
+        Args:
+            cutoff_time: Oldest entry time to keep
+        """
+        with self._lock:
+            self._prune(cutoff_time)
+
+    def _prune(self, cutoff_time: datetime) -> None:
+        """Drop entries that fell out of the time window since the last load."""
+        expired = 0
+        for entry in self._entries:
+            if entry.timestamp >= cutoff_time:
+                break
+            expired += 1
+        if expired:
+            del self._entries[:expired]
+
+        self._raw_entries = [
+            (timestamp, data)
+            for timestamp, data in self._raw_entries
+            if timestamp is None or timestamp >= cutoff_time
+        ]
+
+
 class UsageEntryMapper:
     """Compatibility wrapper for legacy UsageEntryMapper interface.
 
@@ -320,3 +916,196 @@ class UsageEntryMapper:
             "message_id": data.get("message_id") or message.get("id", ""),
             "request_id": data.get("request_id") or data.get("requestId", "unknown"),
         }
+
+
+class MultiRootUsageReader:
+    """Incremental reader over several Claude data directories.
+
+    Claude has stored transcripts under both ``~/.claude/projects`` and
+    ``~/.config/claude/projects``, and users who migrated between versions
+    have data in both. Each root keeps its own IncrementalUsageReader state,
+    roots are read concurrently, and entries copied between roots are
+    deduplicated with the same message/request key used within a root.
+    """
+
+    def __init__(
+        self, data_paths: Sequence[str], mode: CostMode = CostMode.AUTO
+    ) -> None:
+        """Initialize reader for several Claude data directories.
+
+        Args:
+            data_paths: Claude data directories; duplicates, symlinked aliases
+                and directories nested in another root are read only once
+            mode: Cost calculation mode
+        """
+        self.data_paths: List[Path] = _distinct_roots(data_paths)
+        self.mode: CostMode = mode
+        self._readers: List[IncrementalUsageReader] = [
+            IncrementalUsageReader(str(root), mode) for root in self.data_paths
+        ]
+        self._new_entries: List[UsageEntry] = []
+        self._merged_hashes: Set[str] = set()
+        self._merged_generation: Optional[int] = None
+
+    @property
+    def last_bytes_read(self) -> int:
+        """Bytes read from all roots by the previous load."""
+        return sum(reader.last_bytes_read for reader in self._readers)
+
+    @property
+    def generation(self) -> int:
+        """Changes whenever any root reloaded its entries from scratch."""
+        return sum(reader.generation for reader in self._readers)
+
+    @property
+    def last_new_entries(self) -> List[UsageEntry]:
+        """Entries added to the merged result by the previous load."""
+        if len(self._readers) == 1:
+            return self._readers[0].last_new_entries
+        return self._new_entries
+
+    def reset(self) -> None:
+        """Drop the incremental state of every root."""
+        for reader in self._readers:
+            reader.reset()
+
+    def drop_before(self, cutoff_time: datetime) -> None:
+        """Release retained entries older than cutoff_time in every root.
+
+        Args:
+            cutoff_time: Oldest entry time to keep
+        """
+        for reader in self._readers:
+            reader.drop_before(cutoff_time)
+
+    def load(
+        self,
+        hours_back: Optional[int] = None,
+        include_raw: bool = False,
+        recent_hours: Optional[float] = None,
+    ) -> Tuple[List[UsageEntry], Optional[List[Dict[str, Any]]]]:
+        """Load usage entries from all roots.
+
+        Args:
+            hours_back: Only include entries from last N hours
+            include_raw: Whether to return raw entries relevant for limit detection
+            recent_hours: Only read files modified within the last N hours
+
+        Returns:
+            Tuple of (usage_entries, raw_data) where raw_data is None unless include_raw=True
+        """
+        if len(self._readers) == 1:
+            return self._readers[0].load(hours_back, include_raw, recent_hours)
+        if not self._readers:
+            return [], [] if include_raw else None
+
+        with ThreadPoolExecutor(
+            max_workers=len(self._readers), thread_name_prefix="usage-reader"
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda reader: reader.load(hours_back, include_raw, recent_hours),
+                    self._readers,
+                )
+            )
+
+        entries = _merge_root_entries([root_entries for root_entries, _ in results])
+        self._collect_new_entries(entries)
+        raw_entries: Optional[List[Dict[str, Any]]] = None
+        if include_raw:
+            raw_entries = _merge_root_raw_entries(
+                [root_raw or [] for _, root_raw in results]
+            )
+        return entries, raw_entries
+
+    def _collect_new_entries(self, merged: List[UsageEntry]) -> None:
+        """Keep the new root entries that no other root had already provided."""
+        if self.generation != self._merged_generation:
+            self._merged_generation = self.generation
+            self._new_entries = merged
+            self._merged_hashes = {
+                unique_hash
+                for unique_hash in (
+                    _format_unique_hash(entry.message_id, entry.request_id)
+                    for entry in merged
+                )
+                if unique_hash
+            }
+            return
+
+        self._new_entries = []
+        for reader in self._readers:
+            for entry in reader.last_new_entries:
+                unique_hash = _format_unique_hash(entry.message_id, entry.request_id)
+                if unique_hash:
+                    if unique_hash in self._merged_hashes:
+                        continue
+                    self._merged_hashes.add(unique_hash)
+                self._new_entries.append(entry)
+
+
+UsageReader = Union[IncrementalUsageReader, MultiRootUsageReader]
+
+
+def create_usage_reader(
+    data_path: Optional[Union[str, Sequence[str]]] = None,
+    mode: CostMode = CostMode.AUTO,
+) -> UsageReader:
+    """Create an incremental reader for one data directory or a list of them.
+
+    Args:
+        data_path: Claude data directory, or a list of directories
+        mode: Cost calculation mode
+
+    Returns:
+        IncrementalUsageReader for a single directory, MultiRootUsageReader otherwise
+    """
+    if data_path is None or isinstance(data_path, str):
+        return IncrementalUsageReader(data_path, mode)
+    return MultiRootUsageReader(data_path, mode)
+
+
+def _distinct_roots(data_paths: Sequence[str]) -> List[Path]:
+    """Resolve roots, dropping duplicates and roots nested in another root."""
+    resolved: List[Path] = []
+    for data_path in data_paths:
+        root = Path(data_path).expanduser().resolve()
+        if root not in resolved:
+            resolved.append(root)
+
+    return [
+        root
+        for root in resolved
+        if not any(other != root and other in root.parents for other in resolved)
+    ]
+
+
+def _merge_root_entries(per_root: List[List[UsageEntry]]) -> List[UsageEntry]:
+    """Merge sorted per-root entry lists, dropping entries seen in an earlier root."""
+    seen: Set[str] = set()
+    merged: List[UsageEntry] = []
+    for entry in heapq.merge(*per_root, key=lambda e: e.timestamp):
+        unique_hash = _format_unique_hash(entry.message_id, entry.request_id)
+        if unique_hash:
+            if unique_hash in seen:
+                continue
+            seen.add(unique_hash)
+        merged.append(entry)
+    return merged
+
+
+def _merge_root_raw_entries(
+    per_root: List[List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """Concatenate per-root raw entries, dropping transcript lines seen twice."""
+    seen: Set[str] = set()
+    merged: List[Dict[str, Any]] = []
+    for raw_entries in per_root:
+        for data in raw_entries:
+            key = data.get("uuid") or _create_unique_hash(data)
+            if key:
+                if key in seen:
+                    continue
+                seen.add(key)
+            merged.append(data)
+    return merged
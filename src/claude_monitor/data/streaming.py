@@ -0,0 +1,175 @@
+"""Streaming field extraction for oversized JSON lines.
+
+A transcript line may embed megabytes of ``tool_result`` output while usage
+tracking needs a few small fields. :func:`extract_fields` walks the raw text
+and decodes only the values named in a schema. Other values are skipped by
+searching for the next quote or bracket, so they are never materialized.
+"""
+
+import json
+import re
+from typing import Any, Dict, Mapping, Optional, Pattern, Tuple, Union
+
+# Schema mapping field name to None (decode the value) or a nested schema
+# (descend into an object value, skipping any other value type)
+FieldSchema = Mapping[str, Optional["FieldSchema"]]
+
+JsonText = Union[str, bytes]
+
+
+class _Tokens:
+    """Literals and patterns for scanning either str or bytes input."""
+
+    def __init__(self, kind: type) -> None:
+        def lit(text: str) -> Any:
+            return text.encode() if kind is bytes else text
+
+        self.quote = lit('"')
+        self.backslash = lit("\\")
+        self.colon = lit(":")
+        self.comma = lit(",")
+        self.open_object = lit("{")
+        self.close_object = lit("}")
+        self.open_array = lit("[")
+        self.close_array = lit("]")
+        self.whitespace: Pattern[Any] = re.compile(lit(r"[ \t\n\r]*"))
+        self.structural: Pattern[Any] = re.compile(lit(r'["{}\[\]]'))
+        self.scalar_end: Pattern[Any] = re.compile(lit(r"[,}\]\s]"))
+
+
+_STR_TOKENS = _Tokens(str)
+_BYTES_TOKENS = _Tokens(bytes)
+
+
+def extract_fields(data: JsonText, schema: FieldSchema) -> Dict[str, Any]:
+    """Decode only the fields of a JSON object named in a schema.
+
+    Args:
+        data: JSON text or UTF-8 bytes holding a single object
+        schema: Fields to keep; nested schemas select fields of object values
+
+    Returns:
+        Dictionary with the selected fields that are present
+
+    Raises:
+        ValueError: If data is not a well-formed JSON object
+    """
+    scanner = _Scanner(data)
+    result, end = scanner.object(scanner.skip_whitespace(0), schema)
+    if scanner.skip_whitespace(end) != len(data):
+        raise ValueError("Extra data after JSON object")
+    return result
+
+
+class _Scanner:
+    """Position-based scanner over a JSON document."""
+
+    def __init__(self, data: JsonText) -> None:
+        self.data = data
+        self.tokens = _BYTES_TOKENS if isinstance(data, bytes) else _STR_TOKENS
+
+    def char(self, pos: int) -> Any:
+        """Character at pos as a one-item slice (str or bytes)."""
+        return self.data[pos : pos + 1]
+
+    def skip_whitespace(self, pos: int) -> int:
+        """Position of the first non-whitespace character at or after pos."""
+        return self.tokens.whitespace.match(self.data, pos).end()  # type: ignore[union-attr]
+
+    def expect(self, pos: int, token: Any) -> int:
+        """Position after token, which must be the next non-whitespace."""
+        pos = self.skip_whitespace(pos)
+        if self.char(pos) != token:
+            raise ValueError(f"Expected {token!r} at position {pos}")
+        return pos + 1
+
+    def skip_string(self, pos: int) -> int:
+        """Position after the string starting at pos."""
+        data = self.data
+        quote = self.tokens.quote
+        backslash = self.tokens.backslash
+        end = pos + 1
+        while True:
+            end = data.find(quote, end)
+            if end < 0:
+                raise ValueError(f"Unterminated string at position {pos}")
+            escapes = 0
+            while data[end - escapes - 1 : end - escapes] == backslash:
+                escapes += 1
+            end += 1
+            if escapes % 2 == 0:
+                return end
+
+    def skip_value(self, pos: int) -> int:
+        """Position after the value starting at pos, without decoding it."""
+        tokens = self.tokens
+        first = self.char(pos)
+        if first == tokens.quote:
+            return self.skip_string(pos)
+        if first not in (tokens.open_object, tokens.open_array):
+            match = tokens.scalar_end.search(self.data, pos)
+            end = match.start() if match else len(self.data)
+            if end == pos:
+                raise ValueError(f"Expected value at position {pos}")
+            return end
+
+        depth = 0
+        while True:
+            match = tokens.structural.search(self.data, pos)
+            if match is None:
+                raise ValueError("Unterminated container")
+            pos = match.start()
+            token = self.char(pos)
+            if token == tokens.quote:
+                pos = self.skip_string(pos)
+                continue
+            pos += 1
+            if token in (tokens.open_object, tokens.open_array):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos
+
+    def key(self, pos: int) -> Tuple[str, int]:
+        """Decode the object key starting at pos."""
+        if self.char(pos) != self.tokens.quote:
+            raise ValueError(f"Expected object key at position {pos}")
+        end = self.skip_string(pos)
+        raw = self.data[pos + 1 : end - 1]
+        if self.tokens.backslash in raw:
+            return json.loads(self.data[pos:end]), end
+        return raw.decode() if isinstance(raw, bytes) else raw, end
+
+    def object(self, pos: int, schema: FieldSchema) -> Tuple[Dict[str, Any], int]:
+        """Extract schema fields from the object starting at pos."""
+        tokens = self.tokens
+        pos = self.expect(pos, tokens.open_object)
+        result: Dict[str, Any] = {}
+
+        pos = self.skip_whitespace(pos)
+        if self.char(pos) == tokens.close_object:
+            return result, pos + 1
+
+        while True:
+            key, pos = self.key(self.skip_whitespace(pos))
+            pos = self.skip_whitespace(self.expect(pos, tokens.colon))
+
+            if key not in schema:
+                pos = self.skip_value(pos)
+            elif schema[key] is None:
+                end = self.skip_value(pos)
+                result[key] = json.loads(self.data[pos:end])
+                pos = end
+            elif self.char(pos) == tokens.open_object:
+                result[key], pos = self.object(pos, schema[key])  # type: ignore[arg-type]
+            else:
+                pos = self.skip_value(pos)
+
+            pos = self.skip_whitespace(pos)
+            token = self.char(pos)
+            if token == tokens.close_object:
+                return result, pos + 1
+            if token != tokens.comma:
+                raise ValueError(f"Expected ',' or '}}' at position {pos}")
+            pos += 1
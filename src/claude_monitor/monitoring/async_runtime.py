@@ -0,0 +1,344 @@
+"""asyncio runtime for the monitoring orchestrator.
+
+The threaded runtime combines a monitoring thread, one thread per
+subscriber and ``signal.pause()`` in the main thread. This runtime instead
+runs everything as tasks on one event loop:
+
+- a refresh task that fetches data in an executor whenever the adaptive
+  interval elapses or an event arrives on the event queue
+- an optional watcher task that polls the transcript directories in the
+  executor and queues an event when a transcript changes
+- one task per consumer, which always receives the latest snapshot and
+  skips any published while it was busy; plain functions run in a consumer
+  executor so rendering or file writes never block the loop
+- background refreshes of stale snapshots, which run in the I/O executor
+  instead of on a DataRefreshThread
+
+A snapshot is published only when it was fetched anew, so consumers are not
+woken for a cached copy. Stopping cancels every task and waits for
+in-flight fetches and consumer calls, so shutdown is deterministic.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from claude_monitor.data.file_index import TranscriptFileIndex
+from claude_monitor.error_handling import report_error
+from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_INTERVAL = 2.0
+# File I/O runs here: refreshes, background refreshes and the watcher
+IO_WORKERS = 3
+
+FILES_CHANGED = "files_changed"
+DATA_REFRESHED = "data_refreshed"
+
+Consumer = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+_FileSignature = FrozenSet[Tuple[Path, int, int]]
+
+
+@dataclass
+class _ConsumerTask:
+    """A registered consumer and its wake-up flag."""
+
+    callback: Consumer
+    name: str
+    min_interval: float
+    wakeup: Optional[asyncio.Event] = None
+    delivered: int = field(default=0)
+
+
+class AsyncMonitoringRuntime:
+    """Runs refresh, file watching and consumers as tasks on one event loop."""
+
+    def __init__(
+        self,
+        orchestrator: MonitoringOrchestrator,
+        watch_paths: Sequence[Union[str, Path]] = (),
+        watch_interval: float = DEFAULT_WATCH_INTERVAL,
+    ) -> None:
+        """Initialize runtime.
+
+        Args:
+            orchestrator: Orchestrator that fetches and processes data
+            watch_paths: Transcript directories to watch for changes
+            watch_interval: Seconds between watcher polls
+        """
+        self.orchestrator: MonitoringOrchestrator = orchestrator
+        self.watch_paths: List[Path] = [Path(path) for path in watch_paths]
+        self.watch_interval: float = watch_interval
+        self._consumers: List[_ConsumerTask] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._events: Optional["asyncio.Queue[str]"] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._latest: Optional[Dict[str, Any]] = None
+        self._version: int = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._background: "Set[asyncio.Future[None]]" = set()
+
+    def add_consumer(
+        self, callback: Consumer, name: str = "consumer", min_interval: float = 0.0
+    ) -> None:
+        """Register a consumer of monitoring snapshots.
+
+        Must be called before run().
+
+        Args:
+            callback: Function or coroutine function called with monitoring data
+            name: Name used in log messages
+            min_interval: Minimum seconds between calls
+        """
+        self._consumers.append(_ConsumerTask(callback, name, min_interval))
+
+    def stop(self) -> None:
+        """Request shutdown; safe to call from any thread."""
+        loop, stopping = self._loop, self._stopping
+        if loop is None or stopping is None:
+            return
+        loop.call_soon_threadsafe(stopping.set)
+
+    async def run(self) -> None:
+        """Run until stop() is called or the task is cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._events = asyncio.Queue()
+        self._stopping = asyncio.Event()
+        for consumer in self._consumers:
+            consumer.wakeup = asyncio.Event()
+
+        executor = ThreadPoolExecutor(
+            max_workers=IO_WORKERS, thread_name_prefix="MonitorIO"
+        )
+        consumer_executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self._consumers)),
+            thread_name_prefix="MonitorConsumer",
+        )
+        self._executor = executor
+        self.orchestrator.add_wake_listener(self._on_wake)
+        self._set_refresh_runner(self._schedule_refresh)
+        tasks: List["asyncio.Task[None]"] = [
+            asyncio.ensure_future(self._refresh_loop(executor))
+        ]
+        if self.watch_paths:
+            tasks.append(asyncio.ensure_future(self._watch_loop(executor)))
+        tasks.extend(
+            asyncio.ensure_future(self._consume(consumer, consumer_executor))
+            for consumer in self._consumers
+        )
+        handles_sigterm = self._add_signal_handler()
+
+        try:
+            await self._stopping.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, *self._background, return_exceptions=True)
+            if handles_sigterm:
+                self._loop.remove_signal_handler(signal.SIGTERM)
+            self.orchestrator.remove_wake_listener(self._on_wake)
+            self._set_refresh_runner(None)
+            # Waits for fetches and consumer calls that are still running
+            executor.shutdown(wait=True)
+            consumer_executor.shutdown(wait=True)
+            self._executor = None
+            self._loop = None
+            logger.info("Async monitoring runtime stopped")
+
+    async def _refresh_loop(self, executor: ThreadPoolExecutor) -> None:
+        """Fetch data whenever the interval elapses or an event arrives."""
+        loop = asyncio.get_running_loop()
+        events = self._events
+        assert events is not None
+
+        # Render the active session first, then backfill the full history
+        data = await loop.run_in_executor(
+            executor, lambda: self.orchestrator.refresh(recent_only=True)
+        )
+        self._publish(data)
+        if data is None or not data.get("history_loaded", True):
+            data = await loop.run_in_executor(executor, self.orchestrator.refresh)
+            self._publish(data)
+
+        while True:
+            interval = self.orchestrator.next_interval(data)
+            try:
+                reason = await asyncio.wait_for(events.get(), timeout=interval)
+                logger.debug(f"Refresh triggered by {reason}")
+            except asyncio.TimeoutError:
+                pass
+            # Events that arrived meanwhile are served by this refresh
+            while not events.empty():
+                events.get_nowait()
+
+            data = await loop.run_in_executor(executor, self.orchestrator.refresh)
+            self._publish(data)
+
+    async def _watch_loop(self, executor: ThreadPoolExecutor) -> None:
+        """Queue an event whenever a transcript file changes."""
+        loop = asyncio.get_running_loop()
+        events = self._events
+        assert events is not None
+        indexes = [TranscriptFileIndex(path) for path in self.watch_paths]
+
+        previous: Optional[_FileSignature] = None
+        while True:
+            current = await loop.run_in_executor(
+                executor, self._file_signature, indexes
+            )
+            if previous is not None and current != previous:
+                events.put_nowait(FILES_CHANGED)
+            previous = current
+            await asyncio.sleep(self.watch_interval)
+
+    @staticmethod
+    def _file_signature(indexes: List[TranscriptFileIndex]) -> _FileSignature:
+        """Identify the current size and mtime of every transcript file."""
+        return frozenset(
+            (path, stat.st_size, stat.st_mtime_ns)
+            for index in indexes
+            for path, stat in index.scan().items()
+        )
+
+    async def _consume(
+        self, consumer: _ConsumerTask, executor: ThreadPoolExecutor
+    ) -> None:
+        """Deliver the newest snapshot to one consumer at its own pace."""
+        loop = asyncio.get_running_loop()
+        wakeup = consumer.wakeup
+        assert wakeup is not None
+        is_async = inspect.iscoroutinefunction(
+            consumer.callback
+        ) or inspect.iscoroutinefunction(getattr(consumer.callback, "__call__", None))
+
+        seen_version = 0
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            if self._version == seen_version or self._latest is None:
+                continue
+
+            seen_version = self._version
+            started = loop.time()
+            try:
+                if is_async:
+                    result = consumer.callback(self._latest)
+                else:
+                    result = await loop.run_in_executor(
+                        executor, consumer.callback, self._latest
+                    )
+                if inspect.isawaitable(result):
+                    await result
+                consumer.delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Consumer {consumer.name} error: {e}", exc_info=True)
+                report_error(
+                    exception=e,
+                    component="async_runtime",
+                    context_name="consumer_error",
+                )
+
+            remaining = consumer.min_interval - (loop.time() - started)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+    def _publish(self, data: Optional[Dict[str, Any]]) -> None:
+        """Make a snapshot the latest and wake every consumer.
+
+        Skipped when the refresh returned the snapshot already published or
+        a copy of the same fetch, e.g. while the cache was still fresh.
+        """
+        if data is None or data is self._latest:
+            return
+        fetched_at = _fetched_at(data)
+        if (
+            fetched_at is not None
+            and self._latest is not None
+            and fetched_at == _fetched_at(self._latest)
+        ):
+            logger.debug("Skipping snapshot of an already published fetch")
+            return
+        self._latest = data
+        self._version += 1
+        for consumer in self._consumers:
+            if consumer.wakeup is not None:
+                consumer.wakeup.set()
+
+    def _set_refresh_runner(
+        self, runner: Optional[Callable[[Callable[[], None]], None]]
+    ) -> None:
+        """Route background refreshes of the data manager to this runtime."""
+        set_runner = getattr(self.orchestrator.data_manager, "set_refresh_runner", None)
+        if set_runner is not None:
+            set_runner(runner)
+
+    def _schedule_refresh(self, refresh: Callable[[], None]) -> None:
+        """Run a background refresh as a task; called from a fetch thread."""
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("Async monitoring runtime is not running")
+        loop.call_soon_threadsafe(self._start_refresh_task, refresh)
+
+    def _start_refresh_task(self, refresh: Callable[[], None]) -> None:
+        """Start a background refresh in the I/O executor."""
+        loop, executor = self._loop, self._executor
+        if loop is None or executor is None:
+            return
+        future = loop.run_in_executor(executor, refresh)
+        self._background.add(future)
+        future.add_done_callback(self._background.discard)
+
+    def _on_wake(self) -> None:
+        """Queue a refresh after a background fetch; called from its thread."""
+        loop, events = self._loop, self._events
+        if loop is None or events is None:
+            return
+        try:
+            loop.call_soon_threadsafe(events.put_nowait, DATA_REFRESHED)
+        except RuntimeError:
+            # The loop closed while the fetch was running
+            pass
+
+    def _add_signal_handler(self) -> bool:
+        """Stop on SIGTERM where the loop supports signal handlers.
+
+        SIGINT is left alone so Ctrl+C surfaces as KeyboardInterrupt from
+        asyncio.run(), which cancels this task and runs the same shutdown.
+        """
+        assert self._loop is not None
+        if os.name == "nt":
+            return False
+        try:
+            self._loop.add_signal_handler(signal.SIGTERM, self.stop)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return False
+        return True
+
+
+def _fetched_at(data: Dict[str, Any]) -> Optional[float]:
+    """Get when the usage data of a monitoring snapshot was fetched."""
+    freshness = data.get("freshness")
+    if not isinstance(freshness, dict):
+        return None
+    return freshness.get("fetched_at")
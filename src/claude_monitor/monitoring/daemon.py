@@ -0,0 +1,595 @@
+"""Headless usage daemon answering JSON queries over a Unix domain socket.
+
+A single daemon owns one incremental monitoring pipeline and serves its
+latest snapshot to any number of local consumers (the TUI, shell prompts,
+editor status bars), so ``~/.claude/projects`` is parsed once instead of
+once per consumer.
+
+Protocol: the client sends one JSON object terminated by a newline, e.g.
+``{"query": "current_block"}``, and receives one JSON line back in the form
+``{"ok": true, "result": ...}`` or ``{"ok": false, "error": "..."}``.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from claude_monitor.core.calculations import calculate_hourly_burn_rate
+from claude_monitor.data.aggregator import IncrementalUsageAggregator
+from claude_monitor.error_handling import report_error
+from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
+from claude_monitor.monitoring.scheduler import create_scheduler
+from claude_monitor.monitoring.session_monitor import get_session_log_path
+from claude_monitor.monitoring.status_file import StatusFileWriter
+from claude_monitor.utils.time_utils import TimezoneHandler
+
+logger = logging.getLogger(__name__)
+
+MAX_REQUEST_BYTES = 64 * 1024
+DEFAULT_SOCKET_NAME = "daemon.sock"
+MAX_TOTALS_AGGREGATORS = 4
+
+
+def get_default_socket_path() -> Path:
+    """Get the daemon socket path, honouring CLAUDE_MONITOR_SOCKET."""
+    env_path = os.environ.get("CLAUDE_MONITOR_SOCKET")
+    if env_path:
+        return Path(env_path).expanduser()
+    return Path.home() / ".claude-monitor" / DEFAULT_SOCKET_NAME
+
+
+def is_daemon_supported() -> bool:
+    """Check if the platform supports Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON response line."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line) if line.strip() else {}
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            usage_daemon: "UsageDaemon" = self.server.daemon  # type: ignore[attr-defined]
+            response = {"ok": True, "result": usage_daemon.handle_request(request)}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        try:
+            self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+        except OSError as e:
+            logger.debug(f"Client disconnected before response: {e}")
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix stream server bound to a UsageDaemon."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, usage_daemon: "UsageDaemon") -> None:
+        self.daemon = usage_daemon
+        super().__init__(socket_path, _RequestHandler)
+
+
+class UsageDaemon:
+    """Owns one monitoring pipeline and serves its snapshots to local clients."""
+
+    def __init__(
+        self,
+        args: Any = None,
+        data_path: Optional[Union[str, Sequence[str]]] = None,
+        update_interval: int = 10,
+        socket_path: Optional[Path] = None,
+    ) -> None:
+        """Initialize daemon.
+
+        Args:
+            args: Command line arguments (plan, timezone) used for token limits
+            data_path: Optional path to Claude data directory, or a list of them
+            update_interval: Seconds between data refreshes
+            socket_path: Unix socket path (defaults to ~/.claude-monitor/daemon.sock)
+        """
+        self.args = args
+        self.socket_path: Path = socket_path or get_default_socket_path()
+        self.orchestrator = MonitoringOrchestrator(
+            update_interval=update_interval,
+            data_path=data_path,
+            scheduler=create_scheduler(args, update_interval),
+            session_log=get_session_log_path(),
+            evict_closed_entries=getattr(args, "evict_closed_entries", True),
+        )
+        self.orchestrator.set_args(args)
+        self.orchestrator.register_update_callback(self._on_data_update)
+        self.orchestrator.subscribe(StatusFileWriter(), name="StatusFileThread")
+
+        self._latest: Optional[Dict[str, Any]] = None
+        self._latest_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._server: Optional[_UnixServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+        self._totals: Dict[Tuple[str, str], IncrementalUsageAggregator] = {}
+        self._totals_lock = threading.Lock()
+
+        self._queries: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "ping": self._query_ping,
+            "snapshot": self._query_snapshot,
+            "current_block": self._query_current_block,
+            "burn_rate": self._query_burn_rate,
+            "daily_totals": self._query_daily_totals,
+            "monthly_totals": self._query_monthly_totals,
+            "block_entries": self._query_block_entries,
+        }
+
+    def start(self) -> None:
+        """Start the data pipeline and begin listening on the socket."""
+        if not is_daemon_supported():
+            raise OSError("Unix domain sockets are not supported on this platform")
+
+        self._prepare_socket_path()
+        self.orchestrator.start()
+
+        old_umask = os.umask(0o077)
+        try:
+            self._server = _UnixServer(str(self.socket_path), self)
+        finally:
+            os.umask(old_umask)
+
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="DaemonServerThread", daemon=True
+        )
+        self._server_thread.start()
+        logger.info(f"Usage daemon listening on {self.socket_path}")
+
+    def serve_forever(self) -> None:
+        """Start the daemon and block until stop() is called."""
+        self.start()
+        try:
+            self._stop_event.wait()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop serving, remove the socket and stop the pipeline."""
+        self._stop_event.set()
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+        self.orchestrator.stop()
+
+    def handle_request(self, request: Dict[str, Any]) -> Any:
+        """Dispatch a decoded request to its query handler.
+
+        Args:
+            request: Decoded request with a "query" key and optional parameters
+
+        Returns:
+            JSON-serializable query result
+
+        Raises:
+            ValueError: If the query is unknown
+        """
+        query = request.get("query", "ping")
+        handler = self._queries.get(query)
+        if handler is None:
+            raise ValueError(
+                f"Unknown query: {query}. Must be one of: {', '.join(self._queries)}"
+            )
+        return handler(request)
+
+    def _prepare_socket_path(self) -> None:
+        """Create the socket directory and clear a stale socket file."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.socket_path.exists():
+            return
+
+        if DaemonClient(self.socket_path, timeout=0.5).is_available():
+            raise RuntimeError(f"A daemon is already running on {self.socket_path}")
+
+        logger.info(f"Removing stale daemon socket {self.socket_path}")
+        self.socket_path.unlink()
+
+    def _on_data_update(self, monitoring_data: Dict[str, Any]) -> None:
+        """Store the latest monitoring snapshot published by the pipeline."""
+        with self._lock:
+            self._latest = monitoring_data
+            self._latest_at = datetime.now(timezone.utc)
+
+    def _get_latest(self) -> Dict[str, Any]:
+        """Get the latest snapshot or raise if no data is available yet."""
+        with self._lock:
+            latest = self._latest
+        if latest is None:
+            raise RuntimeError("No usage data available yet")
+        return latest
+
+    def _get_blocks(self) -> List[Dict[str, Any]]:
+        """Get blocks from the latest snapshot."""
+        return self._get_latest().get("data", {}).get("blocks", [])
+
+    def _query_ping(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Report daemon liveness and snapshot age."""
+        with self._lock:
+            generated_at = self._latest_at
+        return {
+            "pid": os.getpid(),
+            "ready": generated_at is not None,
+            "generated_at": generated_at.isoformat() if generated_at else None,
+        }
+
+    def _query_snapshot(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the data needed by a thin TUI client.
+
+        Entries of inactive blocks are stripped since clients only use their
+        aggregates, which keeps the payload small.
+        """
+        latest = self._get_latest()
+        data = latest.get("data", {})
+        blocks = [
+            block if block.get("isActive") else _strip_entries(block)
+            for block in data.get("blocks", [])
+        ]
+        return {
+            "data": {**data, "blocks": blocks},
+            "token_limit": latest.get("token_limit"),
+            "session_id": latest.get("session_id"),
+            "session_count": latest.get("session_count"),
+        }
+
+    def _query_current_block(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the active block, optionally with its entries."""
+        include_entries = bool(request.get("include_entries", False))
+        for block in self._get_blocks():
+            if block.get("isActive"):
+                return block if include_entries else _strip_entries(block)
+        return None
+
+    def _query_burn_rate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Return hourly burn rate plus active block rate and projection."""
+        blocks = self._get_blocks()
+        result: Dict[str, Any] = {
+            "tokensPerMinute": calculate_hourly_burn_rate(
+                blocks, datetime.now(timezone.utc)
+            ),
+            "activeBlock": None,
+        }
+        for block in blocks:
+            if block.get("isActive"):
+                result["activeBlock"] = {
+                    "id": block.get("id"),
+                    "burnRate": block.get("burnRate"),
+                    "projection": block.get("projection"),
+                }
+                break
+        return result
+
+    def _query_daily_totals(self, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Aggregate the full usage history into per-day totals."""
+        return self._period_totals("daily", request, request.get("days"))
+
+    def _query_monthly_totals(self, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Aggregate the full usage history into per-month totals."""
+        return self._period_totals("monthly", request, request.get("months"))
+
+    def _period_totals(
+        self, mode: str, request: Dict[str, Any], limit: Optional[Any]
+    ) -> List[Dict[str, Any]]:
+        """Aggregate the full usage history into per-period totals.
+
+        Periods are those of the requested timezone. Each mode and timezone
+        keeps its own incremental aggregator, so repeated queries only fold
+        in entries appended since the previous one.
+
+        Args:
+            mode: Aggregation mode ('daily' or 'monthly')
+            request: Decoded request with an optional "timezone"
+            limit: Number of most recent periods to return, all if empty
+
+        Returns:
+            Aggregated rows, oldest period first
+        """
+        tz_name = request.get("timezone") or getattr(self.args, "timezone", "UTC")
+        if not TimezoneHandler().validate_timezone(tz_name):
+            raise ValueError(f"Invalid timezone: {tz_name}")
+
+        with self._totals_lock:
+            aggregator = self._totals.pop((mode, tz_name), None)
+            if aggregator is None:
+                if len(self._totals) >= MAX_TOTALS_AGGREGATORS:
+                    # Least recently queried one goes first
+                    self._totals.pop(next(iter(self._totals)))
+                aggregator = IncrementalUsageAggregator(
+                    self.orchestrator.data_manager.data_path,
+                    aggregation_mode=mode,
+                    timezone=tz_name,
+                    local_periods=True,
+                )
+            self._totals[(mode, tz_name)] = aggregator
+            rows = aggregator.aggregate()
+
+        if limit:
+            rows = rows[-int(limit) :]
+        return rows
+
+    def _query_block_entries(
+        self, request: Dict[str, Any]
+    ) -> List[List[Dict[str, Any]]]:
+        """Return the entries of the requested blocks of the latest snapshot.
+
+        Evicted entries are reloaded together, once per request. Unknown
+        block ids get an empty list.
+        """
+        ids = request.get("ids") or []
+        if not isinstance(ids, list):
+            raise ValueError("ids must be a list of block ids")
+
+        blocks_by_id = {block.get("id"): block for block in self._get_blocks()}
+        found = [blocks_by_id[block_id] for block_id in ids if block_id in blocks_by_id]
+        entries = iter(self.orchestrator.data_manager.get_blocks_entries(found))
+        return [next(entries) if block_id in blocks_by_id else [] for block_id in ids]
+
+
+def _strip_entries(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shallow block copy without per-entry payloads."""
+    return {key: value for key, value in block.items() if key != "entries"}
+
+
+class DaemonClient:
+    """Client for querying a running usage daemon."""
+
+    def __init__(
+        self, socket_path: Optional[Path] = None, timeout: float = 2.0
+    ) -> None:
+        """Initialize client.
+
+        Args:
+            socket_path: Unix socket path (defaults to ~/.claude-monitor/daemon.sock)
+            timeout: Socket timeout in seconds
+        """
+        self.socket_path: Path = socket_path or get_default_socket_path()
+        self.timeout: float = timeout
+
+    def query(self, query: str, **params: Any) -> Any:
+        """Send a query to the daemon and return its result.
+
+        Args:
+            query: Query name (ping, snapshot, current_block, burn_rate,
+                daily_totals, monthly_totals, block_entries)
+            **params: Additional query parameters
+
+        Returns:
+            Decoded query result
+
+        Raises:
+            ConnectionError: If the daemon is unreachable or reports an error
+        """
+        if not is_daemon_supported():
+            raise ConnectionError("Unix domain sockets are not supported")
+
+        request = json.dumps({"query": query, **params}).encode("utf-8") + b"\n"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                sock.sendall(request)
+                with sock.makefile("rb") as stream:
+                    line = stream.readline()
+        except OSError as e:
+            raise ConnectionError(f"Daemon unavailable at {self.socket_path}: {e}")
+
+        try:
+            response = json.loads(line)
+        except ValueError as e:
+            raise ConnectionError(f"Invalid daemon response: {e}")
+
+        if not response.get("ok"):
+            raise ConnectionError(response.get("error", "Unknown daemon error"))
+        return response.get("result")
+
+    def is_available(self) -> bool:
+        """Check if a daemon is listening and responding."""
+        if not self.socket_path.exists():
+            return False
+        try:
+            self.query("ping")
+            return True
+        except ConnectionError:
+            return False
+
+
+class DaemonDataManager:
+    """Thin-client data source with the DataManager interface.
+
+    Lets MonitoringOrchestrator drive the TUI from a running daemon instead
+    of parsing the transcripts locally. Snapshots omit the entries of
+    inactive blocks, so those are fetched from the daemon on demand.
+    """
+
+    def __init__(self, client: DaemonClient) -> None:
+        """Initialize with a daemon client.
+
+        Args:
+            client: Client connected to a running daemon
+        """
+        self.client = client
+        self._cache: Optional[Dict[str, Any]] = None
+        self._last_error: Optional[str] = None
+
+    def get_data(
+        self, force_refresh: bool = False, recent_hours: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch the latest usage data from the daemon.
+
+        Args:
+            force_refresh: Accepted for interface compatibility; the daemon
+                always serves its latest snapshot
+            recent_hours: Accepted for interface compatibility; snapshots
+                always cover the full history
+
+        Returns:
+            Usage data dictionary, last good data on error, or None
+        """
+        try:
+            snapshot = self.client.query("snapshot")
+            self._cache = snapshot.get("data")
+            self._last_error = None
+        except ConnectionError as e:
+            logger.warning(f"Daemon query failed: {e}")
+            self._last_error = str(e)
+            report_error(
+                exception=e, component="daemon_client", context_name="query_error"
+            )
+        return self._cache
+
+    def get_block_entries(self, block: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get a block's entries, fetching them from the daemon if needed.
+
+        Args:
+            block: Block dictionary from a snapshot
+
+        Returns:
+            Entry dictionaries of the block
+        """
+        return self.get_blocks_entries([block])[0]
+
+    def get_blocks_entries(
+        self, blocks: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Get the entries of several blocks with at most one daemon query.
+
+        Args:
+            blocks: Block dictionaries from a snapshot
+
+        Returns:
+            Entry dictionaries per block, in the order of ``blocks``; empty
+            for blocks whose entries could not be fetched
+        """
+        missing = [
+            block
+            for block in blocks
+            if "entries" not in block or block.get("entriesEvicted")
+        ]
+        fetched: Dict[Any, List[Dict[str, Any]]] = {}
+        if missing:
+            ids = [block.get("id") for block in missing]
+            try:
+                fetched = dict(zip(ids, self.client.query("block_entries", ids=ids)))
+            except ConnectionError as e:
+                logger.warning(f"Daemon block entries query failed: {e}")
+                self._last_error = str(e)
+
+        return [
+            fetched.get(block.get("id"), [])
+            if "entries" not in block or block.get("entriesEvicted")
+            else block["entries"]
+            for block in blocks
+        ]
+
+    def invalidate_cache(self) -> None:
+        """Invalidate the cached snapshot."""
+        self._cache = None
+
+    @property
+    def cache_age(self) -> float:
+        """Get age of the cached snapshot in seconds, as fetched by the daemon."""
+        fetched_at = ((self._cache or {}).get("freshness") or {}).get("fetched_at")
+        if fetched_at is None:
+            return float("inf")
+        return time.time() - fetched_at
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """Get last error message."""
+        return self._last_error
+
+
+class DaemonUsageAggregator:
+    """Daily or monthly rows served by a running daemon.
+
+    Has the refresh()/rows() interface of IncrementalUsageAggregator, so the
+    table view can follow the daemon's pipeline instead of reading the
+    transcripts itself.
+    """
+
+    def __init__(
+        self,
+        client: DaemonClient,
+        aggregation_mode: str = "daily",
+        timezone: str = "UTC",
+    ) -> None:
+        """Initialize with a daemon client.
+
+        Args:
+            client: Client connected to a running daemon
+            aggregation_mode: Mode of aggregation ('daily' or 'monthly')
+            timezone: Timezone whose days or months the rows cover
+
+        Raises:
+            ValueError: If aggregation_mode is not 'daily' or 'monthly'
+        """
+        if aggregation_mode not in ("daily", "monthly"):
+            raise ValueError(f"Invalid aggregation mode: {aggregation_mode}")
+        self.client = client
+        self.aggregation_mode: str = aggregation_mode
+        self.timezone: str = timezone
+        self._period_field: str = "date" if aggregation_mode == "daily" else "month"
+        self._rows: List[Dict[str, Any]] = []
+
+    def refresh(self) -> List[str]:
+        """Fetch the rows from the daemon.
+
+        Rows equal to the previous ones are kept as the same objects.
+
+        Returns:
+            Sorted keys of the periods whose rows changed or were removed
+
+        Raises:
+            ConnectionError: If the daemon is unreachable or reports an error
+        """
+        rows = self.client.query(
+            f"{self.aggregation_mode}_totals", timezone=self.timezone
+        )
+        previous = {row[self._period_field]: row for row in self._rows}
+        changed: List[str] = []
+        merged: List[Dict[str, Any]] = []
+        for row in rows:
+            period_key = row[self._period_field]
+            old_row = previous.get(period_key)
+            if old_row == row:
+                merged.append(old_row)
+            else:
+                merged.append(row)
+                changed.append(period_key)
+        current = {row[self._period_field] for row in merged}
+        changed.extend(key for key in previous if key not in current)
+        self._rows = merged
+        return sorted(changed)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Get the rows of the last refresh, oldest period first."""
+        return self._rows
+
+    def aggregate(self) -> List[Dict[str, Any]]:
+        """Refresh and return the rows.
+
+        Returns:
+            List of aggregated data based on aggregation_mode
+        """
+        self.refresh()
+        return self.rows()
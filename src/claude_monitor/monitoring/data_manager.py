@@ -1,54 +1,191 @@
 """Unified data management for monitoring - combines caching and fetching."""
 
 import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from claude_monitor.data.analysis import analyze_usage
+from claude_monitor.data.analysis import (
+    ClosedBlocks,
+    analyze_usage,
+    select_blocks_entries,
+)
+from claude_monitor.data.reader import (
+    UsageReader,
+    create_usage_reader,
+    load_usage_entries,
+)
 from claude_monitor.error_handling import report_error
 
 logger = logging.getLogger(__name__)
 
+# Oldest snapshot served while a background refresh is running
+DEFAULT_MAX_STALENESS = 60.0
+
+
+class _Flight:
+    """A fetch in progress whose result concurrent callers can wait for."""
+
+    def __init__(self) -> None:
+        self.done: threading.Event = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+
 
 class DataManager:
-    """Manages data fetching and caching for monitoring."""
+    """Manages data fetching and caching for monitoring.
+
+    In stale-while-revalidate mode an expired snapshot is returned at once
+    while a background thread fetches a new one, so callers never wait on
+    transcript I/O unless the snapshot is older than ``max_staleness``.
+
+    Fetches are single-flight: a caller asking for data while an identical
+    fetch is running waits for that fetch and shares its result instead of
+    starting a second scan. The cached snapshot and its timestamp are
+    published together under a lock, so readers never see a torn pair.
+    """
 
     def __init__(
         self,
         cache_ttl: int = 30,
         hours_back: int = 192,
-        data_path: Optional[str] = None,
+        data_path: Optional[Union[str, Sequence[str]]] = None,
+        stale_while_revalidate: bool = False,
+        max_staleness: float = DEFAULT_MAX_STALENESS,
+        on_refresh: Optional[Callable[[], None]] = None,
+        evict_closed_entries: bool = True,
     ) -> None:
         """Initialize data manager with cache and fetch settings.
 
         Args:
             cache_ttl: Cache time-to-live in seconds
             hours_back: Hours of historical data to fetch
-            data_path: Path to data directory
+            data_path: Path to data directory, or a list of directories that
+                are read together
+            stale_while_revalidate: Serve expired snapshots while refreshing
+                in the background
+            max_staleness: Age in seconds beyond which a snapshot is no longer
+                served and callers wait for a fresh fetch
+            on_refresh: Called after a background refresh published a snapshot
+            evict_closed_entries: Keep only aggregates for closed blocks;
+                the reader releases their entries, which get_block_entries
+                reloads on demand
         """
         self.cache_ttl: int = cache_ttl
+        self.stale_while_revalidate: bool = stale_while_revalidate
+        self.max_staleness: float = max_staleness
+        self.on_refresh: Optional[Callable[[], None]] = on_refresh
+        self.evict_closed_entries: bool = evict_closed_entries
         self._cache: Optional[Dict[str, Any]] = None
         self._cache_timestamp: Optional[float] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_runner: Optional[Callable[[Callable[[], None]], None]] = None
+        self._refreshing: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        self._fetch_lock: threading.Lock = threading.Lock()
+        self._flights: Dict[Optional[float], _Flight] = {}
 
         self.hours_back: int = hours_back
-        self.data_path: Optional[str] = data_path
+        self.data_path: Optional[Union[str, Sequence[str]]] = data_path
+        self._reader: UsageReader = create_usage_reader(data_path)
+        self._closed_blocks: ClosedBlocks = ClosedBlocks()
         self._last_error: Optional[str] = None
         self._last_successful_fetch: Optional[float] = None
 
-    def get_data(self, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+    def get_data(
+        self, force_refresh: bool = False, recent_hours: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """Get monitoring data with caching and error handling.
 
         Args:
             force_refresh: Force refresh ignoring cache
+            recent_hours: Only read files modified within the last N hours for
+                a fast partial result; partial results are never cached
 
         Returns:
             Usage data dictionary or None if fetch fails
         """
-        if not force_refresh and self._is_cache_valid():
-            cache_age: float = time.time() - self._cache_timestamp  # type: ignore
-            logger.debug(f"Using cached data (age: {cache_age:.1f}s)")
-            return self._cache
+        cached, fetched_at = self._cached()
+        age = time.time() - fetched_at if fetched_at is not None else float("inf")
+
+        if not force_refresh and cached is not None and age <= self.cache_ttl:
+            logger.debug(f"Using cached data (age: {age:.1f}s)")
+            return self._snapshot(cached, fetched_at)
+
+        if (
+            self.stale_while_revalidate
+            and not force_refresh
+            and recent_hours is None
+            and cached is not None
+            and age <= self.max_staleness
+        ):
+            logger.debug(f"Serving stale data (age: {age:.1f}s)")
+            self._start_background_refresh()
+            return self._snapshot(cached, fetched_at)
 
+        data = self._fetch(recent_hours)
+        if data is not None:
+            return self._snapshot(data, time.time())
+
+        cached, fetched_at = self._cached()
+        if cached is not None and self._is_cache_valid():
+            logger.info("Using cached data due to fetch error")
+            return self._snapshot(cached, fetched_at)
+
+        logger.error("Failed to get usage data - no cache fallback available")
+        return None
+
+    def _fetch(self, recent_hours: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Fetch usage data, joining an identical fetch already in flight.
+
+        Args:
+            recent_hours: Only read files modified within the last N hours
+
+        Returns:
+            Usage data dictionary or None if the fetch failed
+        """
+        with self._lock:
+            flight = self._flights.get(recent_hours)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[recent_hours] = _Flight()
+
+        if not leader:
+            logger.debug("Joining in-flight data fetch")
+            flight.done.wait()
+            return flight.result
+
+        try:
+            # The incremental reader is not thread-safe, so fetches with
+            # different parameters still run one at a time
+            with self._fetch_lock:
+                flight.result = self._fetch_with_retries(recent_hours)
+        finally:
+            with self._lock:
+                del self._flights[recent_hours]
+            flight.done.set()
+        return flight.result
+
+    def _fetch_with_retries(
+        self, recent_hours: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run the usage analysis with retries, caching full results.
+
+        Args:
+            recent_hours: Only read files modified within the last N hours
+
+        Returns:
+            Usage data dictionary or None if every attempt failed
+        """
         max_retries: int = 3
         for attempt in range(max_retries):
             try:
@@ -60,10 +197,15 @@ class DataManager:
                     quick_start=False,
                     use_cache=False,
                     data_path=self.data_path,
+                    reader=self._reader,
+                    recent_hours=recent_hours,
+                    evict_closed_entries=self.evict_closed_entries,
+                    closed_blocks=self._closed_blocks,
                 )
 
                 if data is not None:
-                    self._set_cache(data)
+                    if recent_hours is None:
+                        self._set_cache(data)
                     self._last_successful_fetch = time.time()
                     self._last_error = None
                     return data
@@ -102,38 +244,158 @@ class DataManager:
                     continue
                 break
 
-        if self._is_cache_valid():
-            logger.info("Using cached data due to fetch error")
-            return self._cache
-
-        logger.error("Failed to get usage data - no cache fallback available")
         return None
 
+    def set_refresh_runner(
+        self, runner: Optional[Callable[[Callable[[], None]], None]]
+    ) -> None:
+        """Set how background refreshes are started.
+
+        By default each one runs on a DataRefreshThread. A runtime with its
+        own worker pool passes a function that schedules the refresh there,
+        e.g. as a task on its event loop.
+
+        Args:
+            runner: Function called with the refresh to run in the
+                background, or None to use a thread again
+        """
+        self._refresh_runner = runner
+
+    def _start_background_refresh(self) -> None:
+        """Start a background refresh unless one is already running."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+            runner = self._refresh_runner
+            if runner is None:
+                self._refresh_thread = threading.Thread(
+                    target=self._background_refresh,
+                    name="DataRefreshThread",
+                    daemon=True,
+                )
+                self._refresh_thread.start()
+                return
+
+        try:
+            runner(self._background_refresh)
+        except Exception as e:
+            logger.warning(f"Could not schedule background refresh: {e}")
+            with self._lock:
+                self._refreshing = False
+
+    def _background_refresh(self) -> None:
+        """Fetch a new snapshot and notify the refresh listener."""
+        try:
+            data = self._fetch()
+        finally:
+            with self._lock:
+                self._refreshing = False
+        if data is None or self.on_refresh is None:
+            return
+        try:
+            self.on_refresh()
+        except Exception as e:
+            logger.error(f"Refresh callback error: {e}", exc_info=True)
+
+    def _snapshot(
+        self, data: Dict[str, Any], fetched_at: Optional[float]
+    ) -> Dict[str, Any]:
+        """Copy usage data with a freshness indicator attached.
+
+        Args:
+            data: Usage data
+            fetched_at: When data was fetched
+
+        Returns:
+            Shallow copy of data with a "freshness" entry
+        """
+        age = time.time() - fetched_at if fetched_at is not None else float("inf")
+        with self._lock:
+            refreshing = self._refreshing
+        return {
+            **data,
+            "freshness": {
+                "fetched_at": fetched_at,
+                "age_seconds": age,
+                "stale": age > self.cache_ttl,
+                "refreshing": refreshing,
+            },
+        }
+
+    def get_block_entries(self, block: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get a block's entries, reloading them if they were evicted.
+
+        Args:
+            block: Block dictionary from a snapshot
+
+        Returns:
+            Entry dictionaries of the block
+        """
+        return self.get_blocks_entries([block])[0]
+
+    def get_blocks_entries(
+        self, blocks: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Get the entries of several blocks, reloading evicted ones together.
+
+        Evicted entries are read back with a one-shot load that leaves the
+        incremental reader alone, at most once per call however many blocks
+        are evicted.
+
+        Args:
+            blocks: Block dictionaries from a snapshot
+
+        Returns:
+            Entry dictionaries per block, in the order of ``blocks``
+        """
+        evicted = [block for block in blocks if block.get("entriesEvicted")]
+        reloaded: Iterator[List[Dict[str, Any]]] = iter(())
+        if evicted:
+            entries, _ = load_usage_entries(
+                data_path=self.data_path, hours_back=self.hours_back
+            )
+            reloaded = iter(select_blocks_entries(entries, evicted))
+
+        return [
+            next(reloaded) if block.get("entriesEvicted") else block.get("entries", [])
+            for block in blocks
+        ]
+
     def invalidate_cache(self) -> None:
         """Invalidate the cache."""
-        self._cache = None
-        self._cache_timestamp = None
+        with self._lock:
+            self._cache = None
+            self._cache_timestamp = None
         logger.debug("Cache invalidated")
 
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid."""
-        if self._cache is None or self._cache_timestamp is None:
+        cached, fetched_at = self._cached()
+        if cached is None or fetched_at is None:
             return False
 
-        cache_age = time.time() - self._cache_timestamp
+        cache_age = time.time() - fetched_at
         return cache_age <= self.cache_ttl
 
+    def _cached(self) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+        """Read the cached snapshot and its timestamp as one consistent pair."""
+        with self._lock:
+            return self._cache, self._cache_timestamp
+
     def _set_cache(self, data: Dict[str, Any]) -> None:
-        """Set cache with current timestamp."""
-        self._cache = data
-        self._cache_timestamp = time.time()
+        """Publish a new snapshot with the current timestamp."""
+        with self._lock:
+            self._cache = data
+            self._cache_timestamp = time.time()
 
     @property
     def cache_age(self) -> float:
         """Get age of cached data in seconds."""
-        if self._cache_timestamp is None:
+        _, fetched_at = self._cached()
+        if fetched_at is None:
             return float("inf")
-        return time.time() - self._cache_timestamp
+        return time.time() - fetched_at
 
     @property
     def last_error(self) -> Optional[str]:
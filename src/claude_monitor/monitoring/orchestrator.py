@@ -3,37 +3,79 @@
 import logging
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from claude_monitor.core.plans import DEFAULT_TOKEN_LIMIT, get_token_limit
 from claude_monitor.error_handling import report_error
 from claude_monitor.monitoring.data_manager import DataManager
+from claude_monitor.monitoring.scheduler import AdaptiveScheduler
 from claude_monitor.monitoring.session_monitor import SessionMonitor
+from claude_monitor.monitoring.snapshot_channel import (
+    ChannelSubscriber,
+    SnapshotChannel,
+)
 
 logger = logging.getLogger(__name__)
 
+# Files modified within two session windows hold the active session block
+FIRST_PAINT_HOURS = 10
+
 
 class MonitoringOrchestrator:
     """Orchestrates monitoring components following SRP."""
 
     def __init__(
-        self, update_interval: int = 10, data_path: Optional[str] = None
+        self,
+        update_interval: int = 10,
+        data_path: Optional[Union[str, Sequence[str]]] = None,
+        data_manager: Optional[Any] = None,
+        scheduler: Optional[AdaptiveScheduler] = None,
+        session_log: Optional[Path] = None,
+        evict_closed_entries: bool = True,
     ) -> None:
         """Initialize orchestrator with components.
 
         Args:
             update_interval: Seconds between updates
-            data_path: Optional path to Claude data directory
+            data_path: Optional path to Claude data directory, or a list of them
+            data_manager: Optional data source with the DataManager interface
+                (e.g. a daemon client); a local DataManager is created if omitted
+            scheduler: Optional adaptive scheduler that replaces the fixed
+                update interval
+            session_log: Optional file that persists session history
+            evict_closed_entries: Keep only aggregates for closed blocks in
+                the local DataManager
         """
         self.update_interval: int = update_interval
-
-        self.data_manager: DataManager = DataManager(cache_ttl=5, data_path=data_path)
-        self.session_monitor: SessionMonitor = SessionMonitor()
+        self.scheduler: Optional[AdaptiveScheduler] = scheduler
+
+        # Cached data must not outlive the shortest adaptive interval
+        cache_ttl: int = 5
+        if scheduler is not None:
+            cache_ttl = max(1, min(cache_ttl, int(scheduler.min_interval)))
+
+        self.data_manager: DataManager = (
+            data_manager
+            if data_manager is not None
+            else DataManager(
+                cache_ttl=cache_ttl,
+                data_path=data_path,
+                stale_while_revalidate=True,
+                on_refresh=self._on_data_refreshed,
+                evict_closed_entries=evict_closed_entries,
+            )
+        )
+        self.session_monitor: SessionMonitor = SessionMonitor(history_path=session_log)
 
         self._monitoring: bool = False
         self._monitor_thread: Optional[threading.Thread] = None
         self._stop_event: threading.Event = threading.Event()
+        self._wake_event: threading.Event = threading.Event()
         self._update_callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self.snapshots: SnapshotChannel[Dict[str, Any]] = SnapshotChannel()
+        self._subscribers: List[ChannelSubscriber[Dict[str, Any]]] = []
+        self._wake_listeners: List[Callable[[], None]] = []
         self._last_valid_data: Optional[Dict[str, Any]] = None
         self._args: Optional[Any] = None
         self._first_data_event: threading.Event = threading.Event()
@@ -47,6 +89,10 @@ class MonitoringOrchestrator:
         logger.info(f"Starting monitoring with {self.update_interval}s interval")
         self._monitoring = True
         self._stop_event.clear()
+        self._wake_event.clear()
+
+        for subscriber in self._subscribers:
+            subscriber.start()
 
         # Start monitoring thread
         self._monitor_thread = threading.Thread(
@@ -62,10 +108,14 @@ class MonitoringOrchestrator:
         logger.info("Stopping monitoring")
         self._monitoring = False
         self._stop_event.set()
+        self._wake_event.set()
 
         if self._monitor_thread and self._monitor_thread.is_alive():
             self._monitor_thread.join(timeout=5)
 
+        for subscriber in self._subscribers:
+            subscriber.stop()
+
         self._monitor_thread = None
         self._first_data_event.clear()
 
@@ -89,6 +139,35 @@ class MonitoringOrchestrator:
             self._update_callbacks.append(callback)
             logger.debug("Registered update callback")
 
+    def subscribe(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        name: str = "SnapshotSubscriber",
+        min_interval: float = 0.0,
+    ) -> ChannelSubscriber[Dict[str, Any]]:
+        """Consume monitoring data on a separate thread at its own pace.
+
+        Unlike update callbacks, which run on the monitoring thread, a
+        subscriber never delays data fetching; it receives the latest
+        snapshot and skips any published while it was busy.
+
+        Args:
+            callback: Function to call with monitoring data
+            name: Name of the subscriber thread
+            min_interval: Minimum seconds between calls
+
+        Returns:
+            The subscriber, started together with monitoring
+        """
+        subscriber: ChannelSubscriber[Dict[str, Any]] = ChannelSubscriber(
+            self.snapshots, callback, name=name, min_interval=min_interval
+        )
+        self._subscribers.append(subscriber)
+        if self._monitoring:
+            subscriber.start()
+        logger.debug(f"Registered snapshot subscriber {name}")
+        return subscriber
+
     def register_session_callback(
         self, callback: Callable[[str, str, Optional[Dict[str, Any]]], None]
     ) -> None:
@@ -107,6 +186,18 @@ class MonitoringOrchestrator:
         """
         return self._fetch_and_process_data(force_refresh=True)
 
+    def refresh(self, recent_only: bool = False) -> Optional[Dict[str, Any]]:
+        """Fetch and process data once, like one pass of the monitoring loop.
+
+        Args:
+            recent_only: Only read recently modified files for a fast first
+                paint
+
+        Returns:
+            Processed data or None if failed
+        """
+        return self._fetch_and_process_data(recent_only=recent_only)
+
     def wait_for_initial_data(self, timeout: float = 10.0) -> bool:
         """Wait for initial data to be fetched.
 
@@ -122,27 +213,67 @@ class MonitoringOrchestrator:
         """Main monitoring loop."""
         logger.info("Monitoring loop started")
 
-        # Initial fetch
-        self._fetch_and_process_data()
+        # Render the active session from recently modified files first, then
+        # backfill the full history (P90 limits, burn-rate history)
+        initial_data = self._fetch_and_process_data(recent_only=True)
+        if initial_data is None or self._is_partial(initial_data.get("data")):
+            initial_data = self._fetch_and_process_data()
+        interval: float = self.next_interval(initial_data)
 
         while self._monitoring:
-            # Wait for interval or stop
-            if self._stop_event.wait(timeout=self.update_interval):
-                if not self._monitoring:
-                    break
+            # Wait for interval, a finished background refresh, or stop
+            self._wake_event.wait(timeout=interval)
+            self._wake_event.clear()
+            if not self._monitoring:
+                break
 
             # Fetch and process
-            self._fetch_and_process_data()
+            interval = self.next_interval(self._fetch_and_process_data())
 
         logger.info("Monitoring loop ended")
 
+    def next_interval(self, monitoring_data: Optional[Dict[str, Any]]) -> float:
+        """Get the delay before the next refresh.
+
+        Args:
+            monitoring_data: Result of the last refresh
+
+        Returns:
+            Seconds to wait
+        """
+        if self.scheduler is None:
+            return self.update_interval
+        return self.scheduler.observe(monitoring_data)
+
+    def add_wake_listener(self, listener: Callable[[], None]) -> None:
+        """Register a function called when a background refresh completes.
+
+        Args:
+            listener: Function called from the refresh thread
+        """
+        if listener not in self._wake_listeners:
+            self._wake_listeners.append(listener)
+
+    def remove_wake_listener(self, listener: Callable[[], None]) -> None:
+        """Unregister a wake listener."""
+        if listener in self._wake_listeners:
+            self._wake_listeners.remove(listener)
+
+    def _on_data_refreshed(self) -> None:
+        """Wake the monitoring loop to publish a freshly fetched snapshot."""
+        self._wake_event.set()
+        for listener in list(self._wake_listeners):
+            listener()
+
     def _fetch_and_process_data(
-        self, force_refresh: bool = False
+        self, force_refresh: bool = False, recent_only: bool = False
     ) -> Optional[Dict[str, Any]]:
         """Fetch data and notify callbacks.
 
         Args:
             force_refresh: Force cache refresh
+            recent_only: Only read recently modified files for a fast first
+                paint; the result is marked partial until history is loaded
 
         Returns:
             Processed data or None if failed
@@ -150,14 +281,24 @@ class MonitoringOrchestrator:
         try:
             # Fetch data
             start_time: float = time.time()
-            data: Optional[Dict[str, Any]] = self.data_manager.get_data(
-                force_refresh=force_refresh
-            )
+            data: Optional[Dict[str, Any]]
+            if recent_only:
+                data = self.data_manager.get_data(
+                    force_refresh=True, recent_hours=FIRST_PAINT_HOURS
+                )
+            else:
+                data = self.data_manager.get_data(force_refresh=force_refresh)
 
             if data is None:
                 logger.warning("No data fetched")
                 return None
 
+            # The stale copy served while a background refresh runs was
+            # already published; the refresh wakes the loop with fresh data
+            if not force_refresh and self._is_stale_repeat(data):
+                logger.debug("Skipping stale snapshot already published")
+                return self._last_valid_data
+
             # Validate and update session tracking
             is_valid: bool
             errors: List[str]
@@ -176,6 +317,8 @@ class MonitoringOrchestrator:
                 "args": self._args,
                 "session_id": self.session_monitor.current_session_id,
                 "session_count": self.session_monitor.session_count,
+                "history_loaded": not self._is_partial(data),
+                "freshness": data.get("freshness"),
             }
 
             # Store last valid data
@@ -185,7 +328,8 @@ class MonitoringOrchestrator:
             if not self._first_data_event.is_set():
                 self._first_data_event.set()
 
-            # Notify callbacks
+            # Hand the snapshot to subscribers, then notify callbacks
+            self.snapshots.publish(monitoring_data)
             for callback in self._update_callbacks:
                 try:
                     callback(monitoring_data)
@@ -224,10 +368,32 @@ class MonitoringOrchestrator:
         plan: str = getattr(self._args, "plan", "pro")
 
         try:
-            if plan == "custom":
+            # P90 over a few recent files would understate the limit
+            if plan == "custom" and not self._is_partial(data):
                 blocks: List[Any] = data.get("blocks", [])
                 return get_token_limit(plan, blocks)
             return get_token_limit(plan)
         except Exception as e:
             logger.exception(f"Error calculating token limit: {e}")
             return DEFAULT_TOKEN_LIMIT
+
+    def _is_stale_repeat(self, data: Dict[str, Any]) -> bool:
+        """Check if data is a stale copy of the last published snapshot."""
+        if self._last_valid_data is None:
+            return False
+        freshness = data.get("freshness")
+        previous = self._last_valid_data.get("freshness")
+        if not isinstance(freshness, dict) or not isinstance(previous, dict):
+            return False
+        return bool(freshness.get("stale")) and (
+            freshness.get("fetched_at") is not None
+            and freshness.get("fetched_at") == previous.get("fetched_at")
+        )
+
+    @staticmethod
+    def _is_partial(data: Any) -> bool:
+        """Check if usage data came from a recent-files-only load."""
+        if not isinstance(data, dict):
+            return False
+        metadata = data.get("metadata")
+        return isinstance(metadata, dict) and bool(metadata.get("partial"))
@@ -0,0 +1,142 @@
+"""Adaptive refresh interval for the monitoring loop.
+
+A fixed refresh rate polls as often overnight as during a busy session.
+:class:`AdaptiveScheduler` looks at each processed snapshot and picks the
+delay before the next refresh: the floor while the active block is growing
+or close to its token limit, the configured refresh rate while a session is
+active but quiet, and an exponentially growing delay up to the ceiling while
+nothing changes and no session is active.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 30.0
+DEFAULT_BACKOFF_FACTOR = 2.0
+# Share of the token limit above which refreshes run at the floor
+DEFAULT_NEAR_LIMIT_RATIO = 0.8
+
+
+class AdaptiveScheduler:
+    """Chooses the next refresh interval from recent usage activity."""
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        near_limit_ratio: float = DEFAULT_NEAR_LIMIT_RATIO,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            base_interval: Interval in seconds while a session is active
+            min_interval: Floor used while usage is growing or near the limit
+            max_interval: Ceiling for the idle back-off
+            backoff_factor: Multiplier applied per idle refresh
+            near_limit_ratio: Share of the token limit treated as near the limit
+        """
+        self.base_interval: float = base_interval
+        self.min_interval: float = min(min_interval, base_interval)
+        self.max_interval: float = max(max_interval, base_interval)
+        self.backoff_factor: float = backoff_factor
+        self.near_limit_ratio: float = near_limit_ratio
+        self.interval: float = base_interval
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._fetched_at: Optional[float] = None
+
+    def reset(self) -> None:
+        """Return to the base interval and forget the last snapshot."""
+        self.interval = self.base_interval
+        self._signature = None
+        self._fetched_at = None
+
+    def observe(self, monitoring_data: Optional[Dict[str, Any]]) -> float:
+        """Update the interval from a processed snapshot.
+
+        A snapshot fetched at the same time as the previous one (a cached or
+        stale copy served while a refresh runs) is not a new observation and
+        leaves the interval unchanged.
+
+        Args:
+            monitoring_data: Monitoring data from the orchestrator, or None if
+                the refresh failed
+
+        Returns:
+            Seconds to wait before the next refresh
+        """
+        if monitoring_data is None:
+            self.interval = self.base_interval
+            return self.interval
+
+        freshness: Dict[str, Any] = monitoring_data.get("freshness") or {}
+        fetched_at: Optional[float] = freshness.get("fetched_at")
+        if fetched_at is not None and fetched_at == self._fetched_at:
+            return self.interval
+        self._fetched_at = fetched_at
+
+        data: Dict[str, Any] = monitoring_data.get("data") or {}
+        blocks: List[Dict[str, Any]] = data.get("blocks") or []
+        active = next((block for block in blocks if block.get("isActive")), None)
+
+        signature = self._snapshot_signature(blocks)
+        changed = self._signature is not None and signature != self._signature
+        self._signature = signature
+
+        if active is not None and (
+            changed or self._near_limit(active, monitoring_data.get("token_limit"))
+        ):
+            self.interval = self.min_interval
+        elif active is not None or changed:
+            self.interval = self.base_interval
+        else:
+            self.interval = min(
+                self.max_interval,
+                max(self.interval, self.base_interval) * self.backoff_factor,
+            )
+
+        logger.debug(f"Next refresh in {self.interval:.1f}s")
+        return self.interval
+
+    def _near_limit(self, block: Dict[str, Any], token_limit: Any) -> bool:
+        """Check if a block has used most of the token limit."""
+        if not token_limit:
+            return False
+        tokens: int = block.get("totalTokens", 0) or 0
+        return tokens >= token_limit * self.near_limit_ratio
+
+    @staticmethod
+    def _snapshot_signature(blocks: List[Dict[str, Any]]) -> Tuple[Any, ...]:
+        """Summarize the blocks so that new usage changes the result."""
+        if not blocks:
+            return (0,)
+        last = blocks[-1]
+        return (
+            len(blocks),
+            last.get("id"),
+            last.get("totalTokens", 0),
+            last.get("isActive", False),
+        )
+
+
+def create_scheduler(args: Any, base_interval: float) -> Optional[AdaptiveScheduler]:
+    """Create a scheduler from command line arguments.
+
+    Args:
+        args: Command line arguments with adaptive refresh settings
+        base_interval: Configured refresh rate in seconds
+
+    Returns:
+        Scheduler, or None if adaptive refresh is disabled
+    """
+    if getattr(args, "adaptive_refresh", False) is not True:
+        return None
+    return AdaptiveScheduler(
+        base_interval,
+        min_interval=getattr(args, "min_refresh_rate", DEFAULT_MIN_INTERVAL),
+        max_interval=getattr(args, "max_refresh_rate", DEFAULT_MAX_INTERVAL),
+    )
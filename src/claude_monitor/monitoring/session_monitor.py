@@ -1,21 +1,70 @@
 """Unified session monitoring - combines tracking and validation."""
 
+import contextlib
+import json
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import operator
+import os
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+SESSION_LOG_NAME = "sessions.jsonl"
+MAX_SESSION_HISTORY = 500
+
+# Validation depends only on these fields, so a block whose values are
+# unchanged since it last passed does not need to be validated again
+_REQUIRED_FIELDS: Tuple[str, ...] = ("id", "isActive", "totalTokens", "costUSD")
+_block_fingerprint = operator.itemgetter(*_REQUIRED_FIELDS)
+
 
 class SessionMonitor:
-    """Monitors sessions with tracking and validation."""
+    """Monitors sessions with tracking and validation.
+
+    Updates validate incrementally. Blocks before the first active one are
+    closed and no longer change, and the data manager hands out the same
+    closed block objects on every update; when an update starts with the
+    closed run of the previous one (checked at both ends), that run is
+    neither validated nor indexed again. Of the remaining blocks, those that
+    passed validation in the previous update with the same field values are
+    not checked again. The index by id is updated for the changed blocks
+    only, and the active block is remembered while indexing.
+
+    Session starts are kept in a ring buffer of the most recent
+    ``max_history`` sessions. With a ``history_path`` they are also appended
+    to a JSON lines log, which is read back on start so the history survives
+    restarts; the log is compacted once it holds twice the buffer size.
+    """
+
+    def __init__(
+        self,
+        history_path: Optional[Path] = None,
+        max_history: int = MAX_SESSION_HISTORY,
+    ) -> None:
+        """Initialize session monitor.
 
-    def __init__(self) -> None:
-        """Initialize session monitor."""
+        Args:
+            history_path: Optional append-only session log
+            max_history: Number of sessions kept in memory and after compaction
+        """
         self._current_session_id: Optional[str] = None
         self._session_callbacks: List[
             Callable[[str, str, Optional[Dict[str, Any]]], None]
         ] = []
-        self._session_history: List[Dict[str, Any]] = []
+        self._session_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
+        self._history_path: Optional[Path] = history_path
+        self._log_lines: int = 0
+        self._session_total: int = 0
+        self._load_history()
+        self._fingerprints: Dict[Any, Tuple[Any, ...]] = {}
+        self._blocks_by_id: Dict[Any, Dict[str, Any]] = {}
+        self._active_block: Optional[Dict[str, Any]] = None
+        # Blocks of the last valid update and the length of its closed run
+        self._blocks: List[Any] = []
+        self._closed_count: int = 0
 
     def update(self, data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """Update session tracking with new data and validate.
@@ -28,18 +77,12 @@ class SessionMonitor:
         """
         is_valid: bool
         errors: List[str]
-        is_valid, errors = self.validate_data(data)
+        is_valid, errors = self._validate_and_index(data)
         if not is_valid:
             logger.warning(f"Data validation failed: {errors}")
             return is_valid, errors
 
-        blocks: List[Dict[str, Any]] = data.get("blocks", [])
-
-        active_session: Optional[Dict[str, Any]] = None
-        for block in blocks:
-            if block.get("isActive", False):
-                active_session = block
-                break
+        active_session: Optional[Dict[str, Any]] = self._active_block
 
         if active_session:
             session_id: Optional[str] = active_session.get("id")
@@ -83,6 +126,77 @@ class SessionMonitor:
 
         return len(errors) == 0, errors
 
+    def _validate_and_index(self, data: Any) -> Tuple[bool, List[str]]:
+        """Validate like validate_data, skipping blocks unchanged since the last
+        valid update, and index the blocks if they are all valid.
+
+        Args:
+            data: Data to validate
+
+        Returns:
+            Tuple of (is_valid, error_messages)
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("blocks"), list):
+            return self.validate_data(data)
+
+        blocks: List[Any] = data["blocks"]
+        previous_blocks = self._blocks
+        reused = self._closed_count
+        if not (
+            reused
+            and len(blocks) >= reused
+            and blocks[0] is previous_blocks[0]
+            and blocks[reused - 1] is previous_blocks[reused - 1]
+        ):
+            reused = 0
+
+        errors: List[str] = []
+        previous = self._fingerprints
+        fingerprints: Dict[Any, Tuple[Any, ...]] = {}
+        changed_by_id: Dict[Any, Dict[str, Any]] = {}
+        active_index: Optional[int] = None
+
+        for index in range(reused, len(blocks)):
+            block = blocks[index]
+            try:
+                fingerprint = _block_fingerprint(block)
+                known = previous.get(fingerprint[0])
+            except (KeyError, TypeError):
+                # Missing fields, or an id that cannot be indexed
+                block_errors = self._validate_block(block, index)
+                errors.extend(block_errors)
+                if not block_errors and active_index is None and block["isActive"]:
+                    active_index = index
+                continue
+
+            # "is" keeps 1 from passing for a previously seen True
+            if known != fingerprint or known[1] is not fingerprint[1]:
+                block_errors = self._validate_block(block, index)
+                if block_errors:
+                    errors.extend(block_errors)
+                    continue
+
+            fingerprints[fingerprint[0]] = fingerprint
+            changed_by_id[fingerprint[0]] = block
+            if active_index is None and fingerprint[1]:
+                active_index = index
+
+        if errors:
+            return False, errors
+
+        if reused:
+            for block in previous_blocks[reused:]:
+                with contextlib.suppress(KeyError, TypeError):
+                    del self._blocks_by_id[block["id"]]
+            self._blocks_by_id.update(changed_by_id)
+        else:
+            self._blocks_by_id = changed_by_id
+        self._fingerprints = fingerprints
+        self._blocks = blocks
+        self._closed_count = len(blocks) if active_index is None else active_index
+        self._active_block = None if active_index is None else blocks[active_index]
+        return True, errors
+
     def _validate_block(self, block: Any, index: int) -> List[str]:
         """Validate individual block.
 
@@ -99,8 +213,7 @@ class SessionMonitor:
             errors.append(f"Block {index} must be a dictionary")
             return errors
 
-        required_fields: List[str] = ["id", "isActive", "totalTokens", "costUSD"]
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in block:
                 errors.append(f"Block {index} missing required field: {field}")
 
@@ -132,7 +245,7 @@ class SessionMonitor:
         else:
             logger.info(f"Session changed from {old_id} to {new_id}")
 
-        self._session_history.append(
+        self._record_session(
             {
                 "id": new_id,
                 "started_at": session_data.get("startTime"),
@@ -147,6 +260,63 @@ class SessionMonitor:
             except Exception as e:
                 logger.exception(f"Session callback error: {e}")
 
+    def _record_session(self, entry: Dict[str, Any]) -> None:
+        """Add a session start to the history and the session log.
+
+        A session that is already the last one logged (still active when the
+        monitor was restarted) is not recorded again.
+        """
+        if self._session_history and self._session_history[-1].get("id") == entry["id"]:
+            return
+        self._session_history.append(entry)
+        self._session_total += 1
+        if self._history_path is None:
+            return
+
+        try:
+            self._history_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._history_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._log_lines += 1
+            if self._log_lines > 2 * (self._session_history.maxlen or 0):
+                self._compact_log()
+        except OSError as e:
+            logger.warning(f"Failed to append to session log: {e}")
+
+    def _load_history(self) -> None:
+        """Read the most recent sessions from the session log."""
+        if self._history_path is None:
+            return
+
+        try:
+            with open(self._history_path, encoding="utf-8") as f:
+                for line in f:
+                    self._log_lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict):
+                        self._session_history.append(entry)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Failed to read session log: {e}")
+            return
+
+        self._session_total = len(self._session_history)
+        logger.debug(f"Loaded {self._session_total} sessions from session log")
+
+    def _compact_log(self) -> None:
+        """Rewrite the session log with only the sessions kept in memory."""
+        assert self._history_path is not None
+        temp_path = self._history_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for entry in self._session_history:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(temp_path, self._history_path)
+        self._log_lines = len(self._session_history)
+
     def _on_session_end(self, session_id: str) -> None:
         """Handle session end.
 
@@ -188,12 +358,47 @@ class SessionMonitor:
         """Get current active session ID."""
         return self._current_session_id
 
+    @property
+    def active_block(self) -> Optional[Dict[str, Any]]:
+        """Get the active block of the last valid update."""
+        return self._active_block
+
+    def get_block(self, block_id: str) -> Optional[Dict[str, Any]]:
+        """Get a block of the last valid update by id.
+
+        Args:
+            block_id: Block ID
+
+        Returns:
+            Block dictionary or None if not present
+        """
+        return self._blocks_by_id.get(block_id)
+
     @property
     def session_count(self) -> int:
         """Get total number of sessions tracked."""
-        return len(self._session_history)
+        return self._session_total
 
     @property
     def session_history(self) -> List[Dict[str, Any]]:
-        """Get session history."""
-        return self._session_history.copy()
+        """Get the retained session history, oldest first."""
+        return list(self._session_history)
+
+    def recent_sessions(self, limit: int) -> List[Dict[str, Any]]:
+        """Get the most recent sessions without copying the whole history.
+
+        Args:
+            limit: Maximum number of sessions
+
+        Returns:
+            Sessions, newest first
+        """
+        return list(islice(reversed(self._session_history), limit))
+
+
+def get_session_log_path() -> Path:
+    """Get the session log path, honouring CLAUDE_MONITOR_SESSION_LOG."""
+    env_path = os.environ.get("CLAUDE_MONITOR_SESSION_LOG")
+    if env_path:
+        return Path(env_path).expanduser()
+    return Path.home() / ".claude-monitor" / SESSION_LOG_NAME
@@ -0,0 +1,153 @@
+"""Latest-value channel between the data thread and its consumers.
+
+The monitoring thread publishes each processed snapshot to a
+:class:`SnapshotChannel` and moves on. Consumers such as the live display or
+the status file writer run on their own :class:`ChannelSubscriber` threads
+and always pull the newest snapshot, so a slow consumer skips intermediate
+snapshots instead of delaying the next fetch or the other consumers.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+from claude_monitor.error_handling import report_error
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SnapshotChannel(Generic[T]):
+    """Holds the most recently published value and wakes waiting readers."""
+
+    def __init__(self) -> None:
+        """Initialize an empty channel."""
+        self._condition: threading.Condition = threading.Condition()
+        self._value: Optional[T] = None
+        self._version: int = 0
+        self._wakeups: int = 0
+
+    def publish(self, value: T) -> None:
+        """Replace the current value and wake all waiting readers.
+
+        Args:
+            value: New snapshot
+        """
+        with self._condition:
+            self._value = value
+            self._version += 1
+            self._condition.notify_all()
+
+    def latest(self) -> Tuple[int, Optional[T]]:
+        """Get the current version and value without waiting."""
+        with self._condition:
+            return self._version, self._value
+
+    def wait(
+        self, after_version: int, timeout: Optional[float] = None
+    ) -> Tuple[int, Optional[T]]:
+        """Wait for a value newer than after_version.
+
+        Args:
+            after_version: Version the caller has already seen
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Current version and value, which are unchanged on timeout or
+            after wake()
+        """
+        with self._condition:
+            wakeups = self._wakeups
+            self._condition.wait_for(
+                lambda: self._version > after_version or self._wakeups != wakeups,
+                timeout=timeout,
+            )
+            return self._version, self._value
+
+    def wake(self) -> None:
+        """Wake all waiting readers without publishing, e.g. to stop them."""
+        with self._condition:
+            self._wakeups += 1
+            self._condition.notify_all()
+
+
+class ChannelSubscriber(Generic[T]):
+    """Runs a consumer on its own thread with the latest channel value."""
+
+    def __init__(
+        self,
+        channel: SnapshotChannel[T],
+        callback: Callable[[T], None],
+        name: str = "SnapshotSubscriber",
+        min_interval: float = 0.0,
+    ) -> None:
+        """Initialize a subscriber.
+
+        Args:
+            channel: Channel to read from
+            callback: Consumer called with each snapshot it gets to see
+            name: Thread name
+            min_interval: Minimum seconds between callback invocations;
+                snapshots published in between are coalesced
+        """
+        self.channel: SnapshotChannel[T] = channel
+        self.callback: Callable[[T], None] = callback
+        self.name: str = name
+        self.min_interval: float = min_interval
+        self.delivered: int = 0
+        self._seen_version: int = 0
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the subscriber thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start consuming on a daemon thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop consuming and wait for an in-progress callback to finish.
+
+        Args:
+            timeout: Maximum time to wait for the thread
+        """
+        self._stop_event.set()
+        self.channel.wake()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Deliver the newest snapshot whenever one is published."""
+        while not self._stop_event.is_set():
+            version, value = self.channel.wait(self._seen_version, timeout=1.0)
+            if self._stop_event.is_set():
+                break
+            if version <= self._seen_version:
+                continue
+
+            self._seen_version = version
+            started = time.monotonic()
+            try:
+                self.callback(value)  # type: ignore[arg-type]
+                self.delivered += 1
+            except Exception as e:
+                logger.error(f"Subscriber {self.name} error: {e}", exc_info=True)
+                report_error(
+                    exception=e,
+                    component="snapshot_channel",
+                    context_name="subscriber_error",
+                )
+
+            remaining = self.min_interval - (time.monotonic() - started)
+            if remaining > 0:
+                self._stop_event.wait(remaining)
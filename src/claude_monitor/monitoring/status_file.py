@@ -0,0 +1,165 @@
+"""Compact status file shared between the monitor and ``claude-monitor status``.
+
+The running monitor (TUI or daemon) writes a small JSON summary of the active
+session block after every refresh, so shell prompts can show remaining tokens
+without parsing any transcripts.
+
+This module is imported by the ``status`` fast path and must only import
+cheap standard-library modules at module level (no ``typing``, ``pathlib``,
+``datetime`` or third-party packages).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+STATUS_FILE_VERSION = 1
+STATUS_FILE_NAME = "status.json"
+
+
+def get_status_file_path() -> str:
+    """Get the status file path, honouring CLAUDE_MONITOR_STATUS_FILE."""
+    env_path = os.environ.get("CLAUDE_MONITOR_STATUS_FILE")
+    if env_path:
+        return os.path.expanduser(env_path)
+    return os.path.join(os.path.expanduser("~"), ".claude-monitor", STATUS_FILE_NAME)
+
+
+def new_status(
+    plan: str, token_limit: int, source: str, now: float | None = None
+) -> dict:
+    """Create a status dictionary describing no active session.
+
+    Args:
+        plan: Plan name
+        token_limit: Current token limit
+        source: What produced the status ("monitor" or "scan")
+        now: Current epoch time (defaults to time.time())
+
+    Returns:
+        Status dictionary with all fields present
+    """
+    status: dict = {
+        "version": STATUS_FILE_VERSION,
+        "generated_at": time.time() if now is None else now,
+        "source": source,
+        "plan": plan,
+        "token_limit": token_limit,
+        "active": False,
+        "tokens_used": 0,
+        "cost_usd": 0.0,
+        "messages": 0,
+        "burn_rate": 0.0,
+        "session_start": None,
+        "reset_at": None,
+    }
+    add_derived_fields(status)
+    return status
+
+
+def add_derived_fields(status: dict) -> None:
+    """Add remaining-token fields derived from usage and limit."""
+    limit = status.get("token_limit") or 0
+    used = status.get("tokens_used") or 0
+    status["tokens_left"] = max(0, limit - used)
+    status["percent_used"] = round(used / limit * 100, 1) if limit else 0.0
+
+
+def build_status(
+    blocks: list, token_limit: int, plan: str, now: float | None = None
+) -> dict:
+    """Summarize the active block of monitoring data into a status dictionary.
+
+    Args:
+        blocks: Block dictionaries as produced by analyze_usage
+        token_limit: Current token limit
+        plan: Plan name
+        now: Current epoch time (defaults to time.time())
+
+    Returns:
+        Flat dictionary of JSON-serializable status fields
+    """
+    from datetime import datetime
+
+    status = new_status(plan, token_limit, "monitor", now)
+    active = next((b for b in blocks if b.get("isActive") and not b.get("isGap")), None)
+    if not active:
+        return status
+
+    burn_rate = active.get("burnRate") or {}
+    status.update(
+        {
+            "active": True,
+            "tokens_used": active.get("totalTokens", 0),
+            "cost_usd": active.get("costUSD", 0.0),
+            "messages": active.get("sentMessagesCount", 0),
+            "burn_rate": burn_rate.get("tokensPerMinute", 0.0),
+            "session_start": datetime.fromisoformat(
+                active["startTime"].replace("Z", "+00:00")
+            ).timestamp(),
+            "reset_at": datetime.fromisoformat(
+                active["endTime"].replace("Z", "+00:00")
+            ).timestamp(),
+        }
+    )
+    add_derived_fields(status)
+    return status
+
+
+def write_status_file(status: dict, path: str | None = None) -> None:
+    """Atomically write the status file.
+
+    Args:
+        status: Status dictionary from build_status()
+        path: Target path (defaults to get_status_file_path())
+    """
+    path = path or get_status_file_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(status, f)
+    os.replace(temp_path, path)
+
+
+def read_status_file(path: str | None = None) -> dict | None:
+    """Read the status file.
+
+    Args:
+        path: Source path (defaults to get_status_file_path())
+
+    Returns:
+        Status dictionary, or None if missing, unreadable or of another version
+    """
+    try:
+        with open(path or get_status_file_path(), "rb") as f:
+            status = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(status, dict) or status.get("version") != STATUS_FILE_VERSION:
+        return None
+    return status
+
+
+class StatusFileWriter:
+    """Orchestrator update callback that keeps the status file current."""
+
+    def __init__(self, path: str | None = None) -> None:
+        """Initialize writer.
+
+        Args:
+            path: Target path (defaults to get_status_file_path())
+        """
+        self.path = path or get_status_file_path()
+
+    def __call__(self, monitoring_data: dict) -> None:
+        """Write a status file for the latest monitoring data."""
+        args = monitoring_data.get("args")
+        status = build_status(
+            monitoring_data.get("data", {}).get("blocks", []),
+            monitoring_data.get("token_limit", 0),
+            getattr(args, "plan", "custom"),
+        )
+        write_status_file(status, self.path)
@@ -3,8 +3,10 @@ Raw mode setup, input handling, and terminal control.
 """
 
 import logging
+import os
+import select
 import sys
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from claude_monitor.error_handling import report_error
 from claude_monitor.terminal.themes import print_themed
@@ -18,6 +20,20 @@ try:
 except ImportError:
     HAS_TERMIOS: bool = False
 
+# Escape sequences of navigation keys, mapped to the names read_key() returns
+KEY_SEQUENCES: Dict[str, str] = {
+    "\x1b[A": "up",
+    "\x1b[B": "down",
+    "\x1b[5~": "page_up",
+    "\x1b[6~": "page_down",
+    "\x1b[H": "home",
+    "\x1b[F": "end",
+    "\x1b[1~": "home",
+    "\x1b[4~": "end",
+    "\x1bOH": "home",
+    "\x1bOF": "end",
+}
+
 
 def setup_terminal() -> Optional[List[Any]]:
     """Setup terminal for raw mode to prevent input interference.
@@ -39,6 +55,50 @@ def setup_terminal() -> Optional[List[Any]]:
         return None
 
 
+def supports_key_input() -> bool:
+    """Check if single key presses can be read from stdin."""
+    return HAS_TERMIOS and sys.stdin.isatty()
+
+
+def read_key(timeout: Optional[float] = None) -> Optional[str]:
+    """Read one key press from stdin.
+
+    Expects the terminal in the mode set by setup_terminal(), where input is
+    delivered per key without echo.
+
+    Args:
+        timeout: Maximum time to wait in seconds, or None to block
+
+    Returns:
+        'up', 'down', 'page_up', 'page_down', 'home' or 'end' for navigation
+        keys, the typed character otherwise (including a bare ESC), or None
+        on timeout, for unrecognized escape sequences or if keys cannot be
+        read
+    """
+    if not supports_key_input():
+        return None
+
+    fd: int = sys.stdin.fileno()
+    try:
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return None
+        # An escape sequence arrives in a single read
+        data: str = os.read(fd, 16).decode("utf-8", errors="ignore")
+    except (OSError, ValueError) as e:
+        logger.debug(f"Failed to read key: {e}")
+        return None
+
+    if not data:
+        return None
+    if data in KEY_SEQUENCES:
+        return KEY_SEQUENCES[data]
+    # Unmapped sequences (left/right, F-keys, paste) must not read as ESC
+    if data.startswith("\x1b") and len(data) > 1:
+        return None
+    return data[0]
+
+
 def restore_terminal(old_settings: Optional[List[Any]]) -> None:
     """Restore terminal to original settings.
 
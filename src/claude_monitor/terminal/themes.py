@@ -1,19 +1,21 @@
 """Unified theme management for terminal display."""
 
+import json
 import logging
 import os
 import re
 import sys
 import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Windows-compatible imports with graceful fallbacks
 try:
     import select
     import termios
-    import tty
 
     HAS_TERMIOS: bool = True
 except ImportError:
@@ -22,6 +24,12 @@ except ImportError:
 from rich.console import Console
 from rich.theme import Theme
 
+# Seconds to wait for a terminal to answer the OSC 11 background query
+OSC_QUERY_TIMEOUT: float = 0.2
+
+# OSC 11 request for the terminal's background color, terminated by ST
+OSC_BACKGROUND_QUERY: str = "\033]11;?\033\\"
+
 
 class BackgroundType(Enum):
     """Background detection types."""
@@ -248,16 +256,22 @@ class BackgroundDetector:
     """
 
     @staticmethod
-    def detect_background() -> BackgroundType:
+    def detect_background(allow_query: bool = True) -> BackgroundType:
         """Detect terminal background using multiple methods.
 
         Tries multiple detection methods in order of reliability:
         1. COLORFGBG environment variable
         2. Known terminal environment hints
-        3. OSC 11 color query (advanced terminals)
+        3. Cached result of an earlier OSC 11 query for this terminal
+        4. OSC 11 color query (advanced terminals)
+
+        Args:
+            allow_query: If False, never block on the OSC 11 query and return
+                UNKNOWN when the cheaper methods are inconclusive.
 
         Returns:
-            Detected background type, defaults to DARK if unknown.
+            Detected background type, defaults to DARK if unknown and
+            querying is allowed.
         """
         # Method 1: Check COLORFGBG environment variable
         colorfgbg_result: BackgroundType = BackgroundDetector._check_colorfgbg()
@@ -269,9 +283,19 @@ class BackgroundDetector:
         if env_result != BackgroundType.UNKNOWN:
             return env_result
 
-        # Method 3: Use OSC 11 query (advanced terminals only)
+        # Method 3: Reuse the answer this terminal gave on an earlier launch
+        cache = BackgroundCache()
+        cached_result: BackgroundType = cache.get()
+        if cached_result != BackgroundType.UNKNOWN:
+            return cached_result
+
+        if not allow_query:
+            return BackgroundType.UNKNOWN
+
+        # Method 4: Use OSC 11 query (advanced terminals only)
         osc_result: BackgroundType = BackgroundDetector._query_background_color()
         if osc_result != BackgroundType.UNKNOWN:
+            cache.set(osc_result)
             return osc_result
 
         # Default fallback
@@ -337,12 +361,19 @@ class BackgroundDetector:
         return BackgroundType.UNKNOWN
 
     @staticmethod
-    def _query_background_color() -> BackgroundType:
+    def _query_background_color(console: Optional[Console] = None) -> BackgroundType:
         """Query terminal background color using OSC 11.
 
         Sends an OSC (Operating System Command) 11 query to request the terminal's
         background color, then calculates perceived brightness to determine if
-        the background is light or dark.
+        the background is light or dark. Only echo and canonical mode are
+        disabled while waiting, so output post-processing stays intact and the
+        query can run while the display is already rendering. A reply that
+        misses the timeout is flushed from stdin so it is not read as keys.
+
+        Args:
+            console: Console that is rendering, if any; the query is written
+                under its lock so it cannot split a frame.
 
         Returns:
             Background type based on OSC 11 response or UNKNOWN if query fails.
@@ -355,99 +386,192 @@ class BackgroundDetector:
 
         old_settings: Optional[List[Any]] = None
         try:
-            # Save terminal settings
-            old_settings = termios.tcgetattr(sys.stdin)
-
-            # Set terminal to raw mode
-            tty.setraw(sys.stdin.fileno())
+            fd: int = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            new_settings: List[Any] = termios.tcgetattr(fd)
+            new_settings[3] = new_settings[3] & ~(termios.ECHO | termios.ICANON)
+            termios.tcsetattr(fd, termios.TCSANOW, new_settings)
 
             # Send OSC 11 query
-            sys.stdout.write("\033]11;?\033\\")
-            sys.stdout.flush()
-
-            # Wait for response with timeout
-            ready_streams: List[Any] = select.select([sys.stdin], [], [], 0.1)[0]
-            if ready_streams:
-                # Read available data without blocking
-                response: str = ""
-                try:
-                    # Read character by character with timeout to avoid blocking
-                    import fcntl
-                    import os
-
-                    # Set stdin to non-blocking mode
-                    fd = sys.stdin.fileno()
-                    fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-                    fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-
-                    # Read up to 50 chars with timeout
-                    for _ in range(50):
-                        ready = select.select([sys.stdin], [], [], 0.01)[0]
-                        if not ready:
-                            break
-                        char = sys.stdin.read(1)
-                        if not char:
-                            break
-                        response += char
-                        # Stop if we get the expected terminator
-                        if response.endswith("\033\\"):
-                            break
-
-                    # Restore blocking mode
-                    fcntl.fcntl(fd, fcntl.F_SETFL, fl)
-
-                except (OSError, ImportError):
-                    # Fallback to simple read if fcntl is not available
-                    response = sys.stdin.read(50)
-
-                # Parse response: \033]11;rgb:rrrr/gggg/bbbb\033\\
-                if response:  # Only proceed if we got a response
-                    rgb_match = re.search(
-                        r"rgb:([0-9a-f]+)/([0-9a-f]+)/([0-9a-f]+)", response
-                    )
-                    if rgb_match:
-                        r: str
-                        g: str
-                        b: str
-                        r, g, b = rgb_match.groups()
-                        # Convert hex to int and calculate brightness
-                        red: int = int(r[:2], 16) if len(r) >= 2 else 0
-                        green: int = int(g[:2], 16) if len(g) >= 2 else 0
-                        blue: int = int(b[:2], 16) if len(b) >= 2 else 0
-
-                        # Calculate perceived brightness using standard formula
-                        brightness: float = (
-                            red * 299 + green * 587 + blue * 114
-                        ) / 1000
-
-                        # Restore terminal settings
-                        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-
-                        return (
-                            BackgroundType.LIGHT
-                            if brightness > 127
-                            else BackgroundType.DARK
-                        )
+            if console is not None:
+                with console._lock:
+                    console.file.write(OSC_BACKGROUND_QUERY)
+                    console.file.flush()
+            else:
+                sys.stdout.write(OSC_BACKGROUND_QUERY)
+                sys.stdout.flush()
+
+            # Read until ST/BEL terminator, giving up after OSC_QUERY_TIMEOUT
+            response: bytes = b""
+            deadline: float = time.monotonic() + OSC_QUERY_TIMEOUT
+            while len(response) < 64:
+                remaining: float = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    break
+                chunk: bytes = os.read(fd, 64)
+                if not chunk:
+                    break
+                response += chunk
+                if response.endswith((b"\033\\", b"\007")):
+                    break
+            if not response.endswith((b"\033\\", b"\007")):
+                # Drop a partial or late reply before the input is read again
+                termios.tcflush(fd, termios.TCIFLUSH)
+
+            # Parse response: \033]11;rgb:rrrr/gggg/bbbb\033\\
+            rgb_match = re.search(
+                r"rgb:([0-9a-f]+)/([0-9a-f]+)/([0-9a-f]+)",
+                response.decode("ascii", errors="ignore").lower(),
+            )
+            if rgb_match:
+                r: str
+                g: str
+                b: str
+                r, g, b = rgb_match.groups()
+                # Convert hex to int and calculate brightness
+                red: int = int(r[:2], 16) if len(r) >= 2 else 0
+                green: int = int(g[:2], 16) if len(g) >= 2 else 0
+                blue: int = int(b[:2], 16) if len(b) >= 2 else 0
+
+                # Calculate perceived brightness using standard formula
+                brightness: float = (red * 299 + green * 587 + blue * 114) / 1000
+                return BackgroundType.LIGHT if brightness > 127 else BackgroundType.DARK
+
+        except (OSError, termios.error, AttributeError, ValueError) as e:
+            logger: logging.Logger = logging.getLogger(__name__)
+            logger.debug(f"OSC 11 background query failed: {e}")
 
+        finally:
             # Restore terminal settings
-            if old_settings is not None:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-
-        except (OSError, termios.error, AttributeError):
-            # Restore terminal settings on any error
             if old_settings is not None:
                 try:
                     termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
                 except (OSError, termios.error, AttributeError) as e:
                     # Terminal settings restoration failed - log but continue
                     # This is non-critical as the terminal will be cleaned up on process exit
-                    logger: logging.Logger = logging.getLogger(__name__)
+                    logger = logging.getLogger(__name__)
                     logger.warning(
                         f"Failed to restore terminal settings during OSC query: {e}"
                     )
 
         return BackgroundType.UNKNOWN
 
+    @staticmethod
+    def start_background_query(
+        callback: Callable[[BackgroundType], None],
+        console: Optional[Console] = None,
+    ) -> threading.Thread:
+        """Run the OSC 11 query in a daemon thread.
+
+        The result is stored in the background cache and passed to callback,
+        so callers can start rendering with a provisional theme.
+
+        Args:
+            callback: Called with the detected background (possibly UNKNOWN).
+            console: Console rendering meanwhile; see _query_background_color.
+
+        Returns:
+            The started thread; join it before restoring terminal settings.
+        """
+
+        def _run() -> None:
+            background: BackgroundType = BackgroundDetector._query_background_color(
+                console
+            )
+            if background != BackgroundType.UNKNOWN:
+                BackgroundCache().set(background)
+            callback(background)
+
+        thread = threading.Thread(target=_run, name="BackgroundQuery", daemon=True)
+        thread.start()
+        return thread
+
+
+class BackgroundCache:
+    """Persists detected terminal backgrounds in the config directory.
+
+    Entries are keyed by TERM, COLORFGBG and TERM_PROGRAM, so the OSC 11
+    query only runs once per kind of terminal rather than once per tty.
+    """
+
+    MAX_ENTRIES: int = 32
+
+    def __init__(
+        self, cache_file: Optional[Path] = None, ttl_seconds: float = 7 * 24 * 3600
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            cache_file: Cache file path (defaults to ~/.claude-monitor/terminal_background.json).
+            ttl_seconds: Age after which cached results are ignored.
+        """
+        self.cache_file: Path = (
+            cache_file or Path.home() / ".claude-monitor" / "terminal_background.json"
+        )
+        self.ttl_seconds: float = ttl_seconds
+
+    @staticmethod
+    def terminal_key() -> str:
+        """Build the cache key identifying the current terminal."""
+        return "|".join(
+            [
+                os.environ.get("TERM", ""),
+                os.environ.get("COLORFGBG", ""),
+                os.environ.get("TERM_PROGRAM", ""),
+            ]
+        )
+
+    def get(self, key: Optional[str] = None) -> BackgroundType:
+        """Get the cached background for a terminal.
+
+        Args:
+            key: Cache key, defaults to terminal_key().
+
+        Returns:
+            Cached background type or UNKNOWN if missing or expired.
+        """
+        entry: Dict[str, Any] = self._load().get(key or self.terminal_key(), {})
+        if time.time() - entry.get("timestamp", 0) > self.ttl_seconds:
+            return BackgroundType.UNKNOWN
+        try:
+            return BackgroundType(entry.get("background", "unknown"))
+        except ValueError:
+            return BackgroundType.UNKNOWN
+
+    def set(self, background: BackgroundType, key: Optional[str] = None) -> None:
+        """Store the detected background for a terminal.
+
+        Args:
+            background: Detected background type.
+            key: Cache key, defaults to terminal_key().
+        """
+        entries: Dict[str, Dict[str, Any]] = self._load()
+        entries[key or self.terminal_key()] = {
+            "background": background.value,
+            "timestamp": time.time(),
+        }
+        newest: List[Tuple[str, Dict[str, Any]]] = sorted(
+            entries.items(), key=lambda item: item[1].get("timestamp", 0)
+        )[-self.MAX_ENTRIES :]
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file: Path = self.cache_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(dict(newest), f)
+            temp_file.replace(self.cache_file)
+        except OSError as e:
+            logging.getLogger(__name__).debug(f"Failed to save background cache: {e}")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load all cache entries."""
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data: Any = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
 
 class ThemeManager:
     """Manages themes with auto-detection and thread safety."""
@@ -456,6 +580,8 @@ class ThemeManager:
         self._lock = threading.Lock()
         self._current_theme: Optional[ThemeConfig] = None
         self._forced_theme: Optional[str] = None
+        self._detection_pending: bool = False
+        self._generation: int = 0
         self.themes = self._load_themes()
 
     def _load_themes(self) -> Dict[str, ThemeConfig]:
@@ -533,13 +659,18 @@ class ThemeManager:
         """Auto-detect appropriate theme based on terminal.
 
         Uses BackgroundDetector to determine terminal background
-        and returns appropriate theme name.
+        and returns appropriate theme name. The OSC 11 query is never run
+        here; when cheaper methods are inconclusive 'dark' is used
+        provisionally and refine_auto_theme() can correct it later.
 
         Returns:
             Theme name ('light', 'dark') based on detected background.
             Defaults to 'dark' if detection fails.
         """
-        background: BackgroundType = BackgroundDetector.detect_background()
+        background: BackgroundType = BackgroundDetector.detect_background(
+            allow_query=False
+        )
+        self._detection_pending = background == BackgroundType.UNKNOWN
 
         if background == BackgroundType.LIGHT:
             return "light"
@@ -575,7 +706,9 @@ class ThemeManager:
                 theme = self.themes.get(name, self.themes["dark"])
                 self._forced_theme = name if name in self.themes else None
 
-            self._current_theme = theme
+            if theme is not self._current_theme:
+                self._current_theme = theme
+                self._generation += 1
             return theme
 
     def get_console(
@@ -593,6 +726,33 @@ class ThemeManager:
         theme: ThemeConfig = self.get_theme(theme_name, force_detection)
         return Console(theme=theme.rich_theme, force_terminal=True)
 
+    def refine_auto_theme(self, console: Console) -> Optional[threading.Thread]:
+        """Resolve a provisional auto theme with an asynchronous OSC 11 query.
+
+        Args:
+            console: Console created with the provisional theme; the detected
+                theme is pushed onto it once the terminal answers.
+
+        Returns:
+            The query thread, or None if no detection is pending.
+        """
+        with self._lock:
+            if not self._detection_pending:
+                return None
+            self._detection_pending = False
+
+        def _apply(background: BackgroundType) -> None:
+            if background != BackgroundType.LIGHT:
+                return
+            with self._lock:
+                theme: ThemeConfig = self.themes["light"]
+                self._forced_theme = "light"
+                self._current_theme = theme
+                console.push_theme(theme.rich_theme)
+                self._generation += 1
+
+        return BackgroundDetector.start_background_query(_apply, console)
+
     def get_current_theme(self) -> Optional[ThemeConfig]:
         """Get currently active theme.
 
@@ -601,6 +761,14 @@ class ThemeManager:
         """
         return self._current_theme
 
+    def get_generation(self) -> int:
+        """Get a counter that increases whenever the active theme changes.
+
+        Returns:
+            Theme generation, compared by renderers that cache styled output.
+        """
+        return self._generation
+
 
 # Cost-based styles with thresholds (moved from ui/styles.py)
 COST_STYLES: Dict[str, str] = {
@@ -689,6 +857,27 @@ def get_themed_console(force_theme: Optional[Union[str, bool]] = None) -> Consol
     return _theme_manager.get_console(None)
 
 
+def refine_auto_theme(console: Console) -> Optional[threading.Thread]:
+    """Start asynchronous background detection for an auto-themed console.
+
+    Args:
+        console: Console returned by get_themed_console() for the auto theme.
+
+    Returns:
+        The query thread, or None if the theme is already resolved.
+    """
+    return _theme_manager.refine_auto_theme(console)
+
+
+def get_theme_generation() -> int:
+    """Get the generation of the global theme manager's active theme.
+
+    Returns:
+        Counter that increases each time a theme is selected or pushed.
+    """
+    return _theme_manager.get_generation()
+
+
 def print_themed(text: str, style: str = "info") -> None:
     """Print text with themed styling - backward compatibility.
 
@@ -6,22 +6,31 @@ Orchestrates UI components and coordinates display updates.
 import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pytz
-from rich.console import Console, Group, RenderableType
+from rich.console import (
+    Console,
+    ConsoleOptions,
+    Group,
+    RenderableType,
+    RenderResult,
+)
 from rich.live import Live
+from rich.segment import Segment
 from rich.text import Text
 
 from claude_monitor.core.calculations import calculate_hourly_burn_rate
 from claude_monitor.core.models import normalize_model_name
 from claude_monitor.core.plans import Plans
+from claude_monitor.terminal.themes import get_theme_generation
 from claude_monitor.ui.components import (
     AdvancedCustomLimitDisplay,
     ErrorDisplayComponent,
     LoadingScreenComponent,
 )
 from claude_monitor.ui.layouts import ScreenManager
+from claude_monitor.ui.markup_cache import compile_markup
 from claude_monitor.ui.session_display import SessionDisplayComponent
 from claude_monitor.utils.notifications import NotificationManager
 from claude_monitor.utils.time_utils import (
@@ -178,21 +187,12 @@ class DisplayController:
             reset_time_local, time_format, include_seconds=False
         )
 
-        # Current time display
-        try:
-            display_tz = pytz.timezone(args.timezone)
-        except pytz.exceptions.UnknownTimeZoneError:
-            display_tz = pytz.timezone("Europe/Warsaw")
-
-        current_time_display = current_time.astimezone(display_tz)
-        current_time_str = format_display_time(
-            current_time_display, time_format, include_seconds=True
-        )
-
         return {
             "predicted_end_str": predicted_end_str,
             "reset_time_str": reset_time_str,
-            "current_time_str": current_time_str,
+            "current_time_str": self.session_display.format_current_time(
+                current_time, args
+            ),
         }
 
     def create_data_display(
@@ -206,7 +206,8 @@ class DisplayController:
             token_limit: Current token limit
 
         Returns:
-            Rich renderable for display
+            Rich renderable for display; session screens re-render only their
+            clock line on each Live refresh
         """
         if not data or "blocks" not in data:
             screen_buffer = self.error_display.format_error_screen(
@@ -224,11 +225,18 @@ class DisplayController:
         # Use UTC timezone for time calculations
         current_time = datetime.now(pytz.UTC)
 
+        session_display = self.session_display
         if not active_block:
-            screen_buffer = self.session_display.format_no_active_session_screen(
-                args.plan, args.timezone, token_limit, current_time, args
+            return self.buffer_manager.create_live_screen(
+                [
+                    session_display.format_header(args.plan, args.timezone),
+                    session_display.format_no_active_session_panels(token_limit),
+                ],
+                lambda: session_display.format_status_line(
+                    session_display.format_current_time(datetime.now(pytz.UTC), args),
+                    active=False,
+                ),
             )
-            return self.buffer_manager.create_screen_renderable(screen_buffer)
 
         cost_limit_p90 = None
         messages_limit_p90 = None
@@ -268,14 +276,14 @@ class DisplayController:
             processed_data["cost_limit_p90"] = cost_limit_p90
             processed_data["messages_limit_p90"] = messages_limit_p90
 
+        # The clock is rendered separately so it can tick between data updates
+        processed_data.pop("current_time_str", None)
         try:
-            screen_buffer = self.session_display.format_active_session_screen(
-                **processed_data
-            )
+            panels = session_display.format_active_session_panels(**processed_data)
         except Exception as e:
             # Log the error with more details
             logger = logging.getLogger(__name__)
-            logger.error(f"Error in format_active_session_screen: {e}", exc_info=True)
+            logger.error(f"Error in format_active_session_panels: {e}", exc_info=True)
             logger.exception(f"processed_data type: {type(processed_data)}")
             if isinstance(processed_data, dict):
                 for key, value in processed_data.items():
@@ -299,7 +307,17 @@ class DisplayController:
             )
             return self.buffer_manager.create_screen_renderable(screen_buffer)
 
-        return self.buffer_manager.create_screen_renderable(screen_buffer)
+        return self.buffer_manager.create_live_screen(
+            [
+                session_display.format_header(
+                    processed_data["plan"], processed_data["timezone"]
+                ),
+                panels,
+            ],
+            lambda: session_display.format_status_line(
+                session_display.format_current_time(datetime.now(pytz.UTC), args)
+            ),
+        )
 
     def _process_active_session_data(
         self,
@@ -549,16 +567,91 @@ class ScreenBufferManager:
         if self.console is None:
             self.console = get_themed_console()
 
+        return Group(*self._to_renderables(screen_buffer))
+
+    def create_live_screen(
+        self, regions: Sequence[List[str]], clock: Callable[[], str]
+    ) -> "LiveScreen":
+        """Create a screen whose clock line is rendered on every refresh.
+
+        Args:
+            regions: Screen regions above the clock, each a list of lines
+                with Rich markup
+            clock: Function returning the current status line markup
+
+        Returns:
+            LiveScreen renderable
+        """
+        return LiveScreen(
+            self._to_renderables([line for region in regions for line in region]),
+            clock,
+        )
+
+    def _to_renderables(self, screen_buffer: List[Any]) -> List[RenderableType]:
+        """Convert markup lines to Text, passing other renderables through."""
         text_objects = []
         for line in screen_buffer:
             if isinstance(line, str):
-                # Use console to render markup properly
-                text_obj = Text.from_markup(line)
-                text_objects.append(text_obj)
+                # Identical lines from earlier frames are not parsed again
+                text_objects.append(compile_markup(line))
             else:
                 text_objects.append(line)
+        return text_objects
+
+
+class LiveScreen:
+    """Screen with a static body and a clock line formatted on each render.
 
-        return Group(*text_objects)
+    Rich Live re-renders its renderable several times per second. The body
+    (header and data panels) is laid out once per width and theme and
+    replayed from cached segments, so a refresh between data updates only
+    formats the clock line, and parses its markup only when the displayed
+    time changes.
+    """
+
+    def __init__(self, body: List[RenderableType], clock: Callable[[], str]) -> None:
+        """Initialize live screen.
+
+        Args:
+            body: Renderables above the clock line
+            clock: Function returning the current status line markup
+        """
+        self.body: List[RenderableType] = body
+        self.clock: Callable[[], str] = clock
+        self._body_key: Optional[Tuple[int, int]] = None
+        self._body_generation: Optional[int] = None
+        self._body_lines: List[List[Segment]] = []
+        self._clock_markup: Optional[str] = None
+        self._clock_text: Text = Text()
+
+    def clock_text(self) -> Text:
+        """Get the clock line, parsing its markup only when it changed."""
+        markup = self.clock()
+        if markup != self._clock_markup:
+            self._clock_text = Text.from_markup(markup)
+            self._clock_markup = markup
+        return self._clock_text
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        """Replay the cached body and render the current clock line."""
+        key = (id(console), options.max_width)
+        # A pushed theme (e.g. the detected light theme) changes how the body
+        # resolves its styles, so the cached lines must be laid out again
+        generation = get_theme_generation()
+        if key != self._body_key or generation != self._body_generation:
+            self._body_lines = console.render_lines(
+                Group(*self.body), options.update(height=None), pad=False
+            )
+            self._body_key = key
+            self._body_generation = generation
+
+        new_line = Segment.line()
+        for line in self._body_lines:
+            yield from line
+            yield new_line
+        yield self.clock_text()
 
 
 # Legacy functions for backward compatibility
@@ -0,0 +1,80 @@
+"""Cache of parsed Rich markup for screen buffers.
+
+Screens are rebuilt from markup strings on every data update, and most lines
+(headers, separators, labels and progress bars at unchanged percentages) are
+identical to the previous frame. Parsing markup is the dominant cost of
+turning a screen buffer into renderables, so parsed lines are kept in a
+bounded LRU cache keyed by their markup.
+
+Parsed :class:`~rich.text.Text` keeps style names rather than resolved
+styles; the theme is applied when the console renders it. Cached lines are
+therefore valid across theme changes and are shared between screens, so
+callers must not modify them.
+"""
+
+import threading
+from collections import OrderedDict
+
+from rich.text import Text
+
+
+class MarkupCache:
+    """Bounded LRU cache of Text objects parsed from markup lines."""
+
+    MAX_LINES: int = 512
+
+    def __init__(self, max_lines: int = MAX_LINES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_lines: Maximum number of parsed lines to keep
+        """
+        self.max_lines: int = max_lines
+        self._texts: "OrderedDict[str, Text]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached lines."""
+        return len(self._texts)
+
+    def compile(self, markup: str) -> Text:
+        """Parse a markup line, reusing the result for identical lines.
+
+        Args:
+            markup: Line with Rich markup
+
+        Returns:
+            Shared Text object that must not be modified
+        """
+        with self._lock:
+            text = self._texts.get(markup)
+            if text is not None:
+                self._texts.move_to_end(markup)
+                return text
+
+        text = Text.from_markup(markup)
+        with self._lock:
+            self._texts[markup] = text
+            while len(self._texts) > self.max_lines:
+                self._texts.popitem(last=False)
+        return text
+
+    def clear(self) -> None:
+        """Drop all cached lines."""
+        with self._lock:
+            self._texts.clear()
+
+
+markup_cache = MarkupCache()
+
+
+def compile_markup(markup: str) -> Text:
+    """Parse a markup line through the shared cache.
+
+    Args:
+        markup: Line with Rich markup
+
+    Returns:
+        Shared Text object that must not be modified
+    """
+    return markup_cache.compile(markup)
@@ -1,6 +1,12 @@
 """Session display components for Claude Monitor.
 
 Handles formatting of active session screens and session data display.
+
+Screens are assembled from three regions that change at different rates: the
+header (plan and timezone), the data-driven panels (progress bars, burn rate,
+predictions and notifications) and the status line with the ticking clock.
+The header is cached per plan and timezone, the panels are formatted once per
+data update, and a clock tick only formats the status line.
 """
 
 from dataclasses import dataclass
@@ -9,7 +15,7 @@ from typing import Any, Optional
 
 import pytz
 
-from claude_monitor.i18n.messages import get_message
+from claude_monitor.i18n.messages import get_current_locale, get_message
 from claude_monitor.ui.components import CostIndicator, VelocityIndicator
 from claude_monitor.ui.layouts import HeaderManager
 from claude_monitor.ui.progress_bars import (
@@ -61,6 +67,7 @@ class SessionDisplayComponent:
         self.token_progress = TokenProgressBar()
         self.time_progress = TimeProgressBar()
         self.model_usage = ModelUsageBar()
+        self._headers: dict[tuple[str, str, str], list[str]] = {}
 
     def _render_wide_progress_bar(self, percentage: float) -> str:
         """Render a wide progress bar (50 chars) using centralized progress bar logic.
@@ -180,11 +187,122 @@ class SessionDisplayComponent:
         Returns:
             List of formatted screen lines
         """
+        screen_buffer = self.format_header(plan, timezone)
+        screen_buffer.extend(
+            self.format_active_session_panels(
+                plan=plan,
+                timezone=timezone,
+                tokens_used=tokens_used,
+                token_limit=token_limit,
+                usage_percentage=usage_percentage,
+                tokens_left=tokens_left,
+                elapsed_session_minutes=elapsed_session_minutes,
+                total_session_minutes=total_session_minutes,
+                burn_rate=burn_rate,
+                session_cost=session_cost,
+                per_model_stats=per_model_stats,
+                sent_messages=sent_messages,
+                predicted_end_str=predicted_end_str,
+                reset_time_str=reset_time_str,
+                show_switch_notification=show_switch_notification,
+                show_exceed_notification=show_exceed_notification,
+                show_tokens_will_run_out=show_tokens_will_run_out,
+                original_limit=original_limit,
+                **kwargs,
+            )
+        )
+        screen_buffer.append(self.format_status_line(current_time_str))
+        return screen_buffer
+
+    def format_header(self, plan: str, timezone: str) -> list[str]:
+        """Format the header region, which only changes with plan or timezone.
+
+        Args:
+            plan: Current plan name
+            timezone: Display timezone
+
+        Returns:
+            New list with the header lines
+        """
+        key = (plan, timezone, get_current_locale())
+        header = self._headers.get(key)
+        if header is None:
+            header = HeaderManager().create_header(plan, timezone)
+            self._headers[key] = header
+        return list(header)
+
+    def format_status_line(
+        self, current_time_str: Optional[str], active: bool = True
+    ) -> str:
+        """Format the status line with the clock, the only per-tick region.
+
+        Args:
+            current_time_str: Current time string, or None if unavailable
+            active: Whether a session is active
+
+        Returns:
+            Formatted status line
+        """
+        time_str = current_time_str or "--:--:--"
+        if active:
+            return f"⏰ [dim]{time_str}[/] 📝 [success]{get_message('ui.active_session')}[/] | [dim]{get_message('ui.ctrl_c_to_exit')}[/] 🟢"
+        return f"⏰ [dim]{time_str}[/] 📝 [info]{get_message('ui.no_active_session')}[/] | [dim]{get_message('ui.ctrl_c_to_exit')}[/] 🟨"
+
+    def format_current_time(
+        self, current_time: Optional[datetime], args: Optional[Any]
+    ) -> Optional[str]:
+        """Format the clock for the status line in the configured timezone.
+
+        Args:
+            current_time: Current datetime
+            args: Command line arguments with timezone and time format
+
+        Returns:
+            Formatted time, or None if it cannot be shown
+        """
+        if not current_time or not args:
+            return None
+        try:
+            display_tz = pytz.timezone(args.timezone)
+            return format_display_time(
+                current_time.astimezone(display_tz),
+                get_time_format_preference(args),
+                include_seconds=True,
+            )
+        except (pytz.exceptions.UnknownTimeZoneError, AttributeError):
+            return None
+
+    def format_active_session_panels(
+        self,
+        plan: str,
+        timezone: str,
+        tokens_used: int,
+        token_limit: int,
+        usage_percentage: float,
+        tokens_left: int,
+        elapsed_session_minutes: float,
+        total_session_minutes: float,
+        burn_rate: float,
+        session_cost: float,
+        per_model_stats: dict[str, Any],
+        sent_messages: int,
+        predicted_end_str: str,
+        reset_time_str: str,
+        show_switch_notification: bool = False,
+        show_exceed_notification: bool = False,
+        show_tokens_will_run_out: bool = False,
+        original_limit: int = 0,
+        **kwargs,
+    ) -> list[str]:
+        """Format the data-driven region between header and status line.
 
-        screen_buffer = []
+        Args:
+            See format_active_session_screen.
 
-        header_manager = HeaderManager()
-        screen_buffer.extend(header_manager.create_header(plan, timezone))
+        Returns:
+            List of formatted panel lines
+        """
+        screen_buffer: list[str] = []
 
         if plan in ["custom", "pro", "max5", "max20"]:
             from claude_monitor.core.plans import DEFAULT_COST_LIMIT
@@ -328,10 +446,6 @@ class SessionDisplayComponent:
             token_limit,
         )
 
-        screen_buffer.append(
-            f"⏰ [dim]{current_time_str}[/] 📝 [success]{get_message('ui.active_session')}[/] | [dim]{get_message('ui.ctrl_c_to_exit')}[/] 🟢"
-        )
-
         return screen_buffer
 
     def _add_notifications(
@@ -397,10 +511,25 @@ class SessionDisplayComponent:
             List of formatted screen lines
         """
 
-        screen_buffer = []
+        screen_buffer = self.format_header(plan, timezone)
+        screen_buffer.extend(self.format_no_active_session_panels(token_limit))
+        screen_buffer.append(
+            self.format_status_line(
+                self.format_current_time(current_time, args), active=False
+            )
+        )
+        return screen_buffer
+
+    def format_no_active_session_panels(self, token_limit: int) -> list[str]:
+        """Format the panels shown while no session is active.
 
-        header_manager = HeaderManager()
-        screen_buffer.extend(header_manager.create_header(plan, timezone))
+        Args:
+            token_limit: Token limit for the plan
+
+        Returns:
+            List of formatted panel lines
+        """
+        screen_buffer: list[str] = []
 
         empty_token_bar = self.token_progress.render(0.0)
         screen_buffer.append(f"📊 [value]{get_message('ui.token_usage_label')}[/]    {empty_token_bar}")
@@ -418,25 +547,4 @@ class SessionDisplayComponent:
         screen_buffer.append(f"📨 [value]{get_message('ui.sent_messages_label')}[/]  [info]0[/] [dim]{get_message('ui.messages')}[/]")
         screen_buffer.append("")
 
-        if current_time and args:
-            try:
-                display_tz = pytz.timezone(args.timezone)
-                current_time_display = current_time.astimezone(display_tz)
-                current_time_str = format_display_time(
-                    current_time_display,
-                    get_time_format_preference(args),
-                    include_seconds=True,
-                )
-                screen_buffer.append(
-                    f"⏰ [dim]{current_time_str}[/] 📝 [info]{get_message('ui.no_active_session')}[/] | [dim]{get_message('ui.ctrl_c_to_exit')}[/] 🟨"
-                )
-            except (pytz.exceptions.UnknownTimeZoneError, AttributeError):
-                screen_buffer.append(
-                    f"⏰ [dim]--:--:--[/] 📝 [info]{get_message('ui.no_active_session')}[/] | [dim]{get_message('ui.ctrl_c_to_exit')}[/] 🟨"
-                )
-        else:
-            screen_buffer.append(
-                f"⏰ [dim]--:--:--[/] 📝 [info]{get_message('ui.no_active_session')}[/] | [dim]{get_message('ui.ctrl_c_to_exit')}[/] 🟨"
-            )
-
         return screen_buffer
@@ -4,11 +4,13 @@ This module provides UI components for displaying aggregated usage data
 in table format using Rich library.
 """
 
+import bisect
 import logging
-from typing import Any, Dict, List, Optional, Union
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from rich.align import Align
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -18,6 +20,11 @@ from claude_monitor.utils.formatting import format_currency, format_number
 
 logger = logging.getLogger(__name__)
 
+# Width of the Models column, used to estimate wrapped row heights
+MODELS_COLUMN_WIDTH = 20
+# Title, borders, header, totals row and footer around the rows of a page
+TABLE_CHROME_LINES = 9
+
 
 class TableViewsController:
     """Controller for table-based views (daily, monthly)."""
@@ -66,7 +73,7 @@ class TableViewsController:
         table.add_column(
             period_column_name, style=self.key_style, width=period_column_width
         )
-        table.add_column("Models", style=self.value_style, width=20)
+        table.add_column("Models", style=self.value_style, width=MODELS_COLUMN_WIDTH)
         table.add_column("Input", style=self.value_style, justify="right", width=12)
         table.add_column("Output", style=self.value_style, justify="right", width=12)
         table.add_column(
@@ -287,6 +294,46 @@ class TableViewsController:
 
         return panel
 
+    def calculate_totals(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Calculate totals over aggregated rows.
+
+        Args:
+            data: Aggregated data (daily or monthly)
+
+        Returns:
+            Dictionary with total statistics
+        """
+        return {
+            "input_tokens": sum(d["input_tokens"] for d in data),
+            "output_tokens": sum(d["output_tokens"] for d in data),
+            "cache_creation_tokens": sum(d["cache_creation_tokens"] for d in data),
+            "cache_read_tokens": sum(d["cache_read_tokens"] for d in data),
+            "total_tokens": sum(
+                d["input_tokens"]
+                + d["output_tokens"]
+                + d["cache_creation_tokens"]
+                + d["cache_read_tokens"]
+                for d in data
+            ),
+            "total_cost": sum(d["total_cost"] for d in data),
+            "entries_count": sum(d.get("entries_count", 0) for d in data),
+        }
+
+    def row_height(self, data: Dict[str, Any]) -> int:
+        """Estimate the terminal lines a data row takes, including its rule.
+
+        Args:
+            data: Aggregated row
+
+        Returns:
+            Number of lines
+        """
+        models_text = self._format_models(data["models_used"])
+        return 1 + sum(
+            max(1, math.ceil(len(line) / MODELS_COLUMN_WIDTH))
+            for line in models_text.split("\n")
+        )
+
     def create_aggregate_table(
         self,
         aggregate_data: Union[List[Dict[str, Any]], List[Dict[str, Any]]],
@@ -342,22 +389,36 @@ class TableViewsController:
                 print(no_data_display)
             return
 
-        # Calculate totals
-        totals = {
-            "input_tokens": sum(d["input_tokens"] for d in data),
-            "output_tokens": sum(d["output_tokens"] for d in data),
-            "cache_creation_tokens": sum(d["cache_creation_tokens"] for d in data),
-            "cache_read_tokens": sum(d["cache_read_tokens"] for d in data),
-            "total_tokens": sum(
-                d["input_tokens"]
-                + d["output_tokens"]
-                + d["cache_creation_tokens"]
-                + d["cache_read_tokens"]
-                for d in data
-            ),
-            "total_cost": sum(d["total_cost"] for d in data),
-            "entries_count": sum(d.get("entries_count", 0) for d in data),
-        }
+        view = self.create_aggregated_view(data, view_mode, timezone)
+
+        # Display using console if provided
+        if console:
+            console.print(view)
+        else:
+            from rich import print as rprint
+
+            rprint(view)
+
+    def create_aggregated_view(
+        self,
+        data: List[Dict[str, Any]],
+        view_mode: str,
+        timezone: str,
+        totals: Optional[Dict[str, Any]] = None,
+    ) -> RenderableType:
+        """Create the summary panel followed by the table.
+
+        Args:
+            data: Aggregated data, at least one row
+            view_mode: View type ('daily' or 'monthly')
+            timezone: Timezone string
+            totals: Totals over data, computed if omitted
+
+        Returns:
+            Rich renderable with summary and table
+        """
+        if totals is None:
+            totals = self.calculate_totals(data)
 
         # Determine period for summary
         if view_mode == "daily":
@@ -365,20 +426,204 @@ class TableViewsController:
         else:  # monthly
             period = f"{data[0]['month']} to {data[-1]['month']}" if data else "No data"
 
-        # Create and display summary panel
         summary_panel = self.create_summary_panel(view_mode, totals, period)
-
-        # Create and display table
         table = self.create_aggregate_table(data, totals, view_mode, timezone)
+        return Group(summary_panel, Text(""), table)
 
-        # Display using console if provided
-        if console:
-            console.print(summary_panel)
-            console.print()
-            console.print(table)
+
+class VirtualTableView:
+    """Pages through aggregated rows, laying out only the visible window.
+
+    Totals and row heights are kept per row and updated only for the rows
+    that changed, normally the current day or month. Each render builds a
+    table from just the rows that fit the given height, so layout cost
+    depends on the terminal size rather than on the length of the history.
+    The view starts at the newest rows and keeps following them until the
+    user scrolls away.
+    """
+
+    def __init__(
+        self,
+        controller: TableViewsController,
+        data: List[Dict[str, Any]],
+        view_type: str,
+        timezone: str = "UTC",
+    ) -> None:
+        """Initialize the view.
+
+        Args:
+            controller: Controller that builds the tables
+            data: Aggregated data (daily or monthly)
+            view_type: Type of view ('daily' or 'monthly')
+            timezone: Timezone for display
+        """
+        self.controller: TableViewsController = controller
+        self.view_type: str = view_type
+        self.timezone: str = timezone
+        self.data: List[Dict[str, Any]] = []
+        self.totals: Dict[str, Any] = {}
+        self.offset: int = 0
+        self.follow: bool = True
+        self._heights: List[int] = []
+        self._keys: List[str] = []
+        self.set_data(data)
+
+    def set_data(
+        self, data: List[Dict[str, Any]], changed: Optional[Sequence[str]] = None
+    ) -> None:
+        """Replace the rows, keeping the scroll position.
+
+        Rows before the first changed one are kept with their heights and
+        totals; only the rest is measured and summed again.
+
+        Args:
+            data: Aggregated data (daily or monthly), oldest period first
+            changed: Periods whose rows changed, as returned by the
+                aggregator's refresh(); if omitted, rows that are not the
+                same objects as before count as changed
+        """
+        period_field = "date" if self.view_type == "daily" else "month"
+        if changed is not None:
+            start = (
+                bisect.bisect_left(self._keys, min(changed))
+                if changed
+                else len(self.data)
+            )
+            start = min(start, len(self.data), len(data))
         else:
-            from rich import print as rprint
+            start = 0
+            limit = min(len(data), len(self.data))
+            while start < limit and data[start] is self.data[start]:
+                start += 1
+
+        tail = data[start:]
+        if start == 0:
+            self.totals = self.controller.calculate_totals(tail)
+        else:
+            removed = self.controller.calculate_totals(self.data[start:])
+            added = self.controller.calculate_totals(tail)
+            self.totals = {
+                key: value - removed[key] + added[key]
+                for key, value in self.totals.items()
+            }
+        del self._heights[start:]
+        self._heights.extend(self.controller.row_height(row) for row in tail)
+        del self._keys[start:]
+        self._keys.extend(row[period_field] for row in tail)
+        self.data = data
+        self.offset = min(self.offset, max(0, len(data) - 1))
+
+    def window(self, height: int) -> Tuple[int, int]:
+        """Get the range of rows visible at a terminal height.
 
-            rprint(summary_panel)
-            rprint()
-            rprint(table)
+        Args:
+            height: Terminal height in lines
+
+        Returns:
+            Start and end index of the visible rows
+        """
+        start = self._last_page_start(height) if self.follow else self.offset
+        return start, self._page_end(start, height)
+
+    def scroll(self, rows: int, height: int) -> None:
+        """Move the window by a number of rows.
+
+        Args:
+            rows: Rows to move, negative to scroll up
+            height: Terminal height in lines
+        """
+        start, _ = self.window(height)
+        last_start = self._last_page_start(height)
+        self.offset = max(0, min(start + rows, last_start))
+        self.follow = self.offset >= last_start
+
+    def page(self, pages: int, height: int) -> None:
+        """Move the window by whole pages.
+
+        Args:
+            pages: Pages to move, negative to page up
+            height: Terminal height in lines
+        """
+        start, end = self.window(height)
+        self.scroll(pages * max(1, end - start), height)
+
+    def home(self) -> None:
+        """Show the oldest rows."""
+        self.offset = 0
+        self.follow = False
+
+    def end(self) -> None:
+        """Show and follow the newest rows."""
+        self.follow = True
+
+    def handle_key(self, key: str, height: int) -> bool:
+        """Apply a navigation key.
+
+        Args:
+            key: Key name from read_key()
+            height: Terminal height in lines
+
+        Returns:
+            False if the key quits the view, True otherwise
+        """
+        if key in ("q", "Q", "\x1b"):
+            return False
+        if key in ("up", "k"):
+            self.scroll(-1, height)
+        elif key in ("down", "j"):
+            self.scroll(1, height)
+        elif key in ("page_up", "b"):
+            self.page(-1, height)
+        elif key in ("page_down", " ", "f"):
+            self.page(1, height)
+        elif key in ("home", "g"):
+            self.home()
+        elif key in ("end", "G"):
+            self.end()
+        return True
+
+    def render(self, height: int) -> RenderableType:
+        """Build the visible page and a footer with navigation hints.
+
+        Args:
+            height: Terminal height in lines
+
+        Returns:
+            Rich renderable for the page
+        """
+        start, end = self.window(height)
+        table = self.controller.create_aggregate_table(
+            self.data[start:end], self.totals, self.view_type, self.timezone
+        )
+        footer = Text(
+            f"Rows {start + 1 if end > start else 0}-{end} of {len(self.data)}"
+            " · ↑/↓ scroll · PgUp/PgDn page · Home/End · q quit",
+            style="dim",
+        )
+        return Group(table, footer)
+
+    def _rows_height(self, height: int) -> int:
+        """Lines available for data rows."""
+        return max(1, height - TABLE_CHROME_LINES)
+
+    def _page_end(self, start: int, height: int) -> int:
+        """Index after the last row that fits when starting at start."""
+        available = self._rows_height(height)
+        end = start
+        while end < len(self.data):
+            available -= self._heights[end]
+            if available < 0 and end > start:
+                break
+            end += 1
+        return end
+
+    def _last_page_start(self, height: int) -> int:
+        """First row of the page that ends with the newest row."""
+        available = self._rows_height(height)
+        start = len(self.data)
+        while start > 0:
+            available -= self._heights[start - 1]
+            if available < 0 and start < len(self.data):
+                break
+            start -= 1
+        return start
@@ -1,14 +1,17 @@
 """Unified time utilities module combining timezone and system time functionality."""
 
 import contextlib
+import json
 import locale
 import logging
 import os
 import platform
 import re
-import subprocess
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Union
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pytz
 from pytz import BaseTzInfo
@@ -211,7 +214,7 @@ class TimeFormatDetector:
 
     @classmethod
     def detect_from_system(cls) -> str:
-        """Platform-specific system detection.
+        """Platform-specific system detection without spawning processes.
 
         Returns:
             '12h' or '24h'
@@ -219,35 +222,15 @@ class TimeFormatDetector:
         system: str = platform.system()
 
         if system == "Darwin":
-            try:
-                result: subprocess.CompletedProcess[str] = subprocess.run(
-                    ["defaults", "read", "NSGlobalDomain", "AppleICUForce12HourTime"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0 and result.stdout.strip() == "1":
-                    return "12h"
-
-                date_result: subprocess.CompletedProcess[str] = subprocess.run(
-                    ["date", "+%r"], capture_output=True, text=True, check=True
-                )
-                date_output: str = date_result.stdout.strip()
-                if "AM" in date_output or "PM" in date_output:
-                    return "12h"
-            except Exception:
-                pass
+            if _read_macos_global_preference("AppleICUForce12HourTime") is True:
+                return "12h"
+            if _locale_time_has_ampm():
+                return "12h"
 
         elif system == "Linux":
-            try:
-                locale_result: subprocess.CompletedProcess[str] = subprocess.run(
-                    ["locale", "LC_TIME"], capture_output=True, text=True, check=True
-                )
-                lc_time: str = locale_result.stdout.strip().split("=")[-1].strip('"')
-                if lc_time and any(x in lc_time for x in ["en_US", "en_CA", "en_AU"]):
-                    return "12h"
-            except Exception:
-                pass
+            lc_time: str = _get_locale_env("LC_TIME")
+            if lc_time and any(x in lc_time for x in ["en_US", "en_CA", "en_AU"]):
+                return "12h"
 
         elif system == "Windows":
             try:
@@ -278,7 +261,7 @@ class TimeFormatDetector:
             if tz_pref is not None:
                 return tz_pref
 
-        return cls.detect_from_system() == "12h"
+        return get_system_time_format() == "12h"
 
 
 class SystemTimeDetector:
@@ -286,56 +269,44 @@ class SystemTimeDetector:
 
     @staticmethod
     def get_timezone() -> str:
-        """Detect system timezone."""
+        """Detect system timezone from the environment and zoneinfo files."""
         tz: Optional[str] = os.environ.get("TZ")
         if tz:
-            return tz
+            return _zone_name_from_path(tz.lstrip(":")) or tz
 
         system: str = platform.system()
 
-        if system == "Darwin":
+        if system == "Linux" and os.path.exists("/etc/timezone"):
             try:
-                readlink_result: subprocess.CompletedProcess[str] = subprocess.run(
-                    ["readlink", "/etc/localtime"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                tz_path: str = readlink_result.stdout.strip()
-                if "zoneinfo/" in tz_path:
-                    return tz_path.split("zoneinfo/")[-1]
+                with open("/etc/timezone") as f:
+                    tz_content: str = f.read().strip()
+                    if tz_content:
+                        return tz_content
             except Exception:
                 pass
 
-        elif system == "Linux":
-            if os.path.exists("/etc/timezone"):
-                try:
-                    with open("/etc/timezone") as f:
-                        tz_content: str = f.read().strip()
-                        if tz_content:
-                            return tz_content
-                except Exception:
-                    pass
+        if system in ("Linux", "Darwin"):
+            localtime_zone: Optional[str] = _timezone_from_localtime()
+            if localtime_zone:
+                return localtime_zone
 
-            try:
-                timedatectl_result: subprocess.CompletedProcess[str] = subprocess.run(
-                    ["timedatectl", "show", "-p", "Timezone", "--value"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                tz_result: str = timedatectl_result.stdout.strip()
-                if tz_result:
-                    return tz_result
-            except Exception:
-                pass
+            # A copied (not symlinked) /etc/localtime carries no zone name
+            if system == "Linux":
+                timedatectl_zone: Optional[str] = _timezone_from_timedatectl()
+                if timedatectl_zone:
+                    return timedatectl_zone
 
         elif system == "Windows":
             with contextlib.suppress(Exception):
-                tzutil_result: subprocess.CompletedProcess[str] = subprocess.run(
-                    ["tzutil", "/g"], capture_output=True, text=True, check=True
-                )
-                return tzutil_result.stdout.strip()
+                import winreg
+
+                with winreg.OpenKey(
+                    winreg.HKEY_LOCAL_MACHINE,
+                    r"SYSTEM\CurrentControlSet\Control\TimeZoneInformation",
+                ) as key:
+                    key_name: str = winreg.QueryValueEx(key, "TimeZoneKeyName")[0]
+                    if key_name:
+                        return key_name.strip("\x00").strip()
 
         return "UTC"
 
@@ -345,6 +316,188 @@ class SystemTimeDetector:
         return TimeFormatDetector.detect_from_system()
 
 
+LOCALTIME_PATH = "/etc/localtime"
+MACOS_GLOBAL_PREFERENCES = "~/Library/Preferences/.GlobalPreferences.plist"
+
+
+def _zone_name_from_path(path: str) -> Optional[str]:
+    """Extract an IANA zone name from a zoneinfo file path."""
+    if "zoneinfo/" in path:
+        return path.split("zoneinfo/")[-1]
+    return None
+
+
+def _timezone_from_localtime() -> Optional[str]:
+    """Resolve the zone name from the /etc/localtime symlink target."""
+    try:
+        target: str = os.readlink(LOCALTIME_PATH)
+    except OSError:
+        return None
+    return _zone_name_from_path(target)
+
+
+def _timezone_from_timedatectl() -> Optional[str]:
+    """Ask systemd for the zone name; the result is cached by SystemTimeCache."""
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["timedatectl", "show", "-p", "Timezone", "--value"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=2,
+        )
+    except Exception:
+        return None
+    return result.stdout.strip() or None
+
+
+def _get_locale_env(category: str) -> str:
+    """Get the effective locale for a category the way ``locale`` reports it."""
+    for name in ("LC_ALL", category, "LANG"):
+        value: Optional[str] = os.environ.get(name)
+        if value:
+            return value
+    return ""
+
+
+def _read_macos_global_preference(name: str) -> Any:
+    """Read a value from the macOS global preferences plist."""
+    import plistlib
+
+    try:
+        with open(os.path.expanduser(MACOS_GLOBAL_PREFERENCES), "rb") as f:
+            return plistlib.load(f).get(name)
+    except Exception:
+        return None
+
+
+def _locale_time_has_ampm() -> bool:
+    """Check if the locale's %r time carries AM/PM, like `date +%r` does."""
+    try:
+        previous: str = locale.setlocale(locale.LC_TIME)
+    except Exception:
+        return False
+    try:
+        locale.setlocale(locale.LC_TIME, "")
+        formatted: str = time.strftime("%r")
+    except Exception:
+        return False
+    finally:
+        # Leave strftime output of the rest of the process unchanged
+        with contextlib.suppress(Exception):
+            locale.setlocale(locale.LC_TIME, previous)
+    return "AM" in formatted or "PM" in formatted
+
+
+class SystemTimeCache:
+    """Persists detected system timezone and time format in the config directory.
+
+    Entries are tied to a fingerprint of TZ, the locale environment and the
+    modification state of the zoneinfo files, so a changed system setting is
+    re-detected on the next launch. Values are also kept in memory, so render
+    paths never repeat detection within a process.
+    """
+
+    WATCHED_ENV: Tuple[str, ...] = ("TZ", "LC_ALL", "LC_TIME", "LANG")
+    WATCHED_FILES: Tuple[str, ...] = (
+        LOCALTIME_PATH,
+        "/etc/timezone",
+        MACOS_GLOBAL_PREFERENCES,
+    )
+
+    def __init__(self, cache_file: Optional[Path] = None) -> None:
+        """Initialize cache.
+
+        Args:
+            cache_file: Cache file path (defaults to ~/.claude-monitor/system_time.json).
+        """
+        self.cache_file: Path = (
+            cache_file or Path.home() / ".claude-monitor" / "system_time.json"
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._memory: Dict[str, str] = {}
+        self._memory_key: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def fingerprint(cls) -> str:
+        """Build the fingerprint of everything detection depends on."""
+        parts: List[str] = [os.environ.get(name, "") for name in cls.WATCHED_ENV]
+        for path in cls.WATCHED_FILES:
+            try:
+                stat: os.stat_result = os.lstat(os.path.expanduser(path))
+            except OSError:
+                parts.append("")
+                continue
+            parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        parts.append(_timezone_from_localtime() or "")
+        return "|".join(parts)
+
+    def resolve(self, name: str, detect: Callable[[], str]) -> str:
+        """Get a cached value, running detection only on a cache miss.
+
+        Args:
+            name: Value name ("timezone" or "time_format").
+            detect: Detection function called on a miss.
+
+        Returns:
+            Cached or freshly detected value.
+        """
+        memory_key: Tuple[str, ...] = tuple(
+            os.environ.get(env, "") for env in self.WATCHED_ENV
+        )
+        with self._lock:
+            if memory_key != self._memory_key:
+                self._memory = {}
+                self._memory_key = memory_key
+            if name in self._memory:
+                return self._memory[name]
+
+            fingerprint: str = self.fingerprint()
+            stored: Dict[str, Any] = self._load()
+            if stored.get("fingerprint") != fingerprint:
+                stored = {"fingerprint": fingerprint}
+
+            value: Any = stored.get(name)
+            if not isinstance(value, str):
+                value = detect()
+                stored[name] = value
+                self._save(stored)
+
+            self._memory[name] = value
+            return value
+
+    def clear(self) -> None:
+        """Forget values held in memory."""
+        with self._lock:
+            self._memory = {}
+            self._memory_key = None
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the stored detection results."""
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data: Any = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        """Atomically store detection results."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file: Path = self.cache_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            temp_file.replace(self.cache_file)
+        except OSError as e:
+            logger.debug(f"Failed to save system time cache: {e}")
+
+
+_system_time_cache: SystemTimeCache = SystemTimeCache()
+
+
 class TimezoneHandler:
     """Handles timezone conversions and timestamp parsing."""
 
@@ -464,13 +617,13 @@ def get_time_format_preference(args: Any = None) -> bool:
 
 
 def get_system_timezone() -> str:
-    """Get system timezone."""
-    return SystemTimeDetector.get_timezone()
+    """Get system timezone, detected once and cached across launches."""
+    return _system_time_cache.resolve("timezone", SystemTimeDetector.get_timezone)
 
 
 def get_system_time_format() -> str:
-    """Get system time format ('12h' or '24h')."""
-    return SystemTimeDetector.get_time_format()
+    """Get system time format ('12h' or '24h'), cached across launches."""
+    return _system_time_cache.resolve("time_format", SystemTimeDetector.get_time_format)
 
 
 def format_time(minutes: Union[int, float]) -> str:
@@ -1,12 +1,22 @@
 """Shared pytest fixtures for Claude Monitor tests."""
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Set
-from unittest.mock import Mock
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set
+from unittest.mock import Mock, patch
 
 import pytest
 
 from claude_monitor.core.models import CostMode, UsageEntry
+from claude_monitor.utils import time_utils
+
+
+@pytest.fixture(autouse=True)
+def isolated_system_time_cache(tmp_path: Path) -> Iterator[time_utils.SystemTimeCache]:
+    """Keep cached timezone/time-format detection out of the user's config dir."""
+    cache = time_utils.SystemTimeCache(tmp_path / "system_time.json")
+    with patch.object(time_utils, "_system_time_cache", cache):
+        yield cache
 
 
 @pytest.fixture
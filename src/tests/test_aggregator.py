@@ -1,6 +1,8 @@
 """Tests for data aggregator module."""
 
+import json
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import List
 
 import pytest
@@ -9,6 +11,7 @@ from claude_monitor.core.models import UsageEntry
 from claude_monitor.data.aggregator import (
     AggregatedPeriod,
     AggregatedStats,
+    IncrementalUsageAggregator,
     UsageAggregator,
 )
 
@@ -620,3 +623,100 @@ class TestUsageAggregator:
         assert monthly_result[0]["month"] == "2024-01"
         assert monthly_result[1]["month"] == "2024-02"
         assert monthly_result[2]["month"] == "2024-03"
+
+
+def _usage_line(message_id: str, timestamp: str, input_tokens: int = 100) -> str:
+    """Build one assistant JSONL line with usage data."""
+    return (
+        json.dumps(
+            {
+                "type": "assistant",
+                "timestamp": timestamp,
+                "message": {
+                    "id": message_id,
+                    "model": "claude-3-5-sonnet",
+                    "usage": {"input_tokens": input_tokens, "output_tokens": 50},
+                },
+                "requestId": f"req_{message_id}",
+            }
+        )
+        + "\n"
+    )
+
+
+class TestIncrementalUsageAggregator:
+    """Test cases for live-updating daily and monthly aggregates."""
+
+    @pytest.fixture
+    def transcript(self, tmp_path: Path) -> Path:
+        path = tmp_path / "session.jsonl"
+        path.write_text(
+            _usage_line("msg_1", "2024-01-01T10:00:00Z")
+            + _usage_line("msg_2", "2024-01-02T10:00:00Z")
+            + _usage_line("msg_3", "2024-02-01T10:00:00Z")
+        )
+        return path
+
+    def test_first_refresh_matches_full_aggregation(self, transcript: Path) -> None:
+        for mode in ("daily", "monthly"):
+            aggregator = IncrementalUsageAggregator(
+                str(transcript.parent), aggregation_mode=mode
+            )
+            expected = UsageAggregator(
+                str(transcript.parent), aggregation_mode=mode
+            ).aggregate()
+
+            assert aggregator.aggregate() == expected
+
+    def test_new_entries_update_only_their_period(self, transcript: Path) -> None:
+        aggregator = IncrementalUsageAggregator(str(transcript.parent))
+        aggregator.refresh()
+        before = aggregator.rows()
+
+        with open(transcript, "a") as f:
+            f.write(_usage_line("msg_4", "2024-02-01T12:00:00Z", input_tokens=7))
+
+        assert aggregator.refresh() == ["2024-02-01"]
+        after = aggregator.rows()
+
+        assert after[0] is before[0]
+        assert after[1] is before[1]
+        assert after[2]["input_tokens"] == 107
+        assert after[2]["entries_count"] == 2
+
+    def test_new_period_is_inserted_in_order(self, transcript: Path) -> None:
+        aggregator = IncrementalUsageAggregator(str(transcript.parent))
+        aggregator.refresh()
+
+        with open(transcript, "a") as f:
+            f.write(_usage_line("msg_4", "2024-01-15T12:00:00Z"))
+
+        assert aggregator.refresh() == ["2024-01-15"]
+        assert [row["date"] for row in aggregator.rows()] == [
+            "2024-01-01",
+            "2024-01-02",
+            "2024-01-15",
+            "2024-02-01",
+        ]
+
+    def test_refresh_without_new_data_changes_nothing(self, transcript: Path) -> None:
+        aggregator = IncrementalUsageAggregator(str(transcript.parent))
+        aggregator.refresh()
+
+        assert aggregator.refresh() == []
+        assert len(aggregator.rows()) == 3
+
+    def test_replaced_transcript_is_aggregated_again(self, transcript: Path) -> None:
+        aggregator = IncrementalUsageAggregator(str(transcript.parent))
+        aggregator.refresh()
+        dropped = [row["date"] for row in aggregator.rows()]
+
+        transcript.write_text(_usage_line("msg_9", "2024-03-01T10:00:00Z"))
+
+        # Dropped periods are reported as changed too
+        assert aggregator.refresh() == sorted(dropped + ["2024-03-01"])
+        assert [row["date"] for row in aggregator.rows()] == ["2024-03-01"]
+
+    def test_invalid_mode(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Invalid aggregation mode"):
+            IncrementalUsageAggregator(str(tmp_path), aggregation_mode="weekly")
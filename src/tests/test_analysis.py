@@ -1,6 +1,9 @@
 """Tests for data/analysis.py module."""
 
-from datetime import datetime, timezone
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
 from unittest.mock import Mock, patch
 
 from claude_monitor.core.models import (
@@ -12,6 +15,7 @@ from claude_monitor.core.models import (
     UsageProjection,
 )
 from claude_monitor.data.analysis import (
+    ClosedBlocks,
     _add_optional_block_data,
     _convert_blocks_to_dict_format,
     _create_base_block_dict,
@@ -21,7 +25,10 @@ from claude_monitor.data.analysis import (
     _is_limit_in_block_timerange,
     _process_burn_rates,
     analyze_usage,
+    select_block_entries,
+    select_blocks_entries,
 )
+from claude_monitor.data.reader import IncrementalUsageReader
 
 
 class TestAnalyzeUsage:
@@ -315,7 +322,7 @@ class TestCreateResult:
             "total_cost": 0.003,
         }
 
-        mock_convert.assert_called_once_with(blocks)
+        mock_convert.assert_called_once_with(blocks, False)
 
     def test_create_result_empty(self) -> None:
         """Test _create_result with empty data."""
@@ -575,5 +582,144 @@ class TestBlockConversion:
         assert mock_create_base.call_count == 2
         assert mock_add_optional.call_count == 2
 
-        mock_create_base.assert_any_call(block1)
-        mock_create_base.assert_any_call(block2)
+        mock_create_base.assert_any_call(block1, evict_entries=False)
+        mock_create_base.assert_any_call(block2, evict_entries=False)
+
+
+class TestClosedBlockEviction:
+    """Test evicting entries of closed blocks and reloading them."""
+
+    @staticmethod
+    def _entries() -> list:
+        return [
+            UsageEntry(
+                timestamp=datetime(2024, 1, 1, hour, 30, tzinfo=timezone.utc),
+                input_tokens=hour,
+                output_tokens=1,
+                model="claude-3-haiku",
+                message_id=f"msg_{hour}",
+            )
+            for hour in (10, 11, 16, 17)
+        ]
+
+    def _blocks(self, evict: bool) -> list:
+        from claude_monitor.data.analyzer import SessionAnalyzer
+
+        blocks = SessionAnalyzer().transform_to_blocks(self._entries())
+        blocks[-1].is_active = True
+        converted = _convert_blocks_to_dict_format(blocks, evict_closed_entries=evict)
+        return [block for block in converted if not block["isGap"]]
+
+    def test_closed_blocks_keep_only_aggregates(self) -> None:
+        closed, active = self._blocks(evict=True)
+
+        assert closed["entries"] == []
+        assert closed["entriesEvicted"] is True
+        assert closed["entries_count"] == 2
+        assert closed["totalTokens"] == 23
+        assert len(active["entries"]) == 2
+        assert "entriesEvicted" not in active
+
+    def test_entries_are_kept_by_default(self) -> None:
+        closed, _ = self._blocks(evict=False)
+
+        assert len(closed["entries"]) == 2
+        assert "entriesEvicted" not in closed
+
+    def test_select_block_entries_reloads_evicted_entries(self) -> None:
+        evicted, _ = self._blocks(evict=True)
+        kept, _ = self._blocks(evict=False)
+
+        assert select_block_entries(self._entries(), evicted) == kept["entries"]
+
+    def test_select_blocks_entries_buckets_all_blocks(self) -> None:
+        evicted = self._blocks(evict=True)
+        kept = self._blocks(evict=False)
+
+        assert select_blocks_entries(self._entries(), evicted) == [
+            block["entries"] for block in kept
+        ]
+
+
+def _append_usage(path: Path, hours_ago: List[float], prefix: str) -> None:
+    """Append assistant entries with usage at the given ages."""
+    now = datetime.now(timezone.utc)
+    with open(path, "a") as f:
+        for i, age in enumerate(hours_ago):
+            timestamp = (now - timedelta(hours=age)).isoformat()
+            f.write(
+                json.dumps(
+                    {
+                        "type": "assistant",
+                        "timestamp": timestamp.replace("+00:00", "Z"),
+                        "requestId": f"req_{prefix}{i}",
+                        "message": {
+                            "id": f"{prefix}{i}",
+                            "model": "claude-3-5-sonnet",
+                            "usage": {"input_tokens": 100, "output_tokens": 50},
+                        },
+                    }
+                )
+                + "\n"
+            )
+
+
+class TestEvictionAtSource:
+    """Test closed blocks built once and released from the reader."""
+
+    def _analyze(
+        self, data_dir: Path, reader: IncrementalUsageReader, closed: ClosedBlocks
+    ) -> Dict[str, Any]:
+        return analyze_usage(
+            data_path=str(data_dir),
+            reader=reader,
+            evict_closed_entries=True,
+            closed_blocks=closed,
+        )
+
+    def _expected(self, data_dir: Path) -> Dict[str, Any]:
+        return analyze_usage(data_path=str(data_dir), evict_closed_entries=True)
+
+    def _summary(self, result: Dict[str, Any]) -> List[tuple]:
+        return [
+            (block["id"], block["isActive"], block["totalTokens"])
+            for block in result["blocks"]
+        ] + [(result["total_tokens"], result["entries_count"])]
+
+    def test_closed_entries_are_released(self, tmp_path: Path) -> None:
+        _append_usage(tmp_path / "a.jsonl", [30, 29, 12, 0.5], "a")
+        reader = IncrementalUsageReader(str(tmp_path))
+        closed = ClosedBlocks()
+
+        result = self._analyze(tmp_path, reader, closed)
+
+        assert self._summary(result) == self._summary(self._expected(tmp_path))
+        assert [block["isGap"] for block in closed.blocks] == [False, True, False]
+        assert len(reader._entries) == 1
+        assert result["blocks"][-1]["entries_count"] == 1
+
+    def test_closed_blocks_are_reused(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.jsonl"
+        _append_usage(path, [30, 12, 0.5], "a")
+        reader = IncrementalUsageReader(str(tmp_path))
+        closed = ClosedBlocks()
+        first = self._analyze(tmp_path, reader, closed)
+
+        _append_usage(path, [0.1], "b")
+        second = self._analyze(tmp_path, reader, closed)
+
+        assert second["blocks"][0] is first["blocks"][0]
+        assert self._summary(second) == self._summary(self._expected(tmp_path))
+        assert second["blocks"][-1]["entries_count"] == 2
+
+    def test_late_old_entry_reloads_history(self, tmp_path: Path) -> None:
+        _append_usage(tmp_path / "a.jsonl", [30, 0.5], "a")
+        reader = IncrementalUsageReader(str(tmp_path))
+        closed = ClosedBlocks()
+        self._analyze(tmp_path, reader, closed)
+
+        _append_usage(tmp_path / "b.jsonl", [29], "b")
+        result = self._analyze(tmp_path, reader, closed)
+
+        assert self._summary(result) == self._summary(self._expected(tmp_path))
+        assert result["blocks"][0]["entries_count"] == 2
@@ -0,0 +1,178 @@
+"""Tests for reading compressed transcript archives."""
+
+import gzip
+import json
+import lzma
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from claude_monitor.data import reader
+from claude_monitor.data.archives import (
+    ArchiveLineCache,
+    archive_cache,
+    is_archive,
+    open_archive,
+    prefetch_archives,
+)
+from claude_monitor.data.reader import (
+    IncrementalUsageReader,
+    load_all_raw_entries,
+    load_usage_entries,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_archive_cache() -> Iterator[None]:
+    """Start every test with an empty archive cache."""
+    archive_cache.clear()
+    yield
+    archive_cache.clear()
+
+
+def _usage_lines(*message_ids: str) -> bytes:
+    """Build assistant JSONL lines with usage data."""
+    timestamp = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+    return "".join(
+        json.dumps(
+            {
+                "type": "assistant",
+                "timestamp": timestamp,
+                "message": {
+                    "id": message_id,
+                    "model": "claude-3-5-sonnet",
+                    "usage": {"input_tokens": 100, "output_tokens": 50},
+                },
+                "requestId": f"req_{message_id}",
+            }
+        )
+        + "\n"
+        for message_id in message_ids
+    ).encode()
+
+
+def _message_ids(entries: List) -> List[str]:
+    return sorted(entry.message_id for entry in entries)
+
+
+class TestOpenArchive:
+    """Test archive detection and decompression."""
+
+    def test_is_archive(self) -> None:
+        assert is_archive(Path("a/session.jsonl.gz"))
+        assert is_archive(Path("a/session.jsonl.xz"))
+        assert is_archive(Path("a/session.jsonl.zst"))
+        assert not is_archive(Path("a/session.jsonl"))
+
+    @pytest.mark.parametrize(
+        ("suffix", "compress"),
+        [(".jsonl.gz", gzip.compress), (".jsonl.xz", lzma.compress)],
+    )
+    def test_stdlib_formats(self, tmp_path: Path, suffix: str, compress) -> None:
+        path = tmp_path / f"session{suffix}"
+        path.write_bytes(compress(b"line one\nline two\n"))
+
+        with open_archive(path) as stream:
+            assert stream.read() == b"line one\nline two\n"
+
+    def test_zstd_format(self, tmp_path: Path) -> None:
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "session.jsonl.zst"
+        path.write_bytes(zstandard.ZstdCompressor().compress(b"line\n"))
+
+        with open_archive(path) as stream:
+            assert stream.read() == b"line\n"
+
+
+class TestArchiveLoading:
+    """Test archives alongside plain transcripts in the loaders."""
+
+    def _write_tree(self, root: Path) -> None:
+        (root / "live.jsonl").write_bytes(_usage_lines("msg_live"))
+        (root / "old.jsonl.gz").write_bytes(gzip.compress(_usage_lines("msg_gz")))
+        (root / "older.jsonl.xz").write_bytes(
+            lzma.compress(_usage_lines("msg_xz", "msg_live"))
+        )
+
+    def test_one_shot_loader_reads_archives(self, tmp_path: Path) -> None:
+        self._write_tree(tmp_path)
+
+        entries, _ = load_usage_entries(str(tmp_path), hours_back=24)
+
+        assert _message_ids(entries) == ["msg_gz", "msg_live", "msg_xz"]
+
+    def test_raw_loader_reads_archives(self, tmp_path: Path) -> None:
+        self._write_tree(tmp_path)
+        assert len(load_all_raw_entries(str(tmp_path))) == 4
+
+    def test_incremental_reader_reads_archives_once(self, tmp_path: Path) -> None:
+        self._write_tree(tmp_path)
+        usage_reader = IncrementalUsageReader(str(tmp_path))
+
+        entries, _ = usage_reader.load(hours_back=24)
+        assert _message_ids(entries) == ["msg_gz", "msg_live", "msg_xz"]
+
+        with patch.object(reader, "_read_archive_lines") as read_archive:
+            entries, _ = usage_reader.load(hours_back=24)
+
+        read_archive.assert_not_called()
+        assert len(entries) == 3
+
+    def test_incremental_reader_does_not_retain_archive_lines(
+        self, tmp_path: Path
+    ) -> None:
+        self._write_tree(tmp_path)
+
+        IncrementalUsageReader(str(tmp_path)).load(hours_back=24)
+
+        assert archive_cache.size == 0
+
+    def test_parsed_archives_are_cached(self, tmp_path: Path) -> None:
+        self._write_tree(tmp_path)
+        load_usage_entries(str(tmp_path), hours_back=24)
+
+        with patch.object(reader, "_decompress_lines") as decompress:
+            entries, _ = load_usage_entries(str(tmp_path), hours_back=24)
+
+        decompress.assert_not_called()
+        assert len(entries) == 3
+
+    def test_rewritten_archive_is_read_again(self, tmp_path: Path) -> None:
+        path = tmp_path / "old.jsonl.gz"
+        path.write_bytes(gzip.compress(_usage_lines("msg_1")))
+        usage_reader = IncrementalUsageReader(str(tmp_path))
+        assert len(usage_reader.load(hours_back=24)[0]) == 1
+
+        path.write_bytes(gzip.compress(_usage_lines("msg_1", "msg_2", "msg_3")))
+        entries, _ = usage_reader.load(hours_back=24)
+
+        assert _message_ids(entries) == ["msg_1", "msg_2", "msg_3"]
+
+
+def test_prefetch_fills_cache_concurrently() -> None:
+    jobs = {("a",): lambda: [b"a"], ("b",): lambda: [b"b"]}
+
+    prefetch_archives(jobs)
+
+    assert archive_cache.get(("a",)) == [b"a"]
+    assert archive_cache.get(("b",)) == [b"b"]
+
+
+def test_cache_is_bounded_by_bytes() -> None:
+    cache = ArchiveLineCache(max_bytes=10)
+    cache.put(("a",), [b"aaaa"])
+    cache.put(("b",), [b"bbbb"])
+    cache.get(("a",))
+    cache.put(("c",), [b"cccc"])
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == [b"aaaa"]
+    assert cache.size == 8
+
+    cache.put(("d",), [b"d" * 11])
+    assert cache.get(("d",)) is None
+    assert cache.pop(("a",)) == [b"aaaa"]
+    assert cache.size == 4
@@ -0,0 +1,211 @@
+"""Tests for the asyncio monitoring runtime."""
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+from claude_monitor.monitoring.async_runtime import AsyncMonitoringRuntime
+
+
+def _orchestrator(history_loaded: bool = True) -> Mock:
+    """Mock orchestrator returning numbered snapshots."""
+    orchestrator = Mock()
+    calls: List[Optional[bool]] = []
+
+    def refresh(recent_only: bool = False) -> Dict[str, Any]:
+        calls.append(recent_only)
+        return {
+            "version": len(calls),
+            "history_loaded": history_loaded or not recent_only,
+        }
+
+    orchestrator.refresh.side_effect = refresh
+    orchestrator.next_interval.return_value = 60
+    orchestrator.calls = calls
+    return orchestrator
+
+
+async def _wait_until(condition: Any, timeout: float = 5.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+def _run(runtime: AsyncMonitoringRuntime, scenario: Any) -> None:
+    """Run the runtime alongside a scenario coroutine, then stop it."""
+
+    async def main() -> None:
+        task = asyncio.ensure_future(runtime.run())
+        try:
+            await scenario()
+        finally:
+            runtime.stop()
+            await asyncio.wait_for(task, timeout=5)
+
+    asyncio.run(main())
+
+
+class TestAsyncMonitoringRuntime:
+    """Test refresh, consumers and shutdown on one event loop."""
+
+    def test_first_paint_then_history(self) -> None:
+        orchestrator = _orchestrator(history_loaded=False)
+        runtime = AsyncMonitoringRuntime(orchestrator)
+        received: List[Dict[str, Any]] = []
+        runtime.add_consumer(received.append)
+
+        async def scenario() -> None:
+            await _wait_until(lambda: len(orchestrator.calls) == 2)
+            await _wait_until(lambda: received and received[-1]["version"] == 2)
+
+        _run(runtime, scenario)
+
+        assert orchestrator.calls == [True, False]
+
+    def test_slow_consumer_gets_latest_snapshot(self) -> None:
+        orchestrator = _orchestrator()
+        runtime = AsyncMonitoringRuntime(orchestrator)
+        received: List[int] = []
+        gate: Dict[str, Any] = {}
+
+        async def slow(data: Dict[str, Any]) -> None:
+            received.append(data["version"])
+            await gate["release"].wait()
+
+        runtime.add_consumer(slow, name="slow")
+
+        async def scenario() -> None:
+            gate["release"] = asyncio.Event()
+            await _wait_until(lambda: received == [1])
+            for calls in range(2, 7):
+                runtime._on_wake()
+                await _wait_until(lambda: len(orchestrator.calls) == calls)
+            gate["release"].set()
+            await _wait_until(lambda: received[-1] == 6)
+
+        _run(runtime, scenario)
+
+        assert received == [1, 6]
+
+    def test_consumer_errors_are_contained(self) -> None:
+        orchestrator = _orchestrator()
+        runtime = AsyncMonitoringRuntime(orchestrator)
+        good: List[int] = []
+        runtime.add_consumer(Mock(side_effect=RuntimeError("boom")), name="bad")
+        runtime.add_consumer(lambda data: good.append(data["version"]), name="good")
+
+        async def scenario() -> None:
+            await _wait_until(lambda: good == [1])
+
+        _run(runtime, scenario)
+
+    def test_wake_listener_triggers_refresh(self) -> None:
+        orchestrator = _orchestrator()
+        runtime = AsyncMonitoringRuntime(orchestrator)
+
+        async def scenario() -> None:
+            await _wait_until(lambda: len(orchestrator.calls) == 1)
+            orchestrator.add_wake_listener.assert_called_once_with(runtime._on_wake)
+            runtime._on_wake()
+            await _wait_until(lambda: len(orchestrator.calls) == 2)
+
+        _run(runtime, scenario)
+
+        orchestrator.remove_wake_listener.assert_called_once_with(runtime._on_wake)
+
+    def test_watcher_triggers_refresh_on_file_change(self, tmp_path: Path) -> None:
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text("{}\n")
+        orchestrator = _orchestrator()
+        runtime = AsyncMonitoringRuntime(
+            orchestrator, watch_paths=[tmp_path], watch_interval=0.01
+        )
+
+        async def scenario() -> None:
+            await _wait_until(lambda: len(orchestrator.calls) == 1)
+            await asyncio.sleep(0.05)
+            assert len(orchestrator.calls) == 1
+            with open(transcript, "a") as f:
+                f.write("{}\n")
+            await _wait_until(lambda: len(orchestrator.calls) >= 2)
+
+        _run(runtime, scenario)
+
+    def test_stop_before_run_is_ignored(self) -> None:
+        AsyncMonitoringRuntime(_orchestrator()).stop()
+
+    def test_stop_cancels_all_tasks(self) -> None:
+        orchestrator = _orchestrator()
+        runtime = AsyncMonitoringRuntime(orchestrator)
+        runtime.add_consumer(lambda data: None)
+
+        async def main() -> None:
+            task = asyncio.ensure_future(runtime.run())
+            await _wait_until(lambda: len(orchestrator.calls) == 1)
+            runtime.stop()
+            await asyncio.wait_for(task, timeout=5)
+            others = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            assert others == []
+
+        asyncio.run(main())
+
+    def test_copy_of_published_fetch_is_skipped(self) -> None:
+        orchestrator = _orchestrator()
+        orchestrator.refresh.side_effect = lambda recent_only=False: {
+            "freshness": {"fetched_at": 100.0}
+        }
+        runtime = AsyncMonitoringRuntime(orchestrator)
+        received: List[Dict[str, Any]] = []
+        runtime.add_consumer(received.append)
+
+        async def scenario() -> None:
+            await _wait_until(lambda: received)
+            for calls in range(2, 4):
+                runtime._on_wake()
+                await _wait_until(lambda: orchestrator.refresh.call_count == calls)
+            await asyncio.sleep(0.05)
+
+        _run(runtime, scenario)
+
+        assert len(received) == 1
+
+    def test_sync_consumer_runs_off_the_loop(self) -> None:
+        orchestrator = _orchestrator()
+        runtime = AsyncMonitoringRuntime(orchestrator)
+        threads: List[str] = []
+        runtime.add_consumer(
+            lambda data: threads.append(threading.current_thread().name)
+        )
+
+        async def scenario() -> None:
+            await _wait_until(lambda: threads)
+
+        _run(runtime, scenario)
+
+        assert threads[0].startswith("MonitorConsumer")
+
+    def test_background_refresh_runs_in_runtime_executor(self) -> None:
+        orchestrator = _orchestrator()
+        runtime = AsyncMonitoringRuntime(orchestrator)
+        data_manager = orchestrator.data_manager
+        threads: List[str] = []
+
+        async def scenario() -> None:
+            await _wait_until(lambda: data_manager.set_refresh_runner.called)
+            runner = data_manager.set_refresh_runner.call_args[0][0]
+            caller = threading.Thread(
+                target=runner,
+                args=(lambda: threads.append(threading.current_thread().name),),
+            )
+            caller.start()
+            caller.join()
+            await _wait_until(lambda: threads)
+
+        _run(runtime, scenario)
+
+        assert threads[0].startswith("MonitorIO")
+        data_manager.set_refresh_runner.assert_called_with(None)
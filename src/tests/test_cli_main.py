@@ -1,8 +1,14 @@
 """Simplified tests for CLI main module."""
 
+import io
+import os
 from pathlib import Path
+from typing import Any, Dict
 from unittest.mock import Mock, patch
 
+import pytest
+from rich.console import Console
+
 from claude_monitor.cli.main import main
 
 
@@ -108,6 +114,39 @@ class TestFunctions:
         assert len(paths) > 0
         assert "~/.claude/projects" in paths
 
+    def test_get_standard_claude_paths_extra_roots(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test CLAUDE_CONFIG_DIR and extra roots are included."""
+        from claude_monitor.cli.main import get_standard_claude_paths
+
+        monkeypatch.setenv("CLAUDE_CONFIG_DIR", "/opt/claude-a,/opt/claude-b")
+        monkeypatch.setenv(
+            "CLAUDE_MONITOR_DATA_PATHS", os.pathsep.join(["/data/x", "/data/y"])
+        )
+
+        paths = get_standard_claude_paths()
+
+        assert paths[:2] == ["~/.claude/projects", "~/.config/claude/projects"]
+        assert paths[2:] == [
+            str(Path("/opt/claude-a") / "projects"),
+            str(Path("/opt/claude-b") / "projects"),
+            "/data/x",
+            "/data/y",
+        ]
+
+    def test_discover_claude_data_paths_all_roots(self, tmp_path: Path) -> None:
+        """Test every existing root is returned once."""
+        from claude_monitor.cli.main import discover_claude_data_paths
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        custom_paths = [str(tmp_path / "a"), str(tmp_path / "b"), str(tmp_path / "a")]
+
+        paths = discover_claude_data_paths(custom_paths)
+
+        assert paths == [(tmp_path / "a").resolve(), (tmp_path / "b").resolve()]
+
     def test_discover_claude_data_paths_no_paths(self) -> None:
         """Test discover with no existing paths."""
         from claude_monitor.cli.main import discover_claude_data_paths
@@ -128,3 +167,63 @@ class TestFunctions:
             paths = discover_claude_data_paths(custom_paths)
             assert len(paths) == 1
             assert paths[0].name == "path"
+
+
+def _row(date: str, input_tokens: int) -> Dict[str, Any]:
+    """Build one daily row."""
+    return {
+        "date": date,
+        "input_tokens": input_tokens,
+        "output_tokens": 0,
+        "cache_creation_tokens": 0,
+        "cache_read_tokens": 0,
+        "total_cost": 0.0,
+        "models_used": ["claude-3-opus"],
+        "entries_count": 1,
+    }
+
+
+class TestTableView:
+    """Test the live daily/monthly table view."""
+
+    def test_live_view_redraws_summary_and_table_on_change(self) -> None:
+        from claude_monitor.cli.main import _run_live_table_view
+        from claude_monitor.ui.table_views import TableViewsController
+
+        first = [_row("2024-01-01", 100), _row("2024-01-02", 10)]
+        second = [first[0], _row("2024-01-02", 20)]
+        aggregator = Mock()
+        aggregator.rows.side_effect = [first, second]
+        aggregator.refresh.side_effect = [[], ["2024-01-02"]]
+        output = io.StringIO()
+        console = Console(file=output, width=140)
+        args = Mock(timezone="UTC", refresh_rate=1)
+
+        with patch(
+            "claude_monitor.cli.main.time.sleep",
+            side_effect=[None, None, KeyboardInterrupt],
+        ):
+            _run_live_table_view(
+                TableViewsController(), aggregator, "daily", args, console
+            )
+
+        text = output.getvalue()
+        assert text.count("Daily Usage Summary") == 2
+        assert "Total Tokens: 110" in text
+        assert "Total Tokens: 120" in text
+
+    def test_rows_come_from_a_running_daemon(self) -> None:
+        from claude_monitor.cli.main import _create_table_aggregator
+        from claude_monitor.monitoring.daemon import DaemonUsageAggregator
+
+        data_manager = Mock()
+        with patch(
+            "claude_monitor.cli.main._connect_to_daemon", return_value=data_manager
+        ):
+            aggregator = _create_table_aggregator(
+                Mock(timezone="UTC"), ["/data"], "monthly"
+            )
+
+        assert isinstance(aggregator, DaemonUsageAggregator)
+        assert aggregator.client is data_manager.client
+        assert aggregator.aggregation_mode == "monthly"
@@ -0,0 +1,365 @@
+"""Tests for the headless usage daemon."""
+
+import json
+import socket
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from claude_monitor.core.models import UsageEntry
+from claude_monitor.monitoring.daemon import (
+    DaemonClient,
+    DaemonDataManager,
+    DaemonUsageAggregator,
+    UsageDaemon,
+)
+from claude_monitor.monitoring.data_manager import DataManager
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets required"
+)
+
+
+def _monitoring_data() -> Dict[str, Any]:
+    """Build monitoring data with one finished and one active block."""
+    now = datetime.now(timezone.utc)
+    entry = {
+        "timestamp": (now - timedelta(minutes=10)).isoformat(),
+        "inputTokens": 100,
+        "outputTokens": 50,
+        "cacheCreationTokens": 0,
+        "cacheReadInputTokens": 0,
+        "costUSD": 0.01,
+        "model": "claude-3-5-sonnet",
+    }
+    return {
+        "data": {
+            "blocks": [
+                {
+                    "id": "old",
+                    "isActive": False,
+                    "isGap": False,
+                    "startTime": (now - timedelta(hours=10)).isoformat(),
+                    "endTime": (now - timedelta(hours=5)).isoformat(),
+                    "totalTokens": 500,
+                    "entries": [
+                        {**entry, "timestamp": (now - timedelta(hours=9)).isoformat()}
+                    ],
+                },
+                {
+                    "id": "active",
+                    "isActive": True,
+                    "isGap": False,
+                    "startTime": (now - timedelta(hours=1)).isoformat(),
+                    "endTime": (now + timedelta(hours=4)).isoformat(),
+                    "totalTokens": 150,
+                    "burnRate": {"tokensPerMinute": 2.5, "costPerHour": 0.1},
+                    "projection": {"totalTokens": 800},
+                    "entries": [entry],
+                },
+            ]
+        },
+        "token_limit": 19000,
+        "session_id": "active",
+        "session_count": 2,
+    }
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Short socket path (AF_UNIX paths are length limited)."""
+    with tempfile.TemporaryDirectory(dir="/tmp") as temp_dir:
+        yield Path(temp_dir) / "d.sock"
+
+
+@pytest.fixture
+def daemon(socket_path: Path) -> Iterator[UsageDaemon]:
+    """Daemon with a mocked orchestrator and preloaded data."""
+    with patch("claude_monitor.monitoring.daemon.MonitoringOrchestrator"):
+        usage_daemon = UsageDaemon(args=Mock(timezone="UTC"), socket_path=socket_path)
+    usage_daemon.orchestrator.data_manager = DataManager(data_path="/nonexistent")
+    usage_daemon._on_data_update(_monitoring_data())
+    yield usage_daemon
+    usage_daemon.stop()
+
+
+def _write_usage(path: Path, timestamps: List[datetime], prefix: str) -> None:
+    """Append assistant entries with usage at the given times."""
+    with open(path, "a") as f:
+        for i, timestamp in enumerate(timestamps):
+            f.write(
+                json.dumps(
+                    {
+                        "type": "assistant",
+                        "timestamp": timestamp.isoformat().replace("+00:00", "Z"),
+                        "requestId": f"req_{prefix}{i}",
+                        "message": {
+                            "id": f"{prefix}{i}",
+                            "model": "claude-3-5-sonnet",
+                            "usage": {"input_tokens": 100, "output_tokens": 50},
+                        },
+                    }
+                )
+                + "\n"
+            )
+
+
+class TestUsageDaemonQueries:
+    """Test query handling without a socket."""
+
+    def test_ping(self, daemon: UsageDaemon) -> None:
+        result = daemon.handle_request({"query": "ping"})
+        assert result["ready"] is True
+
+    def test_unknown_query(self, daemon: UsageDaemon) -> None:
+        with pytest.raises(ValueError, match="Unknown query"):
+            daemon.handle_request({"query": "bogus"})
+
+    def test_no_data_yet(self, socket_path: Path) -> None:
+        with patch("claude_monitor.monitoring.daemon.MonitoringOrchestrator"):
+            usage_daemon = UsageDaemon(socket_path=socket_path)
+        with pytest.raises(RuntimeError, match="No usage data"):
+            usage_daemon.handle_request({"query": "current_block"})
+
+    def test_current_block_strips_entries(self, daemon: UsageDaemon) -> None:
+        block = daemon.handle_request({"query": "current_block"})
+        assert block["id"] == "active"
+        assert "entries" not in block
+
+        block = daemon.handle_request(
+            {"query": "current_block", "include_entries": True}
+        )
+        assert len(block["entries"]) == 1
+
+    def test_snapshot_strips_inactive_entries(self, daemon: UsageDaemon) -> None:
+        snapshot = daemon.handle_request({"query": "snapshot"})
+        old, active = snapshot["data"]["blocks"]
+        assert "entries" not in old
+        assert "entries" in active
+        assert snapshot["token_limit"] == 19000
+
+    def test_burn_rate(self, daemon: UsageDaemon) -> None:
+        result = daemon.handle_request({"query": "burn_rate"})
+        assert result["activeBlock"]["burnRate"]["tokensPerMinute"] == 2.5
+        assert result["tokensPerMinute"] >= 0
+
+    def test_daily_totals_cover_full_history(
+        self, daemon: UsageDaemon, tmp_path: Path
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        transcript = tmp_path / "session.jsonl"
+        _write_usage(transcript, [now - timedelta(days=30), now], "a")
+        daemon.orchestrator.data_manager = DataManager(data_path=str(tmp_path))
+
+        daily = daemon.handle_request({"query": "daily_totals", "timezone": "UTC"})
+        assert len(daily) == 2
+        assert sum(day["input_tokens"] for day in daily) == 200
+        assert daily == sorted(daily, key=lambda day: day["date"])
+
+        _write_usage(transcript, [now], "b")
+        daily = daemon.handle_request({"query": "daily_totals", "timezone": "UTC"})
+        assert [day["input_tokens"] for day in daily] == [100, 200]
+
+        daily = daemon.handle_request(
+            {"query": "daily_totals", "timezone": "UTC", "days": 1}
+        )
+        assert [day["input_tokens"] for day in daily] == [200]
+
+    def test_daily_totals_use_days_of_requested_timezone(
+        self, daemon: UsageDaemon, tmp_path: Path
+    ) -> None:
+        late_evening = datetime(2024, 1, 1, 23, 30, tzinfo=timezone.utc)
+        _write_usage(tmp_path / "session.jsonl", [late_evening], "a")
+        daemon.orchestrator.data_manager = DataManager(data_path=str(tmp_path))
+
+        utc = daemon.handle_request({"query": "daily_totals", "timezone": "UTC"})
+        tokyo = daemon.handle_request(
+            {"query": "daily_totals", "timezone": "Asia/Tokyo"}
+        )
+
+        assert [day["date"] for day in utc] == ["2024-01-01"]
+        assert [day["date"] for day in tokyo] == ["2024-01-02"]
+
+    def test_daily_totals_invalid_timezone(self, daemon: UsageDaemon) -> None:
+        with pytest.raises(ValueError, match="Invalid timezone"):
+            daemon.handle_request({"query": "daily_totals", "timezone": "Nope/Zone"})
+
+    def test_block_entries_reload_evicted_blocks_with_one_load(
+        self, daemon: UsageDaemon
+    ) -> None:
+        data = _monitoring_data()
+        old_block = data["data"]["blocks"][0]
+        timestamp = datetime.fromisoformat(old_block["entries"][0]["timestamp"])
+        old_block.update(entries=[], entriesEvicted=True)
+        daemon._on_data_update(data)
+        retained = [
+            UsageEntry(timestamp=timestamp, input_tokens=100, output_tokens=50),
+            UsageEntry(
+                timestamp=timestamp + timedelta(hours=6),
+                input_tokens=1,
+                output_tokens=1,
+            ),
+        ]
+
+        with patch(
+            "claude_monitor.monitoring.data_manager.load_usage_entries",
+            return_value=(retained, None),
+        ) as load:
+            old, active, unknown = daemon.handle_request(
+                {"query": "block_entries", "ids": ["old", "active", "missing"]}
+            )
+
+        load.assert_called_once()
+        assert [entry["inputTokens"] for entry in old] == [100]
+        assert len(active) == 1
+        assert unknown == []
+
+    def test_monthly_totals(self, daemon: UsageDaemon, tmp_path: Path) -> None:
+        _write_usage(
+            tmp_path / "session.jsonl",
+            [
+                datetime(2024, 1, 31, 12, tzinfo=timezone.utc),
+                datetime(2024, 2, 1, 12, tzinfo=timezone.utc),
+            ],
+            "a",
+        )
+        daemon.orchestrator.data_manager = DataManager(data_path=str(tmp_path))
+
+        monthly = daemon.handle_request({"query": "monthly_totals", "months": 1})
+
+        assert [row["month"] for row in monthly] == ["2024-02"]
+
+
+class TestDaemonSocket:
+    """Test the client/server round trip over a real Unix socket."""
+
+    def test_round_trip(self, daemon: UsageDaemon, socket_path: Path) -> None:
+        daemon.start()
+        client = DaemonClient(socket_path)
+
+        assert client.is_available()
+        assert client.query("current_block")["id"] == "active"
+        daemon.orchestrator.start.assert_called_once()
+
+    def test_error_response_raises(
+        self, daemon: UsageDaemon, socket_path: Path
+    ) -> None:
+        daemon.start()
+        with pytest.raises(ConnectionError, match="Unknown query"):
+            DaemonClient(socket_path).query("bogus")
+
+    def test_refuses_second_daemon(
+        self, daemon: UsageDaemon, socket_path: Path
+    ) -> None:
+        daemon.start()
+        with patch("claude_monitor.monitoring.daemon.MonitoringOrchestrator"):
+            second = UsageDaemon(socket_path=socket_path)
+        with pytest.raises(RuntimeError, match="already running"):
+            second.start()
+
+    def test_stale_socket_is_replaced(
+        self, daemon: UsageDaemon, socket_path: Path
+    ) -> None:
+        socket_path.touch()
+        daemon.start()
+        assert DaemonClient(socket_path).is_available()
+
+    def test_stop_removes_socket(self, daemon: UsageDaemon, socket_path: Path) -> None:
+        daemon.start()
+        daemon.stop()
+        assert not socket_path.exists()
+        assert not DaemonClient(socket_path).is_available()
+
+
+class TestDaemonDataManager:
+    """Test the thin-client data manager."""
+
+    def test_get_data_returns_snapshot_data(self) -> None:
+        client = Mock()
+        client.query.return_value = {"data": {"blocks": []}}
+
+        manager = DaemonDataManager(client)
+
+        assert manager.get_data() == {"blocks": []}
+        client.query.assert_called_once_with("snapshot")
+        assert manager.last_error is None
+
+    def test_get_data_keeps_last_good_data_on_error(self) -> None:
+        client = Mock()
+        client.query.side_effect = [
+            {"data": {"blocks": [{"id": "a"}]}},
+            ConnectionError("gone"),
+        ]
+        manager = DaemonDataManager(client)
+        manager.get_data()
+
+        with patch("claude_monitor.monitoring.daemon.report_error"):
+            data = manager.get_data()
+
+        assert data == {"blocks": [{"id": "a"}]}
+        assert manager.last_error == "gone"
+
+    def test_get_blocks_entries_fetches_stripped_blocks(self) -> None:
+        client = Mock()
+        client.query.return_value = [[{"inputTokens": 100}]]
+        manager = DaemonDataManager(client)
+        active = {"id": "active", "entries": [{"inputTokens": 5}]}
+        stripped = {"id": "old"}
+
+        entries = manager.get_blocks_entries([stripped, active])
+
+        assert entries == [[{"inputTokens": 100}], [{"inputTokens": 5}]]
+        client.query.assert_called_once_with("block_entries", ids=["old"])
+        assert manager.get_block_entries(active) == [{"inputTokens": 5}]
+        assert client.query.call_count == 1
+
+    def test_get_blocks_entries_is_empty_on_error(self) -> None:
+        client = Mock()
+        client.query.side_effect = ConnectionError("gone")
+        manager = DaemonDataManager(client)
+
+        assert manager.get_blocks_entries([{"id": "old"}]) == [[]]
+        assert manager.last_error == "gone"
+
+    def test_cache_age_follows_snapshot_freshness(self) -> None:
+        client = Mock()
+        client.query.return_value = {
+            "data": {"blocks": [], "freshness": {"fetched_at": time.time() - 30}}
+        }
+        manager = DaemonDataManager(client)
+        assert manager.cache_age == float("inf")
+
+        manager.get_data()
+
+        assert 29 <= manager.cache_age < 60
+
+
+class TestDaemonUsageAggregator:
+    """Test table rows served by the daemon."""
+
+    def test_unchanged_rows_are_kept(self) -> None:
+        client = Mock()
+        client.query.side_effect = [
+            [{"date": "2024-01-01", "input_tokens": 1}],
+            [
+                {"date": "2024-01-01", "input_tokens": 1},
+                {"date": "2024-01-02", "input_tokens": 2},
+            ],
+        ]
+        aggregator = DaemonUsageAggregator(client, "daily", "Asia/Tokyo")
+
+        first = aggregator.aggregate()
+        changed = aggregator.refresh()
+
+        assert changed == ["2024-01-02"]
+        assert aggregator.rows()[0] is first[0]
+        client.query.assert_called_with("daily_totals", timezone="Asia/Tokyo")
+
+    def test_invalid_mode(self) -> None:
+        with pytest.raises(ValueError, match="Invalid aggregation mode"):
+            DaemonUsageAggregator(Mock(), "weekly")
@@ -0,0 +1,275 @@
+"""Tests for DataManager caching and background revalidation."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from claude_monitor.core.models import UsageEntry
+from claude_monitor.monitoring.data_manager import DataManager
+
+ANALYZE_USAGE = "claude_monitor.monitoring.data_manager.analyze_usage"
+
+
+def _usage(version: int) -> Dict[str, Any]:
+    return {"blocks": [], "version": version}
+
+
+@pytest.fixture
+def manager(tmp_path: Any) -> DataManager:
+    return DataManager(
+        cache_ttl=5,
+        data_path=str(tmp_path),
+        stale_while_revalidate=True,
+        max_staleness=60,
+    )
+
+
+def _expire(manager: DataManager, age: float) -> None:
+    manager._cache_timestamp = time.time() - age
+
+
+class TestStaleWhileRevalidate:
+    """Test serving expired snapshots while refreshing in the background."""
+
+    def test_fresh_cache_is_served_without_fetching(self, manager: DataManager) -> None:
+        with patch(ANALYZE_USAGE, return_value=_usage(1)) as analyze:
+            manager.get_data()
+            data = manager.get_data()
+
+        assert analyze.call_count == 1
+        assert data is not None
+        assert data["version"] == 1
+        assert data["freshness"]["stale"] is False
+
+    def test_stale_snapshot_is_returned_while_refreshing(
+        self, manager: DataManager
+    ) -> None:
+        release = threading.Event()
+        refreshed = threading.Event()
+        manager.on_refresh = refreshed.set
+
+        with patch(ANALYZE_USAGE, return_value=_usage(1)):
+            manager.get_data()
+        _expire(manager, 10)
+
+        def slow_fetch(**kwargs: Any) -> Dict[str, Any]:
+            release.wait(timeout=5)
+            return _usage(2)
+
+        with patch(ANALYZE_USAGE, side_effect=slow_fetch):
+            data = manager.get_data()
+            assert data is not None
+            assert data["version"] == 1
+            assert data["freshness"]["stale"] is True
+            assert data["freshness"]["refreshing"] is True
+
+            release.set()
+            assert refreshed.wait(timeout=5)
+
+        data = manager.get_data()
+        assert data is not None
+        assert data["version"] == 2
+        assert data["freshness"]["stale"] is False
+
+    def test_one_background_refresh_at_a_time(self, manager: DataManager) -> None:
+        release = threading.Event()
+        calls: List[int] = []
+
+        with patch(ANALYZE_USAGE, return_value=_usage(1)):
+            manager.get_data()
+        _expire(manager, 10)
+
+        def slow_fetch(**kwargs: Any) -> Dict[str, Any]:
+            calls.append(1)
+            release.wait(timeout=5)
+            return _usage(2)
+
+        with patch(ANALYZE_USAGE, side_effect=slow_fetch):
+            manager.get_data()
+            manager.get_data()
+            release.set()
+            manager._refresh_thread.join(timeout=5)  # type: ignore[union-attr]
+
+        assert len(calls) == 1
+
+    def test_refresh_runner_replaces_thread(self, manager: DataManager) -> None:
+        scheduled: List[Any] = []
+        manager.set_refresh_runner(scheduled.append)
+        with patch(ANALYZE_USAGE, return_value=_usage(1)):
+            manager.get_data()
+        _expire(manager, 10)
+
+        with patch(ANALYZE_USAGE, return_value=_usage(2)):
+            data = manager.get_data()
+            manager.get_data()
+            assert data is not None
+            assert data["freshness"]["refreshing"] is True
+            assert len(scheduled) == 1
+            assert manager._refresh_thread is None
+
+            scheduled[0]()
+
+        data = manager.get_data()
+        assert data is not None
+        assert data["version"] == 2
+        assert data["freshness"]["refreshing"] is False
+
+    def test_snapshot_past_max_staleness_is_refetched(
+        self, manager: DataManager
+    ) -> None:
+        with patch(ANALYZE_USAGE, return_value=_usage(1)):
+            manager.get_data()
+        _expire(manager, 120)
+
+        with patch(ANALYZE_USAGE, return_value=_usage(2)):
+            data = manager.get_data()
+
+        assert data is not None
+        assert data["version"] == 2
+        assert manager._refresh_thread is None
+
+    def test_disabled_by_default(self, tmp_path: Any) -> None:
+        manager = DataManager(cache_ttl=5, data_path=str(tmp_path))
+        with patch(ANALYZE_USAGE, return_value=_usage(1)):
+            manager.get_data()
+        _expire(manager, 10)
+
+        with patch(ANALYZE_USAGE, return_value=_usage(2)):
+            data = manager.get_data()
+
+        assert data is not None
+        assert data["version"] == 2
+
+    def test_failed_refresh_does_not_notify(self, manager: DataManager) -> None:
+        refreshed = threading.Event()
+        manager.on_refresh = refreshed.set
+        with patch(ANALYZE_USAGE, return_value=_usage(1)):
+            manager.get_data()
+        _expire(manager, 10)
+
+        with patch(ANALYZE_USAGE, return_value=None):
+            manager.get_data()
+            manager._refresh_thread.join(timeout=5)  # type: ignore[union-attr]
+
+        assert not refreshed.is_set()
+        data = manager.get_data()
+        assert data is not None
+        assert data["version"] == 1
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent fetches."""
+
+    def test_concurrent_refreshes_share_one_fetch(self, manager: DataManager) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        calls: List[int] = []
+
+        def slow_fetch(**kwargs: Any) -> Dict[str, Any]:
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return _usage(len(calls))
+
+        results: List[Any] = []
+
+        def refresh() -> None:
+            results.append(manager.get_data(force_refresh=True))
+
+        with patch(ANALYZE_USAGE, side_effect=slow_fetch):
+            leader = threading.Thread(target=refresh)
+            leader.start()
+            assert started.wait(timeout=5)
+            followers = [threading.Thread(target=refresh) for _ in range(3)]
+            for thread in followers:
+                thread.start()
+            # Followers are blocked on the in-flight fetch
+            time.sleep(0.1)
+            release.set()
+            for thread in [leader, *followers]:
+                thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert [data["version"] for data in results] == [1, 1, 1, 1]
+
+    def test_fetches_with_different_parameters_do_not_overlap(
+        self, manager: DataManager
+    ) -> None:
+        active: List[int] = []
+        overlaps: List[int] = []
+
+        def fetch(**kwargs: Any) -> Dict[str, Any]:
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+            return _usage(1)
+
+        with patch(ANALYZE_USAGE, side_effect=fetch):
+            threads = [
+                threading.Thread(
+                    target=manager.get_data,
+                    kwargs={"force_refresh": True, "recent_hours": hours},
+                )
+                for hours in (None, 1.0, 2.0)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        assert overlaps == [1, 1, 1]
+
+    def test_failed_flight_is_not_reused(self, manager: DataManager) -> None:
+        with patch(ANALYZE_USAGE, return_value=None):
+            assert manager.get_data() is None
+
+        with patch(ANALYZE_USAGE, return_value=_usage(2)):
+            data = manager.get_data()
+
+        assert data is not None
+        assert data["version"] == 2
+        assert manager._flights == {}
+
+
+class TestBlockEntries:
+    """Test reloading entries of evicted blocks."""
+
+    def test_entries_are_returned_when_present(self, manager: DataManager) -> None:
+        block = {"entries": [{"messageId": "msg_1"}]}
+        assert manager.get_block_entries(block) == [{"messageId": "msg_1"}]
+
+    def test_evicted_entries_are_reloaded_from_reader(
+        self, manager: DataManager
+    ) -> None:
+        block = {
+            "startTime": "2024-01-01T10:00:00+00:00",
+            "endTime": "2024-01-01T15:00:00+00:00",
+            "entries": [],
+            "entriesEvicted": True,
+        }
+        entries = [
+            UsageEntry(
+                timestamp=datetime(2024, 1, 1, hour, tzinfo=timezone.utc),
+                input_tokens=1,
+                output_tokens=1,
+                message_id=f"msg_{hour}",
+            )
+            for hour in (9, 10, 14, 15)
+        ]
+
+        with (
+            patch(
+                "claude_monitor.monitoring.data_manager.load_usage_entries",
+                return_value=(entries, None),
+            ),
+            patch.object(manager._reader, "load") as reader_load,
+        ):
+            reloaded = manager.get_block_entries(block)
+
+        assert [entry["messageId"] for entry in reloaded] == ["msg_10", "msg_14"]
+        reader_load.assert_not_called()
@@ -6,6 +6,8 @@ Covers file reading, data filtering, mapping, and error handling scenarios.
 """
 
 import json
+import os
+import re
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -17,12 +19,16 @@ import pytest
 from claude_monitor.core.models import CostMode, UsageEntry
 from claude_monitor.core.pricing import PricingCalculator
 from claude_monitor.data.reader import (
+    IncrementalUsageReader,
+    MultiRootUsageReader,
     _create_unique_hash,
     _find_jsonl_files,
     _map_to_usage_entry,
     _process_single_file,
+    _scan_lines,
     _should_process_entry,
     _update_processed_hashes,
+    create_usage_reader,
     load_all_raw_entries,
     load_usage_entries,
 )
@@ -273,7 +279,7 @@ class TestProcessSingleFile:
         return timezone_handler, pricing_calculator
 
     def test_process_single_file_valid_data(
-        self, mock_components: Tuple[Mock, Mock]
+        self, mock_components: Tuple[Mock, Mock], tmp_path: Path
     ) -> None:
         timezone_handler, pricing_calculator = mock_components
 
@@ -288,7 +294,8 @@ class TestProcessSingleFile:
         ]
 
         jsonl_content = "\n".join(json.dumps(item) for item in sample_data)
-        test_file = Path("/test/file.jsonl")
+        test_file = tmp_path / "file.jsonl"
+        test_file.write_text(jsonl_content)
 
         sample_entry = UsageEntry(
             timestamp=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc),
@@ -298,7 +305,6 @@ class TestProcessSingleFile:
         )
 
         with (
-            patch("builtins.open", mock_open(read_data=jsonl_content)),
             patch(
                 "claude_monitor.data.reader._should_process_entry", return_value=True
             ),
@@ -324,13 +330,14 @@ class TestProcessSingleFile:
         assert raw_data[0] == sample_data[0]
 
     def test_process_single_file_without_raw(
-        self, mock_components: Tuple[Mock, Mock]
+        self, mock_components: Tuple[Mock, Mock], tmp_path: Path
     ) -> None:
         timezone_handler, pricing_calculator = mock_components
 
         sample_data = [{"timestamp": "2024-01-01T12:00:00Z", "input_tokens": 100}]
         jsonl_content = json.dumps(sample_data[0])
-        test_file = Path("/test/file.jsonl")
+        test_file = tmp_path / "file.jsonl"
+        test_file.write_text(jsonl_content)
 
         sample_entry = UsageEntry(
             timestamp=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc),
@@ -340,7 +347,6 @@ class TestProcessSingleFile:
         )
 
         with (
-            patch("builtins.open", mock_open(read_data=jsonl_content)),
             patch(
                 "claude_monitor.data.reader._should_process_entry", return_value=True
             ),
@@ -363,15 +369,15 @@ class TestProcessSingleFile:
         assert len(entries) == 1
         assert raw_data is None
 
-    def test_process_single_file_filtered_entries(self, mock_components):
+    def test_process_single_file_filtered_entries(self, mock_components, tmp_path):
         timezone_handler, pricing_calculator = mock_components
 
         sample_data = [{"timestamp": "2024-01-01T12:00:00Z", "input_tokens": 100}]
         jsonl_content = json.dumps(sample_data[0])
-        test_file = Path("/test/file.jsonl")
+        test_file = tmp_path / "file.jsonl"
+        test_file.write_text(jsonl_content)
 
         with (
-            patch("builtins.open", mock_open(read_data=jsonl_content)),
             patch(
                 "claude_monitor.data.reader._should_process_entry", return_value=False
             ),
@@ -389,14 +395,14 @@ class TestProcessSingleFile:
         assert len(entries) == 0
         assert len(raw_data) == 0
 
-    def test_process_single_file_invalid_json(self, mock_components):
+    def test_process_single_file_invalid_json(self, mock_components, tmp_path):
         timezone_handler, pricing_calculator = mock_components
 
         jsonl_content = 'invalid json\n{"valid": "data"}'
-        test_file = Path("/test/file.jsonl")
+        test_file = tmp_path / "file.jsonl"
+        test_file.write_text(jsonl_content)
 
         with (
-            patch("builtins.open", mock_open(read_data=jsonl_content)),
             patch(
                 "claude_monitor.data.reader._should_process_entry", return_value=True
             ),
@@ -435,15 +441,15 @@ class TestProcessSingleFile:
         assert raw_data is None
         mock_report.assert_called_once()
 
-    def test_process_single_file_mapping_failure(self, mock_components):
+    def test_process_single_file_mapping_failure(self, mock_components, tmp_path):
         timezone_handler, pricing_calculator = mock_components
 
         sample_data = [{"timestamp": "2024-01-01T12:00:00Z", "input_tokens": 100}]
         jsonl_content = json.dumps(sample_data[0])
-        test_file = Path("/test/file.jsonl")
+        test_file = tmp_path / "file.jsonl"
+        test_file.write_text(jsonl_content)
 
         with (
-            patch("builtins.open", mock_open(read_data=jsonl_content)),
             patch(
                 "claude_monitor.data.reader._should_process_entry", return_value=True
             ),
@@ -463,6 +469,49 @@ class TestProcessSingleFile:
         assert len(raw_data) == 1
 
 
+class TestScanLines:
+    """Test memory-mapped line scanning."""
+
+    def _scan(self, path: Path, offset: int = 0, **kwargs: Any) -> Tuple:
+        with open(path, "rb") as f:
+            return _scan_lines(f, offset, kwargs.pop("max_length", 1000), **kwargs)
+
+    def test_lines_and_tail(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.jsonl"
+        path.write_bytes(b"first\nsecond\npartial")
+
+        assert self._scan(path) == ([b"first", b"second"], b"partial", 13)
+        assert self._scan(path, offset=6) == ([b"second"], b"partial", 13)
+
+    def test_pattern_selects_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.jsonl"
+        path.write_bytes(b'{"input_tokens": 1}\n{"type": "user"}\n')
+
+        lines, tail, end = self._scan(path, pattern=re.compile(rb"tokens"))
+
+        assert lines == [b'{"input_tokens": 1}']
+        assert tail is None
+        assert end == path.stat().st_size
+
+    def test_oversized_lines_are_skipped(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.jsonl"
+        path.write_bytes(b"short\n" + b"x" * 50 + b"\nok\n" + b"y" * 50)
+
+        lines, tail, end = self._scan(path, max_length=10)
+
+        assert lines == [b"short", b"ok"]
+        assert tail is None
+        assert end == path.stat().st_size
+
+    def test_empty_file_and_offset_at_end(self, tmp_path: Path) -> None:
+        path = tmp_path / "file.jsonl"
+        path.write_bytes(b"")
+        assert self._scan(path) == ([], None, 0)
+
+        path.write_bytes(b"line\n")
+        assert self._scan(path, offset=5) == ([], None, 5)
+
+
 class TestShouldProcessEntry:
     """Test the _should_process_entry function."""
 
@@ -1501,6 +1550,300 @@ class TestAdditionalEdgeCases:
                 assert mock_pricing_class.called
 
 
+def _usage_line(message_id: str, minutes_ago: int = 5) -> str:
+    """Build one assistant JSONL line with usage data."""
+    timestamp = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    return (
+        json.dumps(
+            {
+                "timestamp": timestamp.isoformat(),
+                "message": {
+                    "id": message_id,
+                    "model": "claude-3-5-sonnet",
+                    "usage": {"input_tokens": 100, "output_tokens": 50},
+                },
+                "requestId": f"req_{message_id}",
+            }
+        )
+        + "\n"
+    )
+
+
+class TestIncrementalUsageReader:
+    """Test offset-based incremental loading."""
+
+    def test_only_appended_lines_are_parsed(self, tmp_path: Path) -> None:
+        """Second load reads only the bytes appended since the first."""
+        data_file = tmp_path / "session.jsonl"
+        data_file.write_text(_usage_line("msg_1") + _usage_line("msg_2"))
+
+        reader = IncrementalUsageReader(str(tmp_path))
+        entries, _ = reader.load(hours_back=24)
+        assert len(entries) == 2
+
+        appended = _usage_line("msg_3")
+        with open(data_file, "a") as f:
+            f.write(appended)
+
+        entries, _ = reader.load(hours_back=24)
+        assert len(entries) == 3
+        assert reader.last_bytes_read == len(appended.encode())
+
+    def test_duplicates_across_loads_are_skipped(self, tmp_path: Path) -> None:
+        """Entries already seen in an earlier load are not added again."""
+        data_file = tmp_path / "session.jsonl"
+        data_file.write_text(_usage_line("msg_1"))
+
+        reader = IncrementalUsageReader(str(tmp_path))
+        reader.load(hours_back=24)
+
+        with open(data_file, "a") as f:
+            f.write(_usage_line("msg_1"))
+
+        entries, _ = reader.load(hours_back=24)
+        assert len(entries) == 1
+
+    def test_unchanged_files_are_not_reopened(self, tmp_path: Path) -> None:
+        """Files whose size matches the recorded offset are skipped."""
+        (tmp_path / "session.jsonl").write_text(_usage_line("msg_1"))
+        reader = IncrementalUsageReader(str(tmp_path))
+        reader.load(hours_back=24)
+
+        with patch("claude_monitor.data.reader._scan_lines") as scan:
+            entries, _ = reader.load(hours_back=24)
+
+        scan.assert_not_called()
+        assert len(entries) == 1
+
+    def test_partial_trailing_line_is_deferred(self, tmp_path: Path) -> None:
+        """A line still being written is picked up once it is complete."""
+        data_file = tmp_path / "session.jsonl"
+        line = _usage_line("msg_1")
+        data_file.write_text(line[:20])
+
+        reader = IncrementalUsageReader(str(tmp_path))
+        entries, _ = reader.load(hours_back=24)
+        assert entries == []
+
+        with open(data_file, "a") as f:
+            f.write(line[20:])
+
+        entries, _ = reader.load(hours_back=24)
+        assert len(entries) == 1
+
+    def test_non_candidate_tail_is_not_decoded(self, tmp_path: Path) -> None:
+        """A trailing line that cannot hold usage is left for the next load."""
+        data_file = tmp_path / "session.jsonl"
+        tail = json.dumps({"type": "user", "content": "hello"})
+        data_file.write_text(_usage_line("msg_1") + tail)
+
+        reader = IncrementalUsageReader(str(tmp_path))
+        with patch.object(reader, "_is_complete_line") as is_complete:
+            entries, _ = reader.load(hours_back=24)
+
+        is_complete.assert_not_called()
+        assert len(entries) == 1
+        assert reader.last_bytes_read == len(_usage_line("msg_1"))
+
+    def test_truncated_file_triggers_full_reload(self, tmp_path: Path) -> None:
+        """Shrinking a file resets the incremental state."""
+        data_file = tmp_path / "session.jsonl"
+        data_file.write_text(_usage_line("msg_1") + _usage_line("msg_2"))
+
+        reader = IncrementalUsageReader(str(tmp_path))
+        assert len(reader.load(hours_back=24)[0]) == 2
+
+        data_file.write_text(_usage_line("msg_3"))
+
+        entries, _ = reader.load(hours_back=24)
+        assert [e.message_id for e in entries] == ["msg_3"]
+
+    def test_raw_entries_keep_limit_candidates(self, tmp_path: Path) -> None:
+        """Raw output contains system messages needed for limit detection."""
+        data_file = tmp_path / "session.jsonl"
+        system_line = json.dumps(
+            {
+                "type": "system",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "content": "Usage limit reached",
+            }
+        )
+        data_file.write_text(_usage_line("msg_1") + system_line + "\n")
+
+        reader = IncrementalUsageReader(str(tmp_path))
+        entries, raw = reader.load(hours_back=24, include_raw=True)
+
+        assert len(entries) == 1
+        assert raw is not None
+        assert [r["type"] for r in raw] == ["system"]
+        assert raw[0]["content"] == "Usage limit reached"
+
+    def test_oversized_lines_are_skipped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Lines over the size limit are dropped without losing their neighbours."""
+        oversized = json.dumps({"type": "user", "content": "x" * 500}) + "\n"
+        data_file = tmp_path / "session.jsonl"
+        data_file.write_text(_usage_line("msg_1") + oversized + _usage_line("msg_2"))
+        monkeypatch.setenv("CLAUDE_MONITOR_MAX_LINE_BYTES", "400")
+
+        reader = IncrementalUsageReader(str(tmp_path))
+        entries, _ = reader.load(hours_back=24)
+
+        assert [e.message_id for e in entries] == ["msg_1", "msg_2"]
+        assert reader.last_bytes_read == data_file.stat().st_size
+
+    def test_oversized_lines_skipped_by_one_shot_loader(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """load_usage_entries applies the same line size limit."""
+        oversized = json.dumps({"type": "user", "content": "x" * 500}) + "\n"
+        (tmp_path / "session.jsonl").write_text(oversized + _usage_line("msg_1"))
+        monkeypatch.setenv("CLAUDE_MONITOR_MAX_LINE_BYTES", "400")
+
+        entries, raw = load_usage_entries(str(tmp_path), include_raw=True)
+
+        assert [e.message_id for e in entries] == ["msg_1"]
+        assert raw is not None and len(raw) == 1
+
+    def test_recent_hours_defers_old_files(self, tmp_path: Path) -> None:
+        """A recent-only load skips stale files; the next full load reads them."""
+        recent_file = tmp_path / "recent.jsonl"
+        recent_file.write_text(_usage_line("msg_new"))
+        old_file = tmp_path / "old.jsonl"
+        old_file.write_text(_usage_line("msg_old", minutes_ago=20 * 60))
+        stale = datetime.now().timestamp() - 20 * 3600
+        os.utime(old_file, (stale, stale))
+
+        reader = IncrementalUsageReader(str(tmp_path))
+        entries, _ = reader.load(hours_back=48, recent_hours=10)
+        assert [e.message_id for e in entries] == ["msg_new"]
+
+        entries, _ = reader.load(hours_back=48)
+        assert [e.message_id for e in entries] == ["msg_old", "msg_new"]
+        assert reader.last_bytes_read == old_file.stat().st_size
+
+    def test_last_new_entries_and_generation(self, tmp_path: Path) -> None:
+        """Each load reports its new entries; a reload bumps the generation."""
+        data_file = tmp_path / "session.jsonl"
+        data_file.write_text(_usage_line("msg_1"))
+        reader = IncrementalUsageReader(str(tmp_path))
+        reader.load()
+        generation = reader.generation
+
+        with open(data_file, "a") as f:
+            f.write(_usage_line("msg_2"))
+        reader.load()
+        assert [e.message_id for e in reader.last_new_entries] == ["msg_2"]
+        assert reader.generation == generation
+
+        reader.load()
+        assert reader.last_new_entries == []
+
+        data_file.write_text(_usage_line("msg_3"))
+        reader.load()
+        assert reader.generation > generation
+
+
+class TestMultiRootUsageReader:
+    """Test ingestion across several Claude data directories."""
+
+    def test_entries_are_deduplicated_across_roots(self, tmp_path: Path) -> None:
+        """A transcript copied into a second root is counted once."""
+        old_root = tmp_path / "claude" / "projects"
+        new_root = tmp_path / "config" / "claude" / "projects"
+        (old_root / "p").mkdir(parents=True)
+        (new_root / "p").mkdir(parents=True)
+        (old_root / "p" / "a.jsonl").write_text(
+            _usage_line("msg_1", 30) + _usage_line("msg_2", 20)
+        )
+        (new_root / "p" / "a.jsonl").write_text(
+            _usage_line("msg_1", 30) + _usage_line("msg_2", 20)
+        )
+        (new_root / "p" / "b.jsonl").write_text(_usage_line("msg_3", 10))
+
+        reader = MultiRootUsageReader([str(old_root), str(new_root)])
+        entries, _ = reader.load(hours_back=24)
+
+        assert [e.message_id for e in entries] == ["msg_1", "msg_2", "msg_3"]
+
+    def test_new_entries_copied_from_another_root_are_not_new(
+        self, tmp_path: Path
+    ) -> None:
+        """An entry already provided by one root is not reported again."""
+        root_a = tmp_path / "a"
+        root_b = tmp_path / "b"
+        root_a.mkdir()
+        root_b.mkdir()
+        (root_a / "s.jsonl").write_text(_usage_line("msg_1", 30))
+        (root_b / "s.jsonl").write_text(_usage_line("msg_2", 20))
+
+        reader = MultiRootUsageReader([str(root_a), str(root_b)])
+        reader.load()
+        assert len(reader.last_new_entries) == 2
+
+        with open(root_b / "s.jsonl", "a") as f:
+            f.write(_usage_line("msg_1", 30) + _usage_line("msg_3", 10))
+        reader.load()
+
+        assert [e.message_id for e in reader.last_new_entries] == ["msg_3"]
+
+    def test_roots_keep_separate_incremental_state(self, tmp_path: Path) -> None:
+        """Appending to one root only reads the appended bytes."""
+        root_a = tmp_path / "a"
+        root_b = tmp_path / "b"
+        root_a.mkdir()
+        root_b.mkdir()
+        (root_a / "s.jsonl").write_text(_usage_line("msg_1"))
+        (root_b / "s.jsonl").write_text(_usage_line("msg_2"))
+
+        reader = MultiRootUsageReader([str(root_a), str(root_b)])
+        assert len(reader.load(hours_back=24)[0]) == 2
+
+        appended = _usage_line("msg_3")
+        with open(root_b / "s.jsonl", "a") as f:
+            f.write(appended)
+        # Replacing a file in root_a resets only root_a
+        (root_a / "new.tmp").write_text(_usage_line("msg_4"))
+        os.replace(root_a / "new.tmp", root_a / "s.jsonl")
+
+        entries, _ = reader.load(hours_back=24)
+
+        assert sorted(e.message_id for e in entries) == ["msg_2", "msg_3", "msg_4"]
+        assert reader.last_bytes_read == len(appended.encode()) + len(
+            _usage_line("msg_4").encode()
+        )
+
+    def test_duplicate_and_nested_roots_are_scanned_once(self, tmp_path: Path) -> None:
+        """Aliased or nested roots do not double the scan cost."""
+        root = tmp_path / "projects"
+        (root / "nested").mkdir(parents=True)
+        (tmp_path / "alias").symlink_to(root)
+
+        reader = MultiRootUsageReader(
+            [str(root), str(tmp_path / "alias"), str(root / "nested")]
+        )
+
+        assert reader.data_paths == [root.resolve()]
+
+    def test_load_usage_entries_accepts_several_roots(self, tmp_path: Path) -> None:
+        """The one-shot loader reads every root in a list."""
+        for name, message_id in [("a", "msg_1"), ("b", "msg_2")]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "s.jsonl").write_text(_usage_line(message_id))
+
+        entries, _ = load_usage_entries(
+            data_path=[str(tmp_path / "a"), str(tmp_path / "b")], hours_back=24
+        )
+
+        assert len(entries) == 2
+
+    def test_create_usage_reader(self, tmp_path: Path) -> None:
+        """Single paths keep the plain incremental reader."""
+        assert isinstance(create_usage_reader(str(tmp_path)), IncrementalUsageReader)
+        assert isinstance(create_usage_reader([str(tmp_path)]), MultiRootUsageReader)
+
+
 class TestDataProcessors:
     """Test the data processor classes."""
 
@@ -0,0 +1,130 @@
+"""Tests for the pluggable JSON decoding backends."""
+
+import json
+from typing import Iterator
+
+import pytest
+
+from claude_monitor.data import decoding
+from claude_monitor.data.decoding import (
+    DECODER_BACKENDS,
+    DECODER_ENV_VAR,
+    JsonDecoder,
+    get_decoder,
+)
+
+USAGE_LINE = json.dumps(
+    {
+        "type": "assistant",
+        "timestamp": "2024-01-01T12:00:00Z",
+        "message": {
+            "id": "msg_1",
+            "model": "claude-3-5-sonnet",
+            "usage": {"input_tokens": 10, "output_tokens": 5},
+            "content": [{"type": "text", "text": "x" * 1000}],
+        },
+        "requestId": "req_1",
+        "costUSD": 0.01,
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_decoders(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Reset the shared decoder instances and backend override."""
+    monkeypatch.delenv(DECODER_ENV_VAR, raising=False)
+    monkeypatch.setattr(decoding, "_decoders", {})
+    yield
+
+
+def _installed_backends() -> list:
+    """Backend names whose optional dependency is importable."""
+    names = []
+    for name, backend in DECODER_BACKENDS.items():
+        try:
+            backend()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+class TestGetDecoder:
+    """Test backend selection."""
+
+    def test_stdlib_is_selectable(self) -> None:
+        assert get_decoder("stdlib").name == "stdlib"
+
+    def test_environment_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(DECODER_ENV_VAR, "stdlib")
+        assert get_decoder().name == "stdlib"
+
+    def test_auto_prefers_fastest_installed(self) -> None:
+        installed = _installed_backends()
+        expected = next(n for n in decoding.AUTO_BACKENDS if n in installed)
+        assert get_decoder("auto").name == expected
+
+    def test_unknown_name_selects_automatically(self) -> None:
+        assert get_decoder("simdjson").name == get_decoder("auto").name
+
+    def test_missing_backend_falls_back_to_stdlib(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class _Missing(JsonDecoder):
+            def __init__(self) -> None:
+                raise ImportError("not installed")
+
+        monkeypatch.setitem(DECODER_BACKENDS, "orjson", _Missing)
+        assert get_decoder("orjson").name == "stdlib"
+
+    def test_instances_are_shared(self) -> None:
+        assert get_decoder("stdlib") is get_decoder("stdlib")
+
+
+@pytest.mark.parametrize("name", list(DECODER_BACKENDS))
+class TestBackends:
+    """Test behaviour shared by every installed backend."""
+
+    @pytest.fixture
+    def decoder(self, name: str) -> JsonDecoder:
+        if name not in _installed_backends():
+            pytest.skip(f"{name} is not installed")
+        return DECODER_BACKENDS[name]()
+
+    def test_loads_returns_full_document(self, decoder: JsonDecoder) -> None:
+        assert decoder.loads(USAGE_LINE) == json.loads(USAGE_LINE)
+        assert decoder.loads(USAGE_LINE.encode()) == json.loads(USAGE_LINE)
+
+    def test_loads_entry_keeps_usage_fields(self, decoder: JsonDecoder) -> None:
+        data = decoder.loads_entry(USAGE_LINE.encode())
+
+        assert data["type"] == "assistant"
+        assert data["timestamp"] == "2024-01-01T12:00:00Z"
+        assert data["requestId"] == "req_1"
+        assert data["costUSD"] == 0.01
+        assert data["message"]["id"] == "msg_1"
+        assert data["message"]["model"] == "claude-3-5-sonnet"
+        assert data["message"]["usage"] == {"input_tokens": 10, "output_tokens": 5}
+
+    def test_loads_entry_accepts_unexpected_shapes(self, decoder: JsonDecoder) -> None:
+        assert decoder.loads_entry('{"type": "user", "message": "hi"}') == {
+            "type": "user",
+            "message": "hi",
+        }
+        assert decoder.loads_entry("[1, 2]") == [1, 2]
+
+    def test_oversized_line_skips_content(
+        self, decoder: JsonDecoder, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if decoder.streaming_threshold is not None:
+            monkeypatch.setattr(decoder, "streaming_threshold", 100)
+        data = decoder.loads_entry(USAGE_LINE)
+
+        assert "content" not in data["message"]
+        assert data["message"]["usage"] == {"input_tokens": 10, "output_tokens": 5}
+
+    def test_malformed_input_raises_value_error(self, decoder: JsonDecoder) -> None:
+        with pytest.raises(ValueError):
+            decoder.loads("{broken")
+        with pytest.raises(ValueError):
+            decoder.loads_entry(b"{broken")
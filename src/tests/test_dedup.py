@@ -0,0 +1,52 @@
+"""Tests for the compact deduplication index."""
+
+from claude_monitor.data.dedup import DedupIndex
+
+
+class TestDedupIndex:
+    """Test digest storage, compaction and the Bloom prefilter."""
+
+    def test_string_and_digest_keys_are_interchangeable(self) -> None:
+        index = DedupIndex()
+        index.add("msg_1:req_1")
+
+        assert "msg_1:req_1" in index
+        assert DedupIndex.digest("msg_1:req_1") in index
+        assert "msg_2:req_2" not in index
+        assert None not in index
+
+    def test_duplicates_are_counted_once(self) -> None:
+        index = DedupIndex()
+        for _ in range(3):
+            index.add("msg_1:req_1")
+        assert len(index) == 1
+
+    def test_keys_survive_compaction(self) -> None:
+        index = DedupIndex()
+        keys = [f"msg_{i}:req_{i}" for i in range(DedupIndex.MIN_PENDING * 3)]
+        for key in keys:
+            index.add(key)
+
+        assert len(index) == len(keys)
+        assert len(index._pending) < DedupIndex.MIN_PENDING
+        assert all(key in index for key in keys)
+        assert "msg_missing:req_missing" not in index
+        assert index.memory_bytes >= 8 * len(index._sorted)
+
+    def test_bloom_filter_keeps_membership_exact(self) -> None:
+        index = DedupIndex(bloom_bits=1 << 16)
+        keys = [f"msg_{i}:req_{i}" for i in range(DedupIndex.MIN_PENDING + 10)]
+        for key in keys:
+            index.add(key)
+
+        assert all(key in index for key in keys)
+        assert not any(f"other_{i}:req" in index for i in range(1000))
+        assert index.memory_bytes >= (1 << 16) // 8
+
+    def test_clear(self) -> None:
+        index = DedupIndex(bloom_bits=1024)
+        index.add("msg_1:req_1")
+        index.clear()
+
+        assert len(index) == 0
+        assert "msg_1:req_1" not in index
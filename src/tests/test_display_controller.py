@@ -1,17 +1,30 @@
 """Tests for DisplayController class."""
 
 from datetime import datetime, timedelta, timezone
+from io import StringIO
 from typing import Any, Dict
 from unittest.mock import Mock, patch
 
 import pytest
-
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.text import Text
+from rich.theme import Theme
+
+from claude_monitor.i18n.messages import get_message
+from claude_monitor.terminal.themes import (
+    BackgroundDetector,
+    BackgroundType,
+    ThemeManager,
+)
 from claude_monitor.ui.display_controller import (
     DisplayController,
     LiveDisplayManager,
+    LiveScreen,
     ScreenBufferManager,
     SessionCalculator,
 )
+from claude_monitor.ui.markup_cache import MarkupCache, markup_cache
+from claude_monitor.ui.session_display import SessionDisplayComponent
 
 
 class TestDisplayController:
@@ -387,7 +400,7 @@ class TestDisplayController:
             }
 
             with patch.object(
-                controller.session_display, "format_active_session_screen"
+                controller.session_display, "format_active_session_panels"
             ) as mock_format:
                 mock_format.return_value = ["Sample screen buffer"]
 
@@ -488,10 +501,11 @@ class TestScreenBufferManager:
         assert manager.console is None
 
     @patch("claude_monitor.terminal.themes.get_themed_console")
-    @patch("claude_monitor.ui.display_controller.Text")
+    @patch("claude_monitor.ui.markup_cache.Text")
     @patch("claude_monitor.ui.display_controller.Group")
     def test_create_screen_renderable(self, mock_group, mock_text, mock_get_console):
         """Test creating screen renderable from buffer."""
+        markup_cache.clear()
         mock_console = Mock()
         mock_get_console.return_value = mock_console
 
@@ -509,6 +523,26 @@ class TestScreenBufferManager:
         assert result is mock_group_obj
         assert mock_text.from_markup.call_count == 3
         mock_group.assert_called_once()
+        markup_cache.clear()
+
+    @patch("claude_monitor.terminal.themes.get_themed_console")
+    def test_repeated_lines_are_parsed_once(self, mock_get_console):
+        """Test that identical markup across frames is parsed only once."""
+        markup_cache.clear()
+        manager = ScreenBufferManager()
+        screen_buffer = ["[header]Title[/]", "", "[value]42[/]", ""]
+
+        with patch(
+            "claude_monitor.ui.markup_cache.Text.from_markup",
+            side_effect=Text.from_markup,
+        ) as from_markup:
+            first = manager.create_screen_renderable(screen_buffer)
+            second = manager.create_screen_renderable(screen_buffer)
+
+        assert from_markup.call_count == 3
+        assert list(first.renderables) == list(second.renderables)
+        assert first.renderables[0].plain == "Title"
+        markup_cache.clear()
 
     @patch("claude_monitor.terminal.themes.get_themed_console")
     @patch("claude_monitor.ui.display_controller.Group")
@@ -530,6 +564,166 @@ class TestScreenBufferManager:
         mock_group.assert_called_once()
 
 
+class TestMarkupCache:
+    """Test cases for the parsed markup cache."""
+
+    def test_least_recently_used_lines_are_evicted(self) -> None:
+        cache = MarkupCache(max_lines=2)
+        first = cache.compile("[dim]a[/]")
+        cache.compile("[dim]b[/]")
+        assert cache.compile("[dim]a[/]") is first
+
+        cache.compile("[dim]c[/]")
+
+        assert len(cache) == 2
+        assert cache.compile("[dim]a[/]") is first
+        with patch(
+            "claude_monitor.ui.markup_cache.Text.from_markup",
+            side_effect=Text.from_markup,
+        ) as from_markup:
+            cache.compile("[dim]b[/]")
+        from_markup.assert_called_once_with("[dim]b[/]")
+
+
+class _CountingRenderable:
+    """Renderable that counts how often it is laid out."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.renders = 0
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        self.renders += 1
+        yield Text(self.text)
+
+
+def _render(console: Console, renderable: Any) -> str:
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get()
+
+
+class TestLiveScreen:
+    """Test cases for the live screen that ticks only its clock line."""
+
+    @pytest.fixture
+    def console(self) -> Console:
+        return Console(file=StringIO(), width=80, color_system=None)
+
+    def test_body_is_laid_out_once_per_width(self, console: Console) -> None:
+        body = _CountingRenderable("header")
+        ticks = iter(["12:00:00", "12:00:01", "12:00:02", "12:00:03"])
+        screen = LiveScreen([body], lambda: next(ticks))
+
+        outputs = [_render(console, screen) for _ in range(3)]
+
+        assert body.renders == 1
+        assert outputs[0] == "header\n12:00:00\n"
+        assert outputs[2] == "header\n12:00:02\n"
+
+        narrow = Console(file=StringIO(), width=40, color_system=None)
+        _render(narrow, screen)
+        assert body.renders == 2
+
+    def test_pushed_theme_lays_out_body_again(self) -> None:
+        console = Console(
+            file=StringIO(),
+            width=80,
+            force_terminal=True,
+            theme=Theme({"info": "cyan"}),
+        )
+        screen = LiveScreen([Text("header", style="info")], lambda: "12:00:00")
+        manager = ThemeManager()
+        manager.themes["light"].rich_theme = Theme({"info": "red"})
+        manager._detection_pending = True
+
+        with patch("claude_monitor.terminal.themes._theme_manager", manager):
+            dark = _render(console, screen)
+            with patch.object(
+                BackgroundDetector,
+                "start_background_query",
+                side_effect=lambda apply, _console: apply(BackgroundType.LIGHT),
+            ):
+                manager.refine_auto_theme(console)
+            light = _render(console, screen)
+
+        assert light != dark
+        assert light == _render(console, LiveScreen(screen.body, screen.clock))
+
+    def test_clock_markup_is_parsed_only_when_it_changes(self) -> None:
+        markup = ["[dim]12:00:00[/]"]
+        screen = LiveScreen([], lambda: markup[0])
+
+        first = screen.clock_text()
+        assert screen.clock_text() is first
+        assert first.plain == "12:00:00"
+
+        markup[0] = "[dim]12:00:01[/]"
+        assert screen.clock_text().plain == "12:00:01"
+
+    def test_no_active_session_screen_ticks(self, console: Console) -> None:
+        with patch("claude_monitor.ui.display_controller.NotificationManager"):
+            controller = DisplayController()
+        args = Mock()
+        args.plan = "pro"
+        args.timezone = "UTC"
+        args.time_format = "24h"
+
+        screen = controller.create_data_display(
+            {"blocks": [{"isActive": False}]}, args, 200000
+        )
+
+        assert isinstance(screen, LiveScreen)
+        with patch.object(
+            controller.session_display,
+            "format_current_time",
+            side_effect=["10:00:00", "10:00:01"],
+        ):
+            first = _render(console, screen)
+            second = _render(console, screen)
+
+        assert get_message("ui.no_active_session") in first
+        assert "10:00:00" in first
+        assert "10:00:01" in second
+        assert first.replace("10:00:00", "10:00:01") == second
+
+    def test_active_session_screen_matches_full_screen(self) -> None:
+        manager = ScreenBufferManager()
+        session_display = SessionDisplayComponent()
+        fields: Dict[str, Any] = {
+            "plan": "pro",
+            "timezone": "UTC",
+            "tokens_used": 15000,
+            "token_limit": 200000,
+            "usage_percentage": 7.5,
+            "tokens_left": 185000,
+            "elapsed_session_minutes": 90,
+            "total_session_minutes": 300,
+            "burn_rate": 10.0,
+            "session_cost": 0.45,
+            "per_model_stats": {},
+            "sent_messages": 12,
+            "predicted_end_str": "14:00",
+            "reset_time_str": "16:00",
+        }
+        full = session_display.format_active_session_screen(
+            entries=[], current_time_str="12:30:00", **fields
+        )
+        screen = manager.create_live_screen(
+            [
+                session_display.format_header("pro", "UTC"),
+                session_display.format_active_session_panels(**fields),
+            ],
+            lambda: session_display.format_status_line("12:30:00"),
+        )
+
+        console = Console(file=StringIO(), width=120, color_system=None)
+        expected = manager.create_screen_renderable(full)
+        assert _render(console, screen) == _render(console, expected)
+
+
 class TestDisplayControllerEdgeCases:
     """Test edge cases for DisplayController."""
 
@@ -665,10 +859,10 @@ class TestDisplayControllerAdvanced:
 
             with (
                 patch.object(
-                    controller.buffer_manager, "create_screen_renderable"
+                    controller.buffer_manager, "create_live_screen"
                 ) as mock_create,
                 patch.object(
-                    controller.session_display, "format_active_session_screen"
+                    controller.session_display, "format_active_session_panels"
                 ) as mock_format,
             ):
                 mock_format.return_value = ["screen", "buffer"]
@@ -712,7 +906,7 @@ class TestDisplayControllerAdvanced:
                 mock_error.assert_called_once_with("pro", "UTC")
 
     def test_create_data_display_format_session_exception(self, controller):
-        """Test create_data_display with format_active_session_screen exception."""
+        """Test create_data_display with format_active_session_panels exception."""
         args = Mock()
         args.plan = "pro"
         args.timezone = "UTC"
@@ -742,7 +936,7 @@ class TestDisplayControllerAdvanced:
             }
 
             with patch.object(
-                controller.session_display, "format_active_session_screen"
+                controller.session_display, "format_active_session_panels"
             ) as mock_format:
                 mock_format.side_effect = Exception("Format error")
 
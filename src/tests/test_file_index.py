@@ -0,0 +1,84 @@
+"""Tests for the cached transcript file index."""
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+from claude_monitor.data.file_index import TranscriptFileIndex
+
+
+def _backdate(*paths: Path) -> None:
+    """Move mtimes out of the racy window so cached listings are trusted."""
+    old = time.time() - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+def _make_tree(root: Path) -> Path:
+    """Create a small project tree and return the project directory."""
+    project = root / "project-a"
+    project.mkdir()
+    (project / "session.jsonl").write_text("{}\n")
+    (project / "notes.txt").write_text("ignored")
+    (root / "top.jsonl").write_text("{}\n")
+    _backdate(project, root)
+    return project
+
+
+class TestTranscriptFileIndex:
+    """Test directory listing reuse and change detection."""
+
+    def test_finds_transcripts_with_stats(self, tmp_path: Path) -> None:
+        project = _make_tree(tmp_path)
+
+        files = TranscriptFileIndex(tmp_path).scan()
+
+        assert set(files) == {project / "session.jsonl", tmp_path / "top.jsonl"}
+        assert files[tmp_path / "top.jsonl"].st_size == 3
+
+    def test_unchanged_directories_are_not_listed_again(self, tmp_path: Path) -> None:
+        project = _make_tree(tmp_path)
+        index = TranscriptFileIndex(tmp_path)
+        index.scan()
+        assert index.directories_listed == 2
+
+        with open(project / "session.jsonl", "a") as f:
+            f.write("{}\n")
+        files = index.scan()
+
+        assert index.directories_listed == 0
+        assert files[project / "session.jsonl"].st_size == 6
+
+    def test_changed_directory_is_listed_again(self, tmp_path: Path) -> None:
+        project = _make_tree(tmp_path)
+        index = TranscriptFileIndex(tmp_path)
+        index.scan()
+
+        (project / "second.jsonl").write_text("{}\n")
+        files = index.scan()
+
+        assert index.directories_listed == 1
+        assert project / "second.jsonl" in files
+
+    def test_removed_directory_is_dropped(self, tmp_path: Path) -> None:
+        project = _make_tree(tmp_path)
+        index = TranscriptFileIndex(tmp_path)
+        index.scan()
+
+        shutil.rmtree(project)
+        files = index.scan()
+
+        assert set(files) == {tmp_path / "top.jsonl"}
+
+    def test_recent_directories_are_always_listed(self, tmp_path: Path) -> None:
+        (tmp_path / "a.jsonl").write_text("{}\n")
+        index = TranscriptFileIndex(tmp_path)
+        index.scan()
+
+        index.scan()
+
+        assert index.directories_listed == 1
+
+    def test_missing_root(self, tmp_path: Path) -> None:
+        assert TranscriptFileIndex(tmp_path / "missing").scan() == {}
@@ -9,6 +9,7 @@ import pytest
 
 from claude_monitor.core.plans import DEFAULT_TOKEN_LIMIT
 from claude_monitor.monitoring.orchestrator import MonitoringOrchestrator
+from claude_monitor.monitoring.scheduler import AdaptiveScheduler
 
 
 @pytest.fixture
@@ -75,9 +76,25 @@ class TestMonitoringOrchestratorInit:
             assert orchestrator._last_valid_data is None
             assert len(orchestrator._update_callbacks) == 0
 
-            mock_dm.assert_called_once_with(cache_ttl=5, data_path=None)
+            mock_dm.assert_called_once_with(
+                cache_ttl=5,
+                data_path=None,
+                stale_while_revalidate=True,
+                on_refresh=orchestrator._on_data_refreshed,
+                evict_closed_entries=True,
+            )
             mock_sm.assert_called_once()
 
+    def test_init_with_scheduler_limits_cache_ttl(self) -> None:
+        """Test cached data does not outlive the adaptive floor."""
+        with (
+            patch("claude_monitor.monitoring.orchestrator.DataManager") as mock_dm,
+            patch("claude_monitor.monitoring.orchestrator.SessionMonitor"),
+        ):
+            MonitoringOrchestrator(scheduler=AdaptiveScheduler(10, min_interval=2))
+
+        assert mock_dm.call_args.kwargs["cache_ttl"] == 2
+
     def test_init_with_custom_params(self) -> None:
         """Test initialization with custom parameters."""
         with (
@@ -89,7 +106,13 @@ class TestMonitoringOrchestratorInit:
             )
 
             assert orchestrator.update_interval == 5
-            mock_dm.assert_called_once_with(cache_ttl=5, data_path="/custom/path")
+            mock_dm.assert_called_once_with(
+                cache_ttl=5,
+                data_path="/custom/path",
+                stale_while_revalidate=True,
+                on_refresh=orchestrator._on_data_refreshed,
+                evict_closed_entries=True,
+            )
 
 
 class TestMonitoringOrchestratorLifecycle:
@@ -282,6 +305,39 @@ class TestMonitoringOrchestratorMonitoringLoop:
             # Should have called fetch multiple times
             assert mock_fetch.call_count >= 2
 
+    def test_monitoring_loop_uses_scheduler_interval(
+        self, mock_data_manager: Mock
+    ) -> None:
+        """Test the adaptive scheduler sets the wait between refreshes."""
+        scheduler = Mock(min_interval=2)
+        scheduler.observe.return_value = 0.01
+        orchestrator = MonitoringOrchestrator(
+            update_interval=60, data_manager=mock_data_manager, scheduler=scheduler
+        )
+
+        with patch.object(orchestrator, "_fetch_and_process_data") as mock_fetch:
+            mock_fetch.return_value = {"data": {"blocks": []}}
+            orchestrator.start()
+            time.sleep(0.2)
+            orchestrator.stop()
+
+        assert mock_fetch.call_count > 3
+        scheduler.observe.assert_called_with({"data": {"blocks": []}})
+
+    def test_background_refresh_notifies_wake_listeners(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test wake listeners run when the data manager finishes a refresh."""
+        listener = Mock()
+        orchestrator.add_wake_listener(listener)
+
+        orchestrator._on_data_refreshed()
+        orchestrator.remove_wake_listener(listener)
+        orchestrator._on_data_refreshed()
+
+        listener.assert_called_once_with()
+        assert orchestrator._wake_event.is_set()
+
     def test_monitoring_loop_stop_event(
         self, orchestrator: MonitoringOrchestrator
     ) -> None:
@@ -298,6 +354,38 @@ class TestMonitoringOrchestratorMonitoringLoop:
             # Should have minimal calls
             assert mock_fetch.call_count <= 2
 
+    def test_initial_fetch_renders_recent_files_first(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test a partial first load is followed by the history backfill."""
+        partial: Dict[str, Any] = {"blocks": [], "metadata": {"partial": True}}
+        full: Dict[str, Any] = {"blocks": [], "metadata": {"partial": False}}
+        orchestrator.data_manager.get_data.side_effect = [partial, full]
+        received: List[Dict[str, Any]] = []
+        orchestrator.register_update_callback(received.append)
+        orchestrator.update_interval = 60
+
+        orchestrator.start()
+        time.sleep(0.1)
+        orchestrator.stop()
+
+        calls = orchestrator.data_manager.get_data.call_args_list
+        assert calls[0].kwargs == {"force_refresh": True, "recent_hours": 10}
+        assert calls[1].kwargs == {"force_refresh": False}
+        assert [m["history_loaded"] for m in received] == [False, True]
+
+    def test_full_initial_data_skips_backfill(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test sources without partial loads (e.g. the daemon) fetch once."""
+        orchestrator.update_interval = 60
+
+        orchestrator.start()
+        time.sleep(0.1)
+        orchestrator.stop()
+
+        assert orchestrator.data_manager.get_data.call_count == 1
+
 
 class TestMonitoringOrchestratorFetchAndProcess:
     """Test data fetching and processing logic."""
@@ -391,6 +479,62 @@ class TestMonitoringOrchestratorFetchAndProcess:
         assert call_args["data"] == test_data
         assert call_args["token_limit"] == 19000  # Default PRO plan limit
 
+    def test_fetch_and_process_publishes_snapshot(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test processed data is published to the snapshot channel."""
+        orchestrator.data_manager.get_data.return_value = {"blocks": []}
+
+        result = orchestrator._fetch_and_process_data()
+
+        assert orchestrator.snapshots.latest() == (1, result)
+
+    def test_stale_repeat_is_not_published_again(
+        self, orchestrator: MonitoringOrchestrator, mock_session_monitor: Mock
+    ) -> None:
+        """Test a stale re-serve of the last snapshot is not processed twice."""
+
+        def fetched(at: float, stale: bool = False) -> Dict[str, Any]:
+            return {"blocks": [], "freshness": {"fetched_at": at, "stale": stale}}
+
+        data_manager = orchestrator.data_manager
+        data_manager.get_data.return_value = fetched(1.0)
+        first = orchestrator._fetch_and_process_data()
+
+        data_manager.get_data.return_value = fetched(1.0, stale=True)
+        assert orchestrator._fetch_and_process_data() is first
+        assert orchestrator.snapshots.latest() == (1, first)
+        assert mock_session_monitor.update.call_count == 1
+
+        data_manager.get_data.return_value = fetched(2.0)
+        fresh = orchestrator._fetch_and_process_data()
+        assert orchestrator.snapshots.latest() == (2, fresh)
+        assert mock_session_monitor.update.call_count == 2
+
+    def test_subscribers_run_with_monitoring(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test subscribers receive snapshots on their own threads."""
+        received = threading.Event()
+        threads: List[str] = []
+
+        def consume(monitoring_data: Dict[str, Any]) -> None:
+            threads.append(threading.current_thread().name)
+            received.set()
+
+        subscriber = orchestrator.subscribe(consume, name="TestSubscriber")
+        orchestrator.data_manager.get_data.return_value = {"blocks": []}
+
+        orchestrator.start()
+        try:
+            assert received.wait(timeout=5)
+            assert subscriber.is_running
+        finally:
+            orchestrator.stop()
+
+        assert threads[0] == "TestSubscriber"
+        assert not subscriber.is_running
+
     def test_fetch_and_process_callback_error(
         self, orchestrator: MonitoringOrchestrator
     ) -> None:
@@ -511,6 +655,28 @@ class TestMonitoringOrchestratorTokenLimitCalculation:
         assert result == 175000
         mock_get_limit.assert_called_once_with("custom", blocks_data)
 
+    def test_calculate_token_limit_custom_plan_partial_data(
+        self, orchestrator: MonitoringOrchestrator
+    ) -> None:
+        """Test P90 is not derived from a recent-files-only load."""
+        args = Mock()
+        args.plan = "custom"
+        orchestrator.set_args(args)
+
+        data: Dict[str, Any] = {
+            "blocks": [{"totalTokens": 1000}],
+            "metadata": {"partial": True},
+        }
+
+        with patch(
+            "claude_monitor.monitoring.orchestrator.get_token_limit",
+            return_value=44000,
+        ) as mock_get_limit:
+            result = orchestrator._calculate_token_limit(data)
+
+        assert result == 44000
+        mock_get_limit.assert_called_once_with("custom")
+
     def test_calculate_token_limit_exception(
         self, orchestrator: MonitoringOrchestrator
     ) -> None:
@@ -808,7 +974,7 @@ class TestSessionMonitor:
 
         assert monitor._current_session_id is None
         assert monitor._session_callbacks == []
-        assert monitor._session_history == []
+        assert list(monitor._session_history) == []
 
     def test_session_monitor_update_valid_data(self) -> None:
         """Test updating session monitor with valid data."""
@@ -937,8 +1103,7 @@ class TestSessionMonitor:
 
         monitor.update(data)
 
-        # History may or may not change depending on implementation
-        assert isinstance(monitor._session_history, list)
+        assert monitor.session_history[0]["id"] == "session_1"
 
     def test_session_monitor_current_session_tracking(self) -> None:
         """Test current session ID tracking."""
@@ -1015,3 +1180,187 @@ class TestSessionMonitor:
 
         assert isinstance(is_valid, bool)
         assert isinstance(errors, list)
+
+    def test_session_monitor_skips_unchanged_blocks(self) -> None:
+        """Test blocks unchanged since the last valid update are not revalidated."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        monitor = SessionMonitor()
+        blocks: List[Dict[str, Any]] = [
+            {"id": f"session_{i}", "isActive": False, "totalTokens": i, "costUSD": 0.0}
+            for i in range(5)
+        ]
+        blocks[-1]["isActive"] = True
+        monitor.update({"blocks": blocks})
+
+        grown = [dict(block) for block in blocks]
+        grown[-1]["totalTokens"] = 500
+        with patch.object(
+            monitor, "_validate_block", wraps=monitor._validate_block
+        ) as validate:
+            is_valid, _ = monitor.update({"blocks": grown})
+
+        assert is_valid is True
+        assert [call.args[1] for call in validate.call_args_list] == [4]
+
+    def test_session_monitor_skips_reused_closed_blocks(self) -> None:
+        """Test the same closed block objects are neither validated nor indexed."""
+        from claude_monitor.monitoring import session_monitor
+
+        monitor = session_monitor.SessionMonitor()
+        closed: List[Dict[str, Any]] = [
+            {"id": f"session_{i}", "isActive": False, "totalTokens": i, "costUSD": 0.0}
+            for i in range(5)
+        ]
+        active = {"id": "session_5", "isActive": True, "totalTokens": 5, "costUSD": 0}
+        monitor.update({"blocks": closed + [active]})
+
+        ended = {**active, "isActive": False}
+        new = {"id": "session_6", "isActive": True, "totalTokens": 1, "costUSD": 0}
+        with patch.object(
+            session_monitor,
+            "_block_fingerprint",
+            wraps=session_monitor._block_fingerprint,
+        ) as fingerprint:
+            is_valid, _ = monitor.update({"blocks": closed + [ended, new]})
+
+        assert is_valid is True
+        assert [call.args[0]["id"] for call in fingerprint.call_args_list] == [
+            "session_5",
+            "session_6",
+        ]
+        assert monitor.get_block("session_0") is closed[0]
+        assert monitor.get_block("session_5") is ended
+        assert monitor.active_block is new
+
+        monitor.update({"blocks": closed[1:] + [ended]})
+
+        assert monitor.get_block("session_0") is None
+        assert monitor.get_block("session_6") is None
+        assert monitor.active_block is None
+
+    def test_session_monitor_revalidates_changed_types(self) -> None:
+        """Test a known block whose field changed type is validated again."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        monitor = SessionMonitor()
+        block = {"id": "session_1", "isActive": True, "totalTokens": 1, "costUSD": 0}
+        monitor.update({"blocks": [block]})
+
+        is_valid, errors = monitor.update({"blocks": [{**block, "isActive": 1}]})
+
+        assert is_valid is False
+        assert errors == ["Block 0 isActive must be boolean"]
+
+    def test_session_monitor_indexes_blocks(self) -> None:
+        """Test blocks are indexed by id and the active block is tracked."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        monitor = SessionMonitor()
+        closed = {"id": "a", "isActive": False, "totalTokens": 1, "costUSD": 0.1}
+        active = {"id": "b", "isActive": True, "totalTokens": 2, "costUSD": 0.2}
+        monitor.update({"blocks": [closed, active]})
+
+        assert monitor.get_block("a") is closed
+        assert monitor.active_block is active
+        assert monitor.current_session_id == "b"
+
+        monitor.update({"blocks": [closed]})
+
+        assert monitor.get_block("b") is None
+        assert monitor.active_block is None
+        assert monitor.current_session_id is None
+
+    def test_session_monitor_invalid_update_keeps_index(self) -> None:
+        """Test an invalid update leaves the last valid index in place."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        monitor = SessionMonitor()
+        active = {"id": "b", "isActive": True, "totalTokens": 2, "costUSD": 0.2}
+        monitor.update({"blocks": [active]})
+
+        monitor.update({"blocks": [{"id": "c", "isActive": True}]})
+
+        assert monitor.active_block is active
+
+    @staticmethod
+    def _start_sessions(monitor: Any, count: int, offset: int = 0) -> None:
+        """Feed updates that each start a new session."""
+        for i in range(offset, offset + count):
+            block = {
+                "id": f"session_{i}",
+                "isActive": True,
+                "totalTokens": i,
+                "costUSD": 0.0,
+            }
+            monitor.update({"blocks": [block]})
+
+    def test_session_history_is_bounded(self) -> None:
+        """Test only the most recent sessions are kept in memory."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        monitor = SessionMonitor(max_history=3)
+        self._start_sessions(monitor, 5)
+
+        assert [s["id"] for s in monitor.session_history] == [
+            "session_2",
+            "session_3",
+            "session_4",
+        ]
+        assert monitor.session_count == 5
+        assert [s["id"] for s in monitor.recent_sessions(2)] == [
+            "session_4",
+            "session_3",
+        ]
+
+    def test_session_history_survives_restart(self, tmp_path: Any) -> None:
+        """Test session starts are appended to and reloaded from the log."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        log = tmp_path / "sessions.jsonl"
+        self._start_sessions(SessionMonitor(history_path=log), 2)
+
+        restarted = SessionMonitor(history_path=log)
+
+        assert [s["id"] for s in restarted.session_history] == [
+            "session_0",
+            "session_1",
+        ]
+        assert restarted.session_count == 2
+
+    def test_active_session_is_not_logged_again_on_restart(self, tmp_path: Any) -> None:
+        """Test restarting during a session does not log it a second time."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        log = tmp_path / "sessions.jsonl"
+        for _ in range(3):
+            self._start_sessions(SessionMonitor(history_path=log), 1)
+
+        restarted = SessionMonitor(history_path=log)
+
+        assert [s["id"] for s in restarted.session_history] == ["session_0"]
+        assert restarted.session_count == 1
+        assert len(log.read_text().splitlines()) == 1
+
+    def test_session_log_is_compacted(self, tmp_path: Any) -> None:
+        """Test the log is rewritten once it holds twice the history size."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        log = tmp_path / "sessions.jsonl"
+        monitor = SessionMonitor(history_path=log, max_history=2)
+        self._start_sessions(monitor, 5)
+
+        lines = log.read_text().splitlines()
+        assert len(lines) <= 4
+        assert '"session_4"' in lines[-1]
+
+    def test_session_log_skips_corrupt_lines(self, tmp_path: Any) -> None:
+        """Test unreadable log lines are ignored on load."""
+        from claude_monitor.monitoring.session_monitor import SessionMonitor
+
+        log = tmp_path / "sessions.jsonl"
+        log.write_text('{"id": "a"}\nnot json\n[1]\n{"id": "b"}\n')
+
+        monitor = SessionMonitor(history_path=log)
+
+        assert [s["id"] for s in monitor.session_history] == ["a", "b"]
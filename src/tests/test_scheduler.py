@@ -0,0 +1,110 @@
+"""Tests for the adaptive refresh scheduler."""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+from claude_monitor.monitoring.scheduler import AdaptiveScheduler, create_scheduler
+
+
+def _snapshot(
+    tokens: Optional[int] = None, token_limit: int = 100_000, blocks: int = 1
+) -> Dict[str, Any]:
+    """Monitoring data whose last block has the given tokens (None = inactive)."""
+    block_list: List[Dict[str, Any]] = [
+        {"id": f"block-{i}", "isActive": False, "totalTokens": 10}
+        for i in range(blocks - 1)
+    ]
+    block_list.append(
+        {
+            "id": "last",
+            "isActive": tokens is not None,
+            "totalTokens": tokens or 10,
+        }
+    )
+    return {"data": {"blocks": block_list}, "token_limit": token_limit}
+
+
+def _scheduler() -> AdaptiveScheduler:
+    return AdaptiveScheduler(10, min_interval=2, max_interval=60)
+
+
+class TestAdaptiveScheduler:
+    """Test interval selection from activity."""
+
+    def test_growing_active_block_uses_floor(self) -> None:
+        scheduler = _scheduler()
+        assert scheduler.observe(_snapshot(tokens=1000)) == 10
+
+        assert scheduler.observe(_snapshot(tokens=2000)) == 2
+
+    def test_quiet_active_block_uses_base_interval(self) -> None:
+        scheduler = _scheduler()
+        scheduler.observe(_snapshot(tokens=1000))
+        scheduler.observe(_snapshot(tokens=2000))
+
+        assert scheduler.observe(_snapshot(tokens=2000)) == 10
+
+    def test_near_limit_uses_floor(self) -> None:
+        scheduler = _scheduler()
+        assert scheduler.observe(_snapshot(tokens=90_000)) == 2
+
+    def test_idle_backs_off_exponentially_to_ceiling(self) -> None:
+        scheduler = _scheduler()
+        intervals = [scheduler.observe(_snapshot()) for _ in range(5)]
+
+        assert intervals == [20, 40, 60, 60, 60]
+
+    def test_new_usage_ends_back_off(self) -> None:
+        scheduler = _scheduler()
+        for _ in range(4):
+            scheduler.observe(_snapshot())
+
+        assert scheduler.observe(_snapshot(tokens=500, blocks=2)) == 2
+
+    def test_failed_refresh_returns_to_base_interval(self) -> None:
+        scheduler = _scheduler()
+        scheduler.observe(_snapshot())
+        scheduler.observe(_snapshot())
+
+        assert scheduler.observe(None) == 10
+
+    def test_stale_then_fresh_refresh_backs_off_once(self) -> None:
+        def fetched(at: float, stale: bool = False) -> Dict[str, Any]:
+            snapshot = _snapshot()
+            snapshot["freshness"] = {"fetched_at": at, "stale": stale}
+            return snapshot
+
+        scheduler = _scheduler()
+        intervals = [
+            scheduler.observe(fetched(1.0)),
+            # Stale copy served while the background refresh runs
+            scheduler.observe(fetched(1.0, stale=True)),
+            # Fresh snapshot published when the refresh wakes the loop
+            scheduler.observe(fetched(2.0)),
+            scheduler.observe(fetched(2.0, stale=True)),
+            scheduler.observe(fetched(3.0)),
+        ]
+
+        assert intervals == [20, 20, 40, 40, 60]
+
+    def test_bounds_include_base_interval(self) -> None:
+        scheduler = AdaptiveScheduler(30, min_interval=60, max_interval=5)
+
+        assert scheduler.min_interval == 30
+        assert scheduler.max_interval == 30
+
+
+class TestCreateScheduler:
+    """Test construction from command line arguments."""
+
+    def test_disabled(self) -> None:
+        assert create_scheduler(Mock(adaptive_refresh=False), 10) is None
+
+    def test_enabled(self) -> None:
+        args = Mock(adaptive_refresh=True, min_refresh_rate=1, max_refresh_rate=90)
+
+        scheduler = create_scheduler(args, 10)
+
+        assert scheduler is not None
+        assert scheduler.min_interval == 1
+        assert scheduler.max_interval == 90
@@ -252,6 +252,7 @@ class TestSettings:
         assert settings.custom_limit_tokens is None
         assert settings.refresh_rate == 10
         assert settings.refresh_per_second == 0.75
+        assert settings.max_refresh_rate == 30
         assert settings.reset_hour is None
         assert settings.log_level == "INFO"
         assert settings.log_file is None
@@ -580,6 +581,8 @@ class TestSettings:
             timezone="UTC",
             theme="dark",
             refresh_rate=5,
+            min_refresh_rate=1,
+            max_refresh_rate=120,
             refresh_per_second=1.0,
             reset_hour=8,
             custom_limit_tokens=1000,
@@ -597,6 +600,10 @@ class TestSettings:
         assert namespace.timezone == "UTC"
         assert namespace.theme == "dark"
         assert namespace.refresh_rate == 5
+        assert namespace.adaptive_refresh is True
+        assert namespace.paged_tables is True
+        assert namespace.min_refresh_rate == 1
+        assert namespace.max_refresh_rate == 120
         assert namespace.refresh_per_second == 1.0
         assert namespace.reset_hour == 8
         assert namespace.custom_limit_tokens == 1000
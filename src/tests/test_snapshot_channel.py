@@ -0,0 +1,113 @@
+"""Tests for the latest-value snapshot channel."""
+
+import threading
+import time
+from typing import List
+
+from claude_monitor.monitoring.snapshot_channel import (
+    ChannelSubscriber,
+    SnapshotChannel,
+)
+
+
+class TestSnapshotChannel:
+    """Test publishing and waiting for values."""
+
+    def test_latest_value_wins(self) -> None:
+        channel: SnapshotChannel[int] = SnapshotChannel()
+        assert channel.latest() == (0, None)
+
+        channel.publish(1)
+        channel.publish(2)
+
+        assert channel.latest() == (2, 2)
+
+    def test_wait_returns_newer_value(self) -> None:
+        channel: SnapshotChannel[str] = SnapshotChannel()
+        threading.Timer(0.05, channel.publish, args=("a",)).start()
+
+        assert channel.wait(0, timeout=5) == (1, "a")
+
+    def test_wait_times_out_without_new_value(self) -> None:
+        channel: SnapshotChannel[str] = SnapshotChannel()
+        channel.publish("a")
+
+        assert channel.wait(1, timeout=0.01) == (1, "a")
+
+
+class TestChannelSubscriber:
+    """Test consumers running at their own pace."""
+
+    def test_slow_consumer_skips_intermediate_snapshots(self) -> None:
+        channel: SnapshotChannel[int] = SnapshotChannel()
+        received: List[int] = []
+        busy = threading.Event()
+        release = threading.Event()
+
+        def consume(value: int) -> None:
+            received.append(value)
+            busy.set()
+            release.wait(timeout=5)
+
+        subscriber = ChannelSubscriber(channel, consume)
+        subscriber.start()
+        try:
+            channel.publish(1)
+            assert busy.wait(timeout=5)
+            for value in range(2, 10):
+                channel.publish(value)
+            release.set()
+
+            deadline = time.monotonic() + 5
+            while received[-1] != 9 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            subscriber.stop()
+
+        assert received == [1, 9]
+
+    def test_publisher_is_not_blocked_by_consumer(self) -> None:
+        channel: SnapshotChannel[int] = SnapshotChannel()
+        release = threading.Event()
+        subscriber = ChannelSubscriber(channel, lambda _: release.wait(timeout=5))
+        subscriber.start()
+        try:
+            started = time.monotonic()
+            for value in range(100):
+                channel.publish(value)
+            assert time.monotonic() - started < 1.0
+        finally:
+            release.set()
+            subscriber.stop()
+
+    def test_consumer_errors_do_not_stop_delivery(self) -> None:
+        channel: SnapshotChannel[int] = SnapshotChannel()
+        received: List[int] = []
+        delivered = threading.Event()
+
+        def consume(value: int) -> None:
+            if value == 1:
+                raise RuntimeError("boom")
+            received.append(value)
+            delivered.set()
+
+        subscriber = ChannelSubscriber(channel, consume)
+        subscriber.start()
+        try:
+            channel.publish(1)
+            time.sleep(0.05)
+            channel.publish(2)
+            assert delivered.wait(timeout=5)
+        finally:
+            subscriber.stop()
+
+        assert received == [2]
+
+    def test_stop_joins_thread(self) -> None:
+        subscriber = ChannelSubscriber(SnapshotChannel(), lambda _: None)
+        subscriber.start()
+        assert subscriber.is_running
+
+        subscriber.stop()
+
+        assert not subscriber.is_running
@@ -0,0 +1,79 @@
+"""Startup-time regression tests for the CLI entry point.
+
+Heavy dependencies (Rich, pydantic, pytz, NumPy) must only be imported by the
+commands and views that use them. These tests run a fresh interpreter with
+``-X importtime`` so that modules already imported by the test session do not
+hide regressions.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+HEAVY_MODULES = ["rich", "pydantic", "pydantic_settings", "pytz", "numpy"]
+
+# Generous budget for importing the CLI module; eager imports used to cost
+# several hundred milliseconds. Override on slow machines.
+IMPORT_BUDGET_MS = float(os.environ.get("CLAUDE_MONITOR_IMPORT_BUDGET_MS", "150"))
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter."""
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _parse_importtime(stderr: str) -> Dict[str, int]:
+    """Map module name to cumulative import time in microseconds."""
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def _loaded_heavy_modules(statement: str) -> List[str]:
+    """Run a statement and report which heavy modules it imported."""
+    code = (
+        "import sys\n"
+        f"{statement}\n"
+        f"print('heavy:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    last_line = _run_python(code).stdout.splitlines()[-1]
+    return [m for m in last_line[len("heavy:") :].split(",") if m]
+
+
+@pytest.mark.subprocess
+class TestStartupImports:
+    """Guard the lazy-import structure of the entry points."""
+
+    def test_cli_module_import_is_light(self) -> None:
+        assert _loaded_heavy_modules("import claude_monitor.cli.main") == []
+
+    def test_entry_point_import_is_light(self) -> None:
+        assert _loaded_heavy_modules("import claude_monitor.__main__") == []
+
+    def test_version_fast_path_is_light(self) -> None:
+        statement = (
+            "from claude_monitor.__main__ import main\nassert main(['--version']) == 0"
+        )
+        assert _loaded_heavy_modules(statement) == []
+
+    def test_cli_import_time_budget(self) -> None:
+        result = _run_python("import claude_monitor.cli.main", "-X", "importtime")
+        cumulative = _parse_importtime(result.stderr)
+
+        elapsed_ms = cumulative["claude_monitor.cli.main"] / 1000
+        assert elapsed_ms < IMPORT_BUDGET_MS, (
+            f"Importing claude_monitor.cli.main took {elapsed_ms:.1f}ms "
+            f"(budget {IMPORT_BUDGET_MS:.0f}ms)"
+        )
@@ -0,0 +1,284 @@
+"""Tests for the status file and the one-shot status command."""
+
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from claude_monitor.cli import status as status_cli
+from claude_monitor.monitoring.status_file import (
+    StatusFileWriter,
+    build_status,
+    new_status,
+    read_status_file,
+    write_status_file,
+)
+
+
+@pytest.fixture
+def status_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Redirect the status file into a temporary directory."""
+    path = tmp_path / "status.json"
+    monkeypatch.setenv("CLAUDE_MONITOR_STATUS_FILE", str(path))
+    return path
+
+
+def _write_transcript(path: Path, minutes_ago: List[int], prefix: str = "m") -> None:
+    """Write assistant entries with usage at the given ages."""
+    now = datetime.now(timezone.utc)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for i, age in enumerate(minutes_ago):
+            f.write(
+                json.dumps(
+                    {
+                        "timestamp": (now - timedelta(minutes=age))
+                        .isoformat()
+                        .replace("+00:00", "Z"),
+                        "requestId": f"req_{prefix}{i}",
+                        "message": {
+                            "id": f"{prefix}{i}",
+                            "model": "claude-3-5-sonnet",
+                            "usage": {"input_tokens": 100, "output_tokens": 50},
+                        },
+                    }
+                )
+                + "\n"
+            )
+
+
+class TestStatusFile:
+    """Test building, writing and reading the status file."""
+
+    def test_build_status_from_active_block(self) -> None:
+        blocks: List[Dict[str, Any]] = [
+            {"isActive": False, "totalTokens": 999},
+            {
+                "isActive": True,
+                "isGap": False,
+                "totalTokens": 4000,
+                "costUSD": 1.5,
+                "sentMessagesCount": 7,
+                "startTime": "2024-01-01T10:00:00+00:00",
+                "endTime": "2024-01-01T15:00:00+00:00",
+                "burnRate": {"tokensPerMinute": 12.0},
+            },
+        ]
+
+        status = build_status(blocks, token_limit=10000, plan="pro", now=1.0)
+
+        assert status["active"] is True
+        assert status["tokens_used"] == 4000
+        assert status["tokens_left"] == 6000
+        assert status["percent_used"] == 40.0
+        assert status["burn_rate"] == 12.0
+        assert (
+            status["reset_at"]
+            == datetime(2024, 1, 1, 15, tzinfo=timezone.utc).timestamp()
+        )
+        assert status["source"] == "monitor"
+
+    def test_build_status_without_active_block(self) -> None:
+        status = build_status([], token_limit=10000, plan="pro")
+        assert status["active"] is False
+        assert status["tokens_left"] == 10000
+        assert status["reset_at"] is None
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "nested" / "status.json")
+        status = new_status("max5", 88000, "monitor", now=5.0)
+
+        write_status_file(status, path)
+
+        assert read_status_file(path) == status
+
+    def test_read_rejects_missing_and_invalid(self, tmp_path: Path) -> None:
+        path = tmp_path / "status.json"
+        assert read_status_file(str(path)) is None
+
+        path.write_text("{broken")
+        assert read_status_file(str(path)) is None
+
+        path.write_text(json.dumps({"version": 999}))
+        assert read_status_file(str(path)) is None
+
+    def test_writer_callback(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "status.json")
+        writer = StatusFileWriter(path)
+
+        writer({"data": {"blocks": []}, "token_limit": 500, "args": Mock(plan="pro")})
+
+        status = read_status_file(path)
+        assert status is not None
+        assert status["plan"] == "pro"
+        assert status["token_limit"] == 500
+
+
+class TestFormatStatus:
+    """Test status line formatting."""
+
+    def test_default_format(self) -> None:
+        status = new_status("pro", 19000, "monitor")
+        status.update({"tokens_used": 1000, "tokens_left": 18000})
+        line = status_cli.format_status(status, status_cli.DEFAULT_FORMAT)
+        assert line.startswith("18,000 tokens left")
+        assert "--:--" in line
+
+    def test_reset_fields(self) -> None:
+        now = 1_700_000_000.0
+        status = new_status("pro", 19000, "monitor", now)
+        status["reset_at"] = now + 90 * 60
+
+        assert status_cli.format_status(status, "{reset_in}", now) == "1h30m"
+        assert status_cli.format_status(status, "{reset_time}", now) == time.strftime(
+            "%H:%M", time.localtime(now + 90 * 60)
+        )
+
+    def test_json_format(self) -> None:
+        status = new_status("pro", 19000, "monitor")
+        assert json.loads(status_cli.format_status(status, "json")) == status
+
+    def test_unknown_field_returns_error(
+        self, status_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        write_status_file(new_status("pro", 19000, "monitor"))
+        assert status_cli.main(["--format", "{nope}"]) == 2
+        assert "invalid format" in capsys.readouterr().err
+
+
+class TestParseArgs:
+    """Test the argparse-free option parser."""
+
+    def test_options(self) -> None:
+        options = status_cli._parse_args(
+            ["-f", "{plan}", "--max-age=5", "--data-path", "a", "--data-path", "b"]
+        )
+        assert options is not None
+        assert options["format"] == "{plan}"
+        assert options["max_age"] == 5.0
+        assert options["data_paths"] == ["a", "b"]
+
+    def test_help(self) -> None:
+        assert status_cli._parse_args(["--help"]) is None
+
+    @pytest.mark.parametrize("argv", [["--bogus"], ["--format"]])
+    def test_invalid(self, argv: List[str]) -> None:
+        with pytest.raises(ValueError):
+            status_cli._parse_args(argv)
+
+
+class TestStatusCommand:
+    """Test the status command end to end."""
+
+    def test_fresh_status_file_skips_scan(
+        self, status_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        write_status_file(new_status("pro", 19000, "monitor"))
+
+        with patch.object(status_cli, "_scan_status") as mock_scan:
+            assert status_cli.main(["-f", "{source}:{tokens_left}"]) == 0
+
+        mock_scan.assert_not_called()
+        assert capsys.readouterr().out.strip() == "monitor:19000"
+
+    def test_expired_block_triggers_scan(self, status_path: Path) -> None:
+        status = new_status("pro", 19000, "monitor")
+        status["reset_at"] = time.time() - 1
+        write_status_file(status)
+
+        with patch.object(
+            status_cli, "_scan_status", return_value=new_status("pro", 1, "scan")
+        ) as mock_scan:
+            status_cli.main(["-f", "{source}"])
+
+        mock_scan.assert_called_once()
+
+    def test_scan_computes_active_block(
+        self, status_path: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        data_dir = tmp_path / "projects"
+        _write_transcript(data_dir / "p1" / "a.jsonl", [700, 30, 20])
+        _write_transcript(data_dir / "p2" / "b.jsonl", [10], prefix="b")
+        # Same message/request ids as a.jsonl: must be deduplicated
+        _write_transcript(data_dir / "p2" / "copy.jsonl", [700, 30, 20])
+
+        argv = ["--data-path", str(data_dir), "--plan", "pro", "-f", "json"]
+        assert status_cli.main(argv) == 0
+
+        status = json.loads(capsys.readouterr().out)
+        assert status["source"] == "scan"
+        assert status["active"] is True
+        assert status["messages"] == 3
+        assert status["tokens_used"] == 450
+        assert status["cost_usd"] > 0
+        assert read_status_file() == status
+
+    def test_scan_without_recent_activity(
+        self, status_path: Path, tmp_path: Path
+    ) -> None:
+        data_dir = tmp_path / "projects"
+        _write_transcript(data_dir / "a.jsonl", [400])
+
+        status = status_cli._scan_status(
+            {"plan": "pro", "data_paths": [str(data_dir)]}, None, time.time()
+        )
+
+        assert status["active"] is False
+        assert status["tokens_used"] == 0
+
+    def test_scan_reads_back_three_session_windows(
+        self, status_path: Path, tmp_path: Path
+    ) -> None:
+        with patch.object(
+            status_cli, "_collect_recent_records", return_value={}
+        ) as collect:
+            status_cli._scan_status(
+                {"plan": "pro", "data_paths": [str(tmp_path)]}, None, 100_000.0
+            )
+
+        assert collect.call_args[0][1] == 100_000.0 - 15 * 3600
+
+    def test_scan_is_anchored_on_last_block_start(self) -> None:
+        now = 100_000.0
+        previous = new_status("pro", 19000, "monitor", now - 60)
+        previous["session_start"] = now - 12 * 3600
+
+        assert status_cli._scan_cutoff(previous, now) == now - 12 * 3600
+        previous["session_start"] = now - 20 * 3600
+        assert status_cli._scan_cutoff(previous, now) == now - 15 * 3600
+        assert status_cli._scan_cutoff(None, now) == now - 15 * 3600
+
+    def test_tail_reader_stops_at_cutoff(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.jsonl"
+        _write_transcript(path, list(range(900, 0, -10)))
+
+        with patch.object(status_cli, "TAIL_CHUNK_SIZE", 256):
+            records = list(status_cli._iter_tail_records(str(path), time.time() - 3600))
+
+        assert len(records) == 5
+        assert all(key.startswith("m") for key, _ in records)
+
+
+@pytest.mark.subprocess
+def test_status_fast_path_avoids_heavy_imports(status_path: Path) -> None:
+    """The status fast path must not import the monitor's heavy dependencies."""
+    write_status_file(new_status("pro", 19000, "monitor"))
+    code = (
+        "import sys\n"
+        "from claude_monitor.__main__ import main\n"
+        "main(['status'])\n"
+        "heavy = {'rich', 'pydantic', 'pydantic_settings', 'pytz', 'numpy', 'typing'}\n"
+        "print(sorted(heavy & set(sys.modules)))\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
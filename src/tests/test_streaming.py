@@ -0,0 +1,84 @@
+"""Tests for streaming field extraction."""
+
+import json
+
+import pytest
+
+from claude_monitor.data.decoding import ENTRY_FIELDS
+from claude_monitor.data.streaming import extract_fields
+
+SCHEMA = {"type": None, "usage": None, "message": {"id": None, "usage": None}}
+
+
+@pytest.mark.parametrize("encode", [False, True], ids=["str", "bytes"])
+class TestExtractFields:
+    """Test extraction from str and bytes input."""
+
+    def _extract(self, value: object, encode: bool) -> dict:
+        text = json.dumps(value)
+        return extract_fields(text.encode() if encode else text, SCHEMA)
+
+    def test_selected_fields_are_decoded(self, encode: bool) -> None:
+        entry = {
+            "type": "assistant",
+            "message": {
+                "id": "msg_1",
+                "content": [{"type": "tool_result", "content": "x" * 10000}],
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            },
+            "toolUseResult": {"stdout": "y" * 10000},
+        }
+
+        assert self._extract(entry, encode) == {
+            "type": "assistant",
+            "message": {
+                "id": "msg_1",
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            },
+        }
+
+    def test_skipped_values_may_contain_json_syntax(self, encode: bool) -> None:
+        entry = {
+            "content": ['a "quoted" } ] { [ string\\', {"nested": [1, {"k": "}"}]}],
+            "flag": True,
+            "count": -1.5e3,
+            "empty": None,
+            "type": "user",
+        }
+        assert self._extract(entry, encode) == {"type": "user"}
+
+    def test_non_object_nested_value_is_dropped(self, encode: bool) -> None:
+        assert self._extract({"message": "plain text", "type": "user"}, encode) == {
+            "type": "user"
+        }
+
+    def test_escaped_keys_are_decoded(self, encode: bool) -> None:
+        text = '{"ty\\u0070e": "user"}'
+        data = text.encode() if encode else text
+        assert extract_fields(data, SCHEMA) == {"type": "user"}
+
+    @pytest.mark.parametrize(
+        "text",
+        ['{"type": ', '{"type" "user"}', '{"type": "user"}}', '{"type": "user', "[1]"],
+    )
+    def test_malformed_input_raises_value_error(self, encode: bool, text: str) -> None:
+        with pytest.raises(ValueError):
+            extract_fields(text.encode() if encode else text, SCHEMA)
+
+
+def test_entry_fields_cover_usage_mapping() -> None:
+    entry = {
+        "type": "assistant",
+        "timestamp": "2024-01-01T12:00:00Z",
+        "message": {
+            "id": "msg_1",
+            "model": "claude-3-5-sonnet",
+            "usage": {"input_tokens": 10},
+            "content": "z" * 1000,
+        },
+        "requestId": "req_1",
+        "costUSD": 0.5,
+    }
+    expected = json.loads(json.dumps(entry))
+    del expected["message"]["content"]
+    assert extract_fields(json.dumps(entry), ENTRY_FIELDS) == expected
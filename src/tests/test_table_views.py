@@ -1,12 +1,20 @@
 """Tests for table views module."""
 
+import io
 from typing import Any, Dict, List
+from unittest.mock import patch
 
 import pytest
+from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from claude_monitor.ui.table_views import TableViewsController
+from claude_monitor.terminal.manager import read_key
+from claude_monitor.ui.table_views import (
+    TABLE_CHROME_LINES,
+    TableViewsController,
+    VirtualTableView,
+)
 
 
 class TestTableViewsController:
@@ -479,3 +487,148 @@ class TestTableViewsController:
         # Monthly table with empty data
         monthly_table = controller.create_monthly_table([], empty_totals, "UTC")
         assert monthly_table.row_count == 2  # Separator + totals
+
+
+def _daily_rows(count: int) -> List[Dict[str, Any]]:
+    """Build aggregated daily rows for consecutive days."""
+    return [
+        {
+            "date": f"2024-{1 + day // 28:02d}-{1 + day % 28:02d}",
+            "input_tokens": 100 + day,
+            "output_tokens": 50,
+            "cache_creation_tokens": 0,
+            "cache_read_tokens": 0,
+            "total_cost": 0.01,
+            "models_used": ["claude-3-opus"],
+            "entries_count": 1,
+        }
+        for day in range(count)
+    ]
+
+
+class TestVirtualTableView:
+    """Test cases for paged rendering of long tables."""
+
+    @pytest.fixture
+    def view(self) -> VirtualTableView:
+        return VirtualTableView(TableViewsController(), _daily_rows(300), "daily")
+
+    def test_starts_at_newest_rows(self, view: VirtualTableView) -> None:
+        start, end = view.window(height=29)
+
+        assert end == 300
+        # Each single-model row takes two lines including its rule
+        assert end - start == (29 - TABLE_CHROME_LINES) // 2
+
+    def test_only_visible_rows_are_laid_out(self, view: VirtualTableView) -> None:
+        page = view.render(height=29)
+        table = page.renderables[0]
+
+        # Visible rows plus the separator and totals rows
+        assert table.row_count == 10 + 2
+
+    def test_page_fits_terminal_height(self, view: VirtualTableView) -> None:
+        console = Console(width=140, height=29, file=io.StringIO())
+        with console.capture() as capture:
+            console.print(view.render(height=29))
+
+        assert len(capture.get().splitlines()) <= 29
+
+    def test_navigation(self, view: VirtualTableView) -> None:
+        assert view.handle_key("home", 29)
+        assert view.window(29) == (0, 10)
+
+        view.handle_key("down", 29)
+        assert view.window(29) == (1, 11)
+        view.handle_key("page_down", 29)
+        assert view.window(29) == (11, 21)
+        view.handle_key("page_up", 29)
+        view.handle_key("up", 29)
+        view.handle_key("up", 29)
+        assert view.window(29) == (0, 10)
+
+        view.handle_key("end", 29)
+        assert view.window(29) == (290, 300)
+        view.handle_key("down", 29)
+        assert view.window(29) == (290, 300)
+        assert view.handle_key("q", 29) is False
+
+    @staticmethod
+    def _read_key(data: bytes) -> Any:
+        """Run read_key() against a terminal that delivers ``data``."""
+        manager = "claude_monitor.terminal.manager"
+        with (
+            patch(f"{manager}.supports_key_input", return_value=True),
+            patch(f"{manager}.sys.stdin") as stdin,
+            patch(f"{manager}.select.select", return_value=([0], [], [])),
+            patch(f"{manager}.os.read", return_value=data),
+        ):
+            stdin.fileno.return_value = 0
+            return read_key(timeout=0)
+
+    @pytest.mark.parametrize("data", [b"\x1b[D", b"\x1b[C", b"\x1b[15~"])
+    def test_unmapped_escape_sequence_keeps_view_open(
+        self, view: VirtualTableView, data: bytes
+    ) -> None:
+        assert self._read_key(data) is None
+
+        # The paged loop only hands non-None keys to the view
+        window = view.window(29)
+        assert view.handle_key("\x1b[D", 29)
+        assert view.window(29) == window
+
+    def test_bare_escape_quits(self, view: VirtualTableView) -> None:
+        key = self._read_key(b"\x1b")
+
+        assert key == "\x1b"
+        assert view.handle_key(key, 29) is False
+
+    def test_totals_cover_all_rows(self, view: VirtualTableView) -> None:
+        assert view.totals["input_tokens"] == sum(100 + day for day in range(300))
+        assert view.totals["entries_count"] == 300
+
+    def test_new_rows_are_followed_only_at_the_end(
+        self, view: VirtualTableView
+    ) -> None:
+        view.set_data(_daily_rows(301))
+        assert view.window(29)[1] == 301
+
+        view.home()
+        view.set_data(_daily_rows(302))
+        assert view.window(29) == (0, 10)
+
+    def test_wrapped_model_names_take_more_lines(self) -> None:
+        controller = TableViewsController()
+        row = _daily_rows(1)[0]
+        assert controller.row_height(row) == 2
+
+        row["models_used"] = ["claude-3-5-sonnet-20241022", "claude-3-opus"]
+        # "• claude-3-5-sonnet-20241022" wraps in the Models column
+        assert controller.row_height(row) == 4
+
+    def test_changed_tail_is_measured_and_summed_again(
+        self, view: VirtualTableView
+    ) -> None:
+        rows = list(view.data)
+        rows[-1] = {**rows[-1], "input_tokens": 1000}
+        rows.append({**rows[-1], "date": "2099-01-01", "input_tokens": 1})
+        expected = view.totals["input_tokens"] - (100 + 299) + 1000 + 1
+
+        with patch.object(
+            view.controller, "row_height", wraps=view.controller.row_height
+        ) as row_height:
+            view.set_data(rows, [rows[-2]["date"], rows[-1]["date"]])
+
+        assert row_height.call_count == 2
+        assert view.totals["input_tokens"] == expected
+        assert view.totals["entries_count"] == 301
+        assert view.window(29)[1] == 301
+
+    def test_rows_that_are_not_the_same_objects_count_as_changed(
+        self, view: VirtualTableView
+    ) -> None:
+        rows = view.data[:-1] + [{**view.data[-1], "input_tokens": 0}]
+
+        view.set_data(rows)
+
+        assert view.totals["input_tokens"] == sum(100 + day for day in range(299))
@@ -0,0 +1,194 @@
+"""Tests for terminal background detection and caching."""
+
+import json
+import os
+import threading
+from io import StringIO
+from pathlib import Path
+from typing import Callable
+from unittest.mock import Mock, patch
+
+import pytest
+from rich.console import Console
+
+from claude_monitor.terminal.themes import (
+    OSC_BACKGROUND_QUERY,
+    BackgroundCache,
+    BackgroundDetector,
+    BackgroundType,
+    ThemeManager,
+)
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path) -> Path:
+    """Point the default background cache at a temporary file."""
+    path = tmp_path / "terminal_background.json"
+    original_init = BackgroundCache.__init__
+
+    def _init(self: BackgroundCache, cache_file: Path = path, **kwargs: float) -> None:
+        original_init(self, cache_file, **kwargs)
+
+    with patch.object(BackgroundCache, "__init__", _init):
+        yield path
+
+
+@pytest.fixture
+def plain_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Remove environment hints so detection falls through to the cache."""
+    for name in ("COLORFGBG", "WT_SESSION", "TERM_PROGRAM"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("TERM", "xterm-256color")
+
+
+class TestBackgroundCache:
+    """Test per-terminal background caching."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = BackgroundCache(tmp_path / "bg.json")
+        assert cache.get("term-a") == BackgroundType.UNKNOWN
+
+        cache.set(BackgroundType.LIGHT, "term-a")
+
+        assert cache.get("term-a") == BackgroundType.LIGHT
+        assert cache.get("term-b") == BackgroundType.UNKNOWN
+
+    def test_expired_entry_is_ignored(self, tmp_path: Path) -> None:
+        cache = BackgroundCache(tmp_path / "bg.json", ttl_seconds=-1)
+        cache.set(BackgroundType.LIGHT, "term-a")
+        assert cache.get("term-a") == BackgroundType.UNKNOWN
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "bg.json"
+        path.write_text("not json")
+        assert BackgroundCache(path).get("term-a") == BackgroundType.UNKNOWN
+
+    def test_entries_are_bounded(self, tmp_path: Path) -> None:
+        path = tmp_path / "bg.json"
+        cache = BackgroundCache(path)
+        for i in range(BackgroundCache.MAX_ENTRIES + 5):
+            cache.set(BackgroundType.DARK, f"term-{i}")
+        assert len(json.loads(path.read_text())) == BackgroundCache.MAX_ENTRIES
+
+    def test_key_includes_terminal_identity(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TERM", "xterm-kitty")
+        monkeypatch.setenv("COLORFGBG", "15;0")
+        monkeypatch.setenv("TERM_PROGRAM", "kitty")
+        assert BackgroundCache.terminal_key() == "xterm-kitty|15;0|kitty"
+
+
+class TestDetectBackground:
+    """Test detection order and query avoidance."""
+
+    def test_cached_result_skips_query(self, cache_file: Path, plain_env: None) -> None:
+        BackgroundCache().set(BackgroundType.LIGHT)
+
+        with patch.object(BackgroundDetector, "_query_background_color") as query:
+            assert BackgroundDetector.detect_background() == BackgroundType.LIGHT
+
+        query.assert_not_called()
+
+    def test_no_query_when_not_allowed(self, cache_file: Path, plain_env: None) -> None:
+        with patch.object(BackgroundDetector, "_query_background_color") as query:
+            result = BackgroundDetector.detect_background(allow_query=False)
+
+        assert result == BackgroundType.UNKNOWN
+        query.assert_not_called()
+
+    def test_query_result_is_cached(self, cache_file: Path, plain_env: None) -> None:
+        with patch.object(
+            BackgroundDetector,
+            "_query_background_color",
+            return_value=BackgroundType.LIGHT,
+        ):
+            assert BackgroundDetector.detect_background() == BackgroundType.LIGHT
+
+        assert BackgroundCache().get() == BackgroundType.LIGHT
+
+    def test_environment_hint_wins(
+        self, cache_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("COLORFGBG", "0;15")
+        BackgroundCache().set(BackgroundType.DARK)
+        assert BackgroundDetector.detect_background() == BackgroundType.LIGHT
+
+    def test_query_without_tty_is_unknown(self) -> None:
+        with patch("sys.stdin") as stdin:
+            stdin.isatty.return_value = False
+            result = BackgroundDetector._query_background_color()
+        assert result == BackgroundType.UNKNOWN
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs a pty")
+    def test_unanswered_query_is_written_to_console_and_flushed(self) -> None:
+        import termios
+
+        master, slave = os.openpty()
+        stdin = Mock()
+        stdin.isatty.return_value = True
+        stdin.fileno.return_value = slave
+        console = Console(file=StringIO())
+        try:
+            with (
+                patch("sys.stdin", stdin),
+                patch("sys.stdout") as stdout,
+                patch("termios.tcflush") as tcflush,
+            ):
+                stdout.isatty.return_value = True
+                os.write(master, b"\033]11;rgb:ff")
+                result = BackgroundDetector._query_background_color(console)
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        assert result == BackgroundType.UNKNOWN
+        assert console.file.getvalue() == OSC_BACKGROUND_QUERY
+        stdout.write.assert_not_called()
+        tcflush.assert_called_once_with(slave, termios.TCIFLUSH)
+
+
+class TestAsyncRefinement:
+    """Test provisional auto themes refined by a background query."""
+
+    def _sync_query(
+        self, result: BackgroundType
+    ) -> Callable[[Callable[[BackgroundType], None]], threading.Thread]:
+        def _start(
+            callback: Callable[[BackgroundType], None], console: object = None
+        ) -> threading.Thread:
+            callback(result)
+            return Mock(spec=threading.Thread)
+
+        return _start
+
+    def test_light_result_is_pushed_to_console(
+        self, cache_file: Path, plain_env: None
+    ) -> None:
+        manager = ThemeManager()
+        assert manager.get_theme("auto").name == "dark"
+        generation = manager.get_generation()
+
+        console = Mock()
+        with patch.object(
+            BackgroundDetector,
+            "start_background_query",
+            side_effect=self._sync_query(BackgroundType.LIGHT),
+        ):
+            assert manager.refine_auto_theme(console) is not None
+
+        console.push_theme.assert_called_once_with(manager.themes["light"].rich_theme)
+        assert manager.get_generation() > generation
+        assert manager.get_theme().name == "light"
+
+    def test_resolved_theme_needs_no_query(
+        self, cache_file: Path, plain_env: None
+    ) -> None:
+        BackgroundCache().set(BackgroundType.DARK)
+        manager = ThemeManager()
+        manager.get_theme("auto")
+
+        with patch.object(BackgroundDetector, "start_background_query") as start:
+            assert manager.refine_auto_theme(Mock()) is None
+
+        start.assert_not_called()
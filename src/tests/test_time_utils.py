@@ -3,13 +3,15 @@
 import locale
 import platform
 from datetime import datetime
+from pathlib import Path
 from typing import List
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import pytz
 
 from claude_monitor.utils.time_utils import (
+    SystemTimeCache,
     SystemTimeDetector,
     TimeFormatDetector,
     TimezoneHandler,
@@ -103,8 +105,8 @@ class TestTimeFormatDetector:
         self, mock_langinfo: Mock, mock_setlocale: Mock
     ) -> None:
         """Test locale detection for 12h format with AM/PM."""
-        mock_langinfo.side_effect = (
-            lambda x: "%I:%M:%S %p" if x == locale.T_FMT_AMPM else ""
+        mock_langinfo.side_effect = lambda x: (
+            "%I:%M:%S %p" if x == locale.T_FMT_AMPM else ""
         )
 
         result = TimeFormatDetector.detect_from_locale()
@@ -116,8 +118,8 @@ class TestTimeFormatDetector:
         self, mock_langinfo: Mock, mock_setlocale: Mock
     ) -> None:
         """Test locale detection for 12h format with %p in D_T_FMT."""
-        mock_langinfo.side_effect = (
-            lambda x: "%m/%d/%Y %I:%M:%S %p" if x == locale.D_T_FMT else ""
+        mock_langinfo.side_effect = lambda x: (
+            "%m/%d/%Y %I:%M:%S %p" if x == locale.D_T_FMT else ""
         )
 
         result = TimeFormatDetector.detect_from_locale()
@@ -143,79 +145,93 @@ class TestTimeFormatDetector:
         assert result is False
 
     @patch("platform.system")
-    @patch("subprocess.run")
+    @patch("claude_monitor.utils.time_utils._read_macos_global_preference")
     def test_detect_from_system_macos_12h(
-        self, mock_run: Mock, mock_system: Mock
+        self, mock_preference: Mock, mock_system: Mock
     ) -> None:
         """Test macOS system detection for 12h format."""
         mock_system.return_value = "Darwin"
-
-        # Mock successful defaults command returning "1"
-        mock_defaults_result = Mock()
-        mock_defaults_result.returncode = 0
-        mock_defaults_result.stdout = "1"
-
-        # Mock date command with AM/PM
-        mock_date_result = Mock()
-        mock_date_result.stdout = "02:30:45 PM"
-
-        mock_run.side_effect = [mock_defaults_result, mock_date_result]
+        mock_preference.return_value = True
 
         result = TimeFormatDetector.detect_from_system()
         assert result == "12h"
+        mock_preference.assert_called_once_with("AppleICUForce12HourTime")
 
     @patch("platform.system")
-    @patch("subprocess.run")
+    @patch("claude_monitor.utils.time_utils._read_macos_global_preference")
+    @patch("claude_monitor.utils.time_utils._locale_time_has_ampm")
     @patch.object(TimeFormatDetector, "detect_from_locale")
     def test_detect_from_system_macos_24h(
-        self, mock_locale: Mock, mock_run: Mock, mock_system: Mock
+        self,
+        mock_locale: Mock,
+        mock_ampm: Mock,
+        mock_preference: Mock,
+        mock_system: Mock,
     ) -> None:
         """Test macOS system detection for 24h format."""
         mock_system.return_value = "Darwin"
         mock_locale.return_value = False  # 24h format
+        mock_ampm.return_value = False
+        mock_preference.return_value = None  # Preference not set
 
-        # Mock defaults command returning non-1 value
-        mock_defaults_result = Mock()
-        mock_defaults_result.returncode = 0
-        mock_defaults_result.stdout = "0"
+        result = TimeFormatDetector.detect_from_system()
+        assert result == "24h"
 
-        # Mock date command without AM/PM
-        mock_date_result = Mock()
-        mock_date_result.stdout = "14:30:45"
+    def test_locale_time_check_restores_lc_time(self) -> None:
+        """Test the AM/PM check leaves the process LC_TIME unchanged."""
+        from claude_monitor.utils.time_utils import _locale_time_has_ampm
 
-        mock_run.side_effect = [mock_defaults_result, mock_date_result]
+        previous = locale.setlocale(locale.LC_TIME)
+        with patch("locale.setlocale", wraps=locale.setlocale) as setlocale:
+            _locale_time_has_ampm()
 
-        result = TimeFormatDetector.detect_from_system()
-        assert result == "24h"
+        assert setlocale.call_args_list[-1] == ((locale.LC_TIME, previous),)
+        assert locale.setlocale(locale.LC_TIME) == previous
+
+    @patch("platform.system")
+    @patch("claude_monitor.utils.time_utils._read_macos_global_preference")
+    @patch("time.strftime")
+    def test_detect_from_system_macos_locale_ampm(
+        self, mock_strftime: Mock, mock_preference: Mock, mock_system: Mock
+    ) -> None:
+        """Test macOS falls back to the locale's %r time like `date +%r`."""
+        mock_system.return_value = "Darwin"
+        mock_preference.return_value = None
+        mock_strftime.return_value = "03:04:05 PM"
+
+        assert TimeFormatDetector.detect_from_system() == "12h"
+        mock_strftime.assert_called_once_with("%r")
 
     @patch("platform.system")
     @patch("subprocess.run")
     def test_detect_from_system_linux_12h(
-        self, mock_run: Mock, mock_system: Mock
+        self,
+        mock_run: Mock,
+        mock_system: Mock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Test Linux system detection for 12h format."""
+        """Test Linux system detection for 12h format from the environment."""
         mock_system.return_value = "Linux"
-
-        mock_result = Mock()
-        mock_result.stdout = 'LC_TIME="en_US.UTF-8"'
-        mock_run.return_value = mock_result
+        monkeypatch.delenv("LC_ALL", raising=False)
+        monkeypatch.setenv("LC_TIME", "en_US.UTF-8")
 
         result = TimeFormatDetector.detect_from_system()
         assert result == "12h"
+        mock_run.assert_not_called()
 
     @patch("platform.system")
-    @patch("subprocess.run")
     @patch.object(TimeFormatDetector, "detect_from_locale")
     def test_detect_from_system_linux_24h(
-        self, mock_locale: Mock, mock_run: Mock, mock_system: Mock
+        self,
+        mock_locale: Mock,
+        mock_system: Mock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test Linux system detection for 24h format."""
         mock_system.return_value = "Linux"
         mock_locale.return_value = False  # 24h format
-
-        mock_result = Mock()
-        mock_result.stdout = 'LC_TIME="de_DE.UTF-8"'
-        mock_run.return_value = mock_result
+        monkeypatch.setenv("LC_ALL", "de_DE.UTF-8")
+        monkeypatch.setenv("LC_TIME", "en_US.UTF-8")  # Overridden by LC_ALL
 
         result = TimeFormatDetector.detect_from_system()
         assert result == "24h"
@@ -341,36 +357,73 @@ class TestSystemTimeDetector:
     @patch("os.environ.get")
     @patch("os.path.exists")
     @patch("platform.system")
-    @patch("subprocess.run")
-    def test_get_timezone_linux_timedatectl(
-        self, mock_run: Mock, mock_system: Mock, mock_exists: Mock, mock_env: Mock
+    @patch("os.readlink")
+    def test_get_timezone_linux_localtime(
+        self, mock_readlink: Mock, mock_system: Mock, mock_exists: Mock, mock_env: Mock
     ) -> None:
-        """Test Linux timezone detection via timedatectl."""
+        """Test Linux timezone detection via the /etc/localtime symlink."""
         mock_env.return_value = None  # No TZ environment variable
         mock_system.return_value = "Linux"
         mock_exists.return_value = False  # No /etc/timezone file
-
-        # Mock successful timedatectl command
-        mock_timedatectl_result = Mock()
-        mock_timedatectl_result.stdout = "Europe/London"
-        mock_timedatectl_result.returncode = 0
-        mock_run.return_value = mock_timedatectl_result
+        mock_readlink.return_value = "/usr/share/zoneinfo/Europe/London"
 
         result = SystemTimeDetector.get_timezone()
         assert result == "Europe/London"
+        mock_readlink.assert_called_once_with("/etc/localtime")
 
-    @patch("platform.system")
+    @patch("os.path.exists", return_value=False)
+    @patch("platform.system", return_value="Linux")
+    @patch("os.readlink", side_effect=OSError("not a symlink"))
     @patch("subprocess.run")
-    def test_get_timezone_windows(self, mock_run: Mock, mock_system: Mock) -> None:
-        """Test Windows timezone detection."""
+    def test_get_timezone_linux_timedatectl(
+        self,
+        mock_run: Mock,
+        mock_readlink: Mock,
+        mock_system: Mock,
+        mock_exists: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a copied /etc/localtime falls back to timedatectl."""
+        monkeypatch.delenv("TZ", raising=False)
+        mock_run.return_value = Mock(stdout="Europe/Paris\n")
+
+        assert SystemTimeDetector.get_timezone() == "Europe/Paris"
+        assert mock_run.call_args[0][0][0] == "timedatectl"
+
+    @patch("platform.system")
+    @patch("os.readlink")
+    def test_get_timezone_macos_localtime(
+        self,
+        mock_readlink: Mock,
+        mock_system: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test macOS timezone detection without spawning readlink."""
+        monkeypatch.delenv("TZ", raising=False)
+        mock_system.return_value = "Darwin"
+        mock_readlink.return_value = "/var/db/timezone/zoneinfo/Asia/Tokyo"
+
+        assert SystemTimeDetector.get_timezone() == "Asia/Tokyo"
+
+    def test_get_timezone_tz_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test TZ values pointing at zoneinfo files are reduced to zone names."""
+        monkeypatch.setenv("TZ", ":/usr/share/zoneinfo/America/Chicago")
+        assert SystemTimeDetector.get_timezone() == "America/Chicago"
+
+    @patch("platform.system")
+    def test_get_timezone_windows(
+        self, mock_system: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test Windows timezone detection from the registry."""
+        monkeypatch.delenv("TZ", raising=False)
         mock_system.return_value = "Windows"
 
-        mock_result = Mock()
-        mock_result.stdout = "Eastern Standard Time"
-        mock_run.return_value = mock_result
+        mock_winreg = MagicMock()
+        mock_winreg.QueryValueEx.return_value = ("Eastern Standard Time", 1)
+        with patch.dict("sys.modules", {"winreg": mock_winreg}):
+            result = SystemTimeDetector.get_timezone()
 
         # Should return the Windows timezone name
-        result = SystemTimeDetector.get_timezone()
         assert result == "Eastern Standard Time"
 
     @patch("platform.system")
@@ -388,6 +441,71 @@ class TestSystemTimeDetector:
             assert result == "12h"
 
 
+class TestSystemTimeCache:
+    """Test cases for persisted system time detection."""
+
+    def test_detection_runs_once_per_process(self, tmp_path: Path) -> None:
+        """Test repeated lookups are served from memory."""
+        cache = SystemTimeCache(tmp_path / "system_time.json")
+        detect = Mock(return_value="Europe/Berlin")
+
+        assert cache.resolve("timezone", detect) == "Europe/Berlin"
+        assert cache.resolve("timezone", detect) == "Europe/Berlin"
+        detect.assert_called_once()
+
+    def test_result_persists_across_launches(self, tmp_path: Path) -> None:
+        """Test a new process reuses the stored result."""
+        path = tmp_path / "system_time.json"
+        SystemTimeCache(path).resolve("time_format", lambda: "24h")
+
+        detect = Mock(return_value="12h")
+        assert SystemTimeCache(path).resolve("time_format", detect) == "24h"
+        detect.assert_not_called()
+
+    def test_environment_change_invalidates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test changing TZ or locale variables triggers re-detection."""
+        path = tmp_path / "system_time.json"
+        monkeypatch.setenv("TZ", "Europe/Berlin")
+        cache = SystemTimeCache(path)
+        cache.resolve("timezone", lambda: "Europe/Berlin")
+
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+        assert cache.resolve("timezone", lambda: "Asia/Tokyo") == "Asia/Tokyo"
+
+        monkeypatch.setenv("LANG", "de_DE.UTF-8")
+        detect = Mock(return_value="Asia/Tokyo")
+        SystemTimeCache(path).resolve("timezone", detect)
+        detect.assert_called_once()
+
+    def test_localtime_change_invalidates(self, tmp_path: Path) -> None:
+        """Test a changed /etc/localtime target triggers re-detection."""
+        path = tmp_path / "system_time.json"
+        with patch(
+            "claude_monitor.utils.time_utils._timezone_from_localtime",
+            return_value="Europe/Berlin",
+        ):
+            SystemTimeCache(path).resolve("timezone", lambda: "Europe/Berlin")
+
+        detect = Mock(return_value="Asia/Tokyo")
+        with patch(
+            "claude_monitor.utils.time_utils._timezone_from_localtime",
+            return_value="Asia/Tokyo",
+        ):
+            assert SystemTimeCache(path).resolve("timezone", detect) == "Asia/Tokyo"
+        detect.assert_called_once()
+
+    def test_format_display_time_does_not_redetect(self) -> None:
+        """Test auto-detected formatting runs system detection only once."""
+        with patch.object(
+            TimeFormatDetector, "detect_from_system", return_value="24h"
+        ) as mock_detect:
+            for _ in range(3):
+                format_display_time(datetime(2024, 1, 1, 15, 30, 45))
+        mock_detect.assert_called_once()
+
+
 class TestTimezoneHandler:
     """Test cases for TimezoneHandler class."""
 